@@ -2,27 +2,88 @@ import sqlite3
 
 DB_FILE = "uni_arena.db"
 
-def add_columns():
-    conn = sqlite3.connect(DB_FILE)
-    cursor = conn.cursor()
-    
-    columns = [
+# Columns added to existing tables after the initial schema, per table
+COLUMNS = {
+    "sports": [
         ("rules", "TEXT"),
         ("match_config", "TEXT"),
         ("mandatory_rules", "TEXT")
+    ],
+    "score_updates": [
+        ("seq", "INTEGER NOT NULL DEFAULT 0")
+    ],
+    "scores": [
+        ("last_seq", "INTEGER NOT NULL DEFAULT 0")
+    ],
+    "schedules": [
+        ("rounds", "INTEGER"),
+        ("generation_config", "TEXT")
+    ],
+    "matches": [
+        ("round_number", "INTEGER"),
+        ("group_number", "INTEGER"),
+        ("expected_end_time", "DATETIME"),
+        ("bracket_position", "INTEGER"),
+        ("next_match_id", "INTEGER REFERENCES matches(id)"),
+        ("next_match_slot", "TEXT"),
+        ("reminder_level", "INTEGER NOT NULL DEFAULT 0"),
+        ("result_home_score", "INTEGER"),
+        ("result_away_score", "INTEGER")
     ]
-    
-    for col_name, col_type in columns:
+}
+
+# Backfills and indexes that depend on the columns above
+POST_MIGRATION = [
+    # Number existing score history per match in insertion order
+    """UPDATE score_updates SET seq = (
+        SELECT COUNT(*) FROM score_updates AS earlier
+        WHERE earlier.match_id = score_updates.match_id AND earlier.id <= score_updates.id
+    ) WHERE seq = 0""",
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_score_updates_match_seq ON score_updates (match_id, seq)",
+    # Continue each match's seq counter from its existing history
+    """UPDATE scores SET last_seq = (
+        SELECT COALESCE(MAX(seq), 0) FROM score_updates WHERE score_updates.match_id = scores.match_id
+    ) WHERE last_seq = 0""",
+    # Completed matches already have their score counted
+    """UPDATE matches SET
+        result_home_score = (SELECT home_score FROM scores WHERE scores.match_id = matches.id),
+        result_away_score = (SELECT away_score FROM scores WHERE scores.match_id = matches.id)
+    WHERE status = 'COMPLETED' AND result_home_score IS NULL""",
+    "CREATE INDEX IF NOT EXISTS ix_matches_home_team_time ON matches (home_team_id, scheduled_time)",
+    "CREATE INDEX IF NOT EXISTS ix_matches_away_team_time ON matches (away_team_id, scheduled_time)",
+    "CREATE INDEX IF NOT EXISTS ix_matches_venue_time ON matches (venue_id, scheduled_time)",
+    "CREATE INDEX IF NOT EXISTS ix_matches_schedule_time ON matches (schedule_id, scheduled_time)",
+    "CREATE INDEX IF NOT EXISTS ix_matches_schedule_bracket ON matches (schedule_id, round_number, bracket_position)",
+    "CREATE INDEX IF NOT EXISTS ix_matches_status_time ON matches (status, scheduled_time)"
+] + [
+    # Delta sync timestamp indexes
+    f"CREATE INDEX IF NOT EXISTS ix_{table}_{column} ON {table} ({column})"
+    for table in ("matches", "scores", "teams", "players", "tournaments", "notifications")
+    for column in ("created_at", "updated_at")
+]
+
+def add_columns():
+    conn = sqlite3.connect(DB_FILE)
+    cursor = conn.cursor()
+
+    for table, columns in COLUMNS.items():
+        for col_name, col_type in columns:
+            try:
+                print(f"Adding column {table}.{col_name}...")
+                cursor.execute(f"ALTER TABLE {table} ADD COLUMN {col_name} {col_type}")
+                print(f"Successfully added {col_name}")
+            except sqlite3.OperationalError as e:
+                if "duplicate column name" in str(e):
+                    print(f"Column {col_name} already exists")
+                else:
+                    print(f"Error adding {col_name}: {e}")
+
+    for statement in POST_MIGRATION:
         try:
-            print(f"Adding column {col_name}...")
-            cursor.execute(f"ALTER TABLE sports ADD COLUMN {col_name} {col_type}")
-            print(f"Successfully added {col_name}")
+            cursor.execute(statement)
         except sqlite3.OperationalError as e:
-            if "duplicate column name" in str(e):
-                print(f"Column {col_name} already exists")
-            else:
-                print(f"Error adding {col_name}: {e}")
-                
+            print(f"Error running migration step: {e}")
+
     conn.commit()
     conn.close()
     print("Schema update complete.")
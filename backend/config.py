@@ -1,6 +1,7 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 from pathlib import Path
+from datetime import time
 
 
 class Settings(BaseSettings):
@@ -21,6 +22,92 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Uni Arena"
     API_V1_PREFIX: str = "/api/v1"
     
+    # Caching Configuration
+    DASHBOARD_CACHE_SECONDS: int = 5  # Per-user dashboard summaries
+    LIVE_SCORE_CACHE_SECONDS: float = 1.0  # Public score and score history reads
+    
+    # Compression Configuration
+    COMPRESSION_MINIMUM_SIZE: int = 500  # Bytes; smaller bodies are sent as-is
+    COMPRESSION_CONTENT_TYPES: list[str] = [
+        "application/json",
+        "application/x-ndjson",
+        "text/csv",
+        "text/calendar",
+        "text/plain",
+        "text/html",
+    ]
+    GZIP_LEVEL: int = 6
+    BROTLI_QUALITY: int = 5  # Only used when the brotli package is installed
+    
+    # Export Configuration
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor round trip
+    
+    # Calendar Feed Configuration
+    CALENDAR_PAST_DAYS: int = 30  # Finished matches kept in .ics feeds
+    CALENDAR_EVENT_MINUTES: int = 120  # Event length when a match has no actual end time
+    CALENDAR_CACHE_SECONDS: int = 3600
+    
+    # Delta Sync Configuration
+    SYNC_OVERLAP_SECONDS: int = 2  # Re-read window behind each token (timestamps have 1s resolution on SQLite)
+    
+    # Batch Request Configuration
+    BATCH_MAX_REQUESTS: int = 20  # Sub-requests accepted by POST /batch
+    
+    # Fixture Scheduling Configuration
+    SCHEDULE_DAY_START: time = time(9, 0)  # Daily window for generated matches
+    SCHEDULE_DAY_END: time = time(21, 0)
+    SCHEDULE_MIN_REST_MINUTES: int = 120  # Between two matches of the same team
+    SCHEDULE_CHANGEOVER_MINUTES: int = 15  # Venue turnaround between matches
+    SCHEDULE_DEFAULT_MATCH_MINUTES: int = 90  # When match_config has no timed periods
+    SCHEDULE_PERIOD_BREAK_MINUTES: int = 10  # Break between timed periods
+    SCHEDULE_MAX_DAYS: int = 366  # Search horizon for a free slot
+    
+    # Background Job Configuration
+    JOB_WORKERS: int = 4  # Threads generating schedules; sports with disjoint venues run in parallel
+    JOB_COMMIT_CHUNK_SIZE: int = 500  # Matches written per commit by generation jobs
+    JOB_MAX_SCHEDULES: int = 50  # Schedules accepted by one POST /jobs/schedules
+    JOB_RESULT_SECONDS: int = 24 * 3600  # How long finished jobs stay queryable
+    
+    # Schedule Preview Configuration
+    PREVIEW_TTL_SECONDS: int = 1800  # How long a preview can be committed
+    PREVIEW_MAX_ENTRIES: int = 200
+    
+    # Schedule Optimizer Configuration (simulated annealing after generation)
+    OPTIMIZER_MAX_SECONDS: float = 30.0  # Upper bound on a requested optimize_seconds
+    OPTIMIZER_REST_WEIGHT: float = 1.0  # Per gap between a participant's matches: 1 / rest in days
+    OPTIMIZER_EARLY_WEIGHT: float = 1.0  # Per participant: (matches starting before OPTIMIZER_EARLY_BEFORE) squared
+    OPTIMIZER_IDLE_WEIGHT: float = 1.0  # Per venue day: empty slots between its first and last match
+    OPTIMIZER_EARLY_BEFORE: time = time(11, 0)
+    OPTIMIZER_TRAJECTORY_POINTS: int = 50  # Objective samples reported over the budget
+    
+    # Swiss System Configuration
+    SWISS_MAX_BACKTRACKS: int = 100000  # Pairings tried before accepting rematches
+    
+    # Standings Configuration
+    STANDINGS_WIN_POINTS: int = 3
+    STANDINGS_DRAW_POINTS: int = 1
+    STANDINGS_LOSS_POINTS: int = 0
+    STANDINGS_BYE_POINTS: Optional[int] = None  # A Swiss bye counts as a won game; None scores it like a win
+    STANDINGS_TIE_BREAKERS: List[str] = ["goal_difference", "goals_for"]  # Also "wins", "head_to_head"
+    STANDINGS_CACHE_SECONDS: int = 300  # Rendered tables; also dropped when a result changes them
+    GROUP_DEFAULT_SIZE: int = 4  # Participants per group when group_count is not given
+    
+    # Rescheduling Configuration (postponements, venue blackouts)
+    RESCHEDULE_STEP_MINUTES: int = 15  # Start times tried within the daily window
+    RESCHEDULE_HORIZON_DAYS: int = 28  # How far past the earliest allowed start a move may go
+    
+    # Player Conflict Index Configuration (cross-sport overlaps within a tournament)
+    CONFLICT_INDEX_TTL_SECONDS: int = 600  # Also dropped on every commit that changes matches or players
+    
+    # Match Lifecycle Configuration (background auto-live, auto-close and reminders)
+    LIFECYCLE_ENABLED: bool = True
+    LIFECYCLE_LIVE_GRACE_MINUTES: int = 5  # A scheduled match goes LIVE this long after kick-off
+    LIFECYCLE_CLOSE_GRACE_MINUTES: int = 30  # A live match is completed this long after its expected end
+    LIFECYCLE_LOOKBACK_HOURS: int = 24  # Scheduled matches older than this are left alone
+    LIFECYCLE_REFRESH_SECONDS: int = 300  # Deadline heap refilled from the database at least this often
+    LIFECYCLE_MIN_RELOAD_SECONDS: int = 5  # Minimum gap between refills triggered by match changes
+    MATCH_REMINDER_LEAD_MINUTES: List[int] = [1440, 60]  # Reminders sent this long before kick-off
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,6 +1,7 @@
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from starlette.requests import Request
 from config import settings
 
 # Create database engine
@@ -25,7 +26,12 @@ Base = declarative_base()
 
 
 # Dependency to get database session
-def get_db():
+def get_db(request: Request = None):
+    # Sub-requests of POST /batch reuse the batch's session (owned and closed by the batch)
+    shared = getattr(request.state, "db", None) if request is not None else None
+    if shared is not None:
+        yield shared
+        return
     db = SessionLocal()
     try:
         yield db
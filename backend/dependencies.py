@@ -1,4 +1,4 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -9,12 +9,21 @@ from security.auth_service import decode_access_token
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login", auto_error=False)
 oauth2_scheme_required = OAuth2PasswordBearer(tokenUrl="api/v1/auth/login")
 
+# Marks request.state.current_user as not resolved yet (None means resolved as anonymous)
+_UNRESOLVED = object()
+
 
 async def get_current_user(
+    request: Request,
     token: Optional[str] = Depends(oauth2_scheme),
     db: Session = Depends(get_db)
 ) -> Optional[User]:
     """Get the current authenticated user (optional - returns None if not authenticated)"""
+    # Resolved once by POST /batch for all of its sub-requests
+    resolved = getattr(request.state, "current_user", _UNRESOLVED)
+    if resolved is not _UNRESOLVED:
+        return resolved
+    
     if not token:
         return None
     
@@ -37,6 +46,7 @@ async def get_current_user(
 
 
 async def get_current_user_required(
+    request: Request,
     token: str = Depends(oauth2_scheme_required),
     db: Session = Depends(get_db)
 ) -> User:
@@ -47,6 +57,13 @@ async def get_current_user_required(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
+    # Resolved once by POST /batch for all of its sub-requests
+    resolved = getattr(request.state, "current_user", _UNRESOLVED)
+    if resolved is not _UNRESOLVED:
+        if resolved is None:
+            raise credentials_exception
+        return resolved
+    
     payload = decode_access_token(token)
     if payload is None:
         raise credentials_exception
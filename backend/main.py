@@ -1,17 +1,33 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from config import settings
 from database import engine, Base
-from routers import auth, admin, organizer, matches, coach, venues, tournaments, notifications, statistics, players, admin_tournaments, institutions
+from services.serialization import FastJSONResponse
+from services.match_lifecycle import match_lifecycle
+from middleware.compression import CompressionMiddleware
+from routers import auth, admin, organizer, matches, coach, venues, tournaments, notifications, statistics, players, admin_tournaments, institutions, dashboard, export, calendar, sync, batch, jobs
 
 # Create database tables
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the match lifecycle thread (auto-live, auto-close, reminders) while the app is up"""
+    if settings.LIFECYCLE_ENABLED:
+        match_lifecycle.start()
+    yield
+    match_lifecycle.stop()
+
+
 # Create FastAPI app
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version="1.0.0",
-    description="Uni Arena - Sports Management System for Institutions"
+    description="Uni Arena - Sports Management System for Institutions",
+    default_response_class=FastJSONResponse,
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -23,6 +39,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON/CSV/iCalendar responses for clients on slow venue networks
+app.add_middleware(CompressionMiddleware)
+
 # Include routers
 app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
 app.include_router(admin.router, prefix=settings.API_V1_PREFIX)
@@ -36,6 +55,12 @@ app.include_router(statistics.router, prefix=settings.API_V1_PREFIX)
 app.include_router(players.router, prefix=settings.API_V1_PREFIX)
 app.include_router(admin_tournaments.router, prefix=settings.API_V1_PREFIX)
 app.include_router(institutions.router, prefix=settings.API_V1_PREFIX)
+app.include_router(dashboard.router, prefix=settings.API_V1_PREFIX)
+app.include_router(export.router, prefix=settings.API_V1_PREFIX)
+app.include_router(calendar.router, prefix=settings.API_V1_PREFIX)
+app.include_router(sync.router, prefix=settings.API_V1_PREFIX)
+app.include_router(batch.router, prefix=settings.API_V1_PREFIX)
+app.include_router(jobs.router, prefix=settings.API_V1_PREFIX)
 
 from fastapi.staticfiles import StaticFiles
 import os
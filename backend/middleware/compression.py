@@ -0,0 +1,94 @@
+"""
+ASGI middleware that gzip/Brotli-compresses responses.
+Only allowlisted content types above a size threshold are compressed. Responses that already
+carry a Content-Encoding (e.g. precompressed cached payloads) are passed through untouched,
+and streamed responses are compressed chunk by chunk.
+"""
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from config import settings
+from services.compression import StreamCompressor, compress, is_compressible, negotiate_encoding
+
+
+class CompressionMiddleware:
+    def __init__(self, app: ASGIApp, minimum_size: int = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size)
+        await self.app(scope, receive, responder.send)
+
+
+class _CompressionResponder:
+    """Per-request send wrapper that decides on the first body chunk whether to compress"""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self._send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start_message: Message = None
+        self.decided = False
+        self.compressor: StreamCompressor = None
+
+    def _should_compress(self, headers: MutableHeaders) -> bool:
+        status = self.start_message["status"]
+        if status < 200 or status in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        return is_compressible(headers.get("content-type"))
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.decided:
+            self.decided = True
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            if not self._should_compress(headers) or (not more_body and len(body) < self.minimum_size):
+                await self._send(self.start_message)
+                await self._send(message)
+                return
+
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if not more_body:
+                compressed = compress(body, self.encoding)
+                headers["Content-Length"] = str(len(compressed))
+                await self._send(self.start_message)
+                await self._send({"type": "http.response.body", "body": compressed})
+                return
+
+            # Streaming response: length is unknown up front
+            if "content-length" in headers:
+                del headers["Content-Length"]
+            self.compressor = StreamCompressor(self.encoding)
+            await self._send(self.start_message)
+            await self._send({"type": "http.response.body", "body": self.compressor.compress(body), "more_body": True})
+            return
+
+        if self.compressor is None:
+            await self._send(message)
+            return
+
+        chunk = self.compressor.compress(body) if body else b""
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self._send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -9,11 +9,13 @@ from models.player import Player
 from models.match import Match, MatchStatus
 from models.schedule import Schedule, ScheduleType
 from models.score import Score, ScoreUpdate
-from models.venue import Venue
+from models.venue import Venue, VenueBlackout
 from models.tournament import Tournament, TournamentStatus, TournamentSport
 from models.lineup import Lineup, LineupPlayer
 from models.notification import Notification, NotificationType
 from models.statistics import PlayerStatistics, TeamStatistics
+from models.tombstone import Tombstone
+from models.standing import Standing
 
 __all__ = [
     "BaseModel",
@@ -30,6 +32,7 @@ __all__ = [
     "Score",
     "ScoreUpdate",
     "Venue",
+    "VenueBlackout",
     "Tournament",
     "TournamentStatus",
     "TournamentSport",
@@ -39,4 +42,6 @@ __all__ = [
     "NotificationType",
     "PlayerStatistics",
     "TeamStatistics",
+    "Tombstone",
+    "Standing",
 ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Enum, Text, Boolean
+from sqlalchemy import Column, String, Integer, ForeignKey, DateTime, Enum, Text, Boolean, Index
 from sqlalchemy.orm import relationship
 import enum
 from models.base import BaseModel
@@ -14,14 +14,40 @@ class MatchStatus(str, enum.Enum):
 
 class Match(BaseModel):
     __tablename__ = "matches"
+    __table_args__ = (
+        # Per-team / per-venue / per-schedule fixture ranges (calendar feeds, clash checks)
+        Index("ix_matches_home_team_time", "home_team_id", "scheduled_time"),
+        Index("ix_matches_away_team_time", "away_team_id", "scheduled_time"),
+        Index("ix_matches_venue_time", "venue_id", "scheduled_time"),
+        Index("ix_matches_schedule_time", "schedule_id", "scheduled_time"),
+        # Bracket view: one ordered range read per schedule
+        Index("ix_matches_schedule_bracket", "schedule_id", "round_number", "bracket_position"),
+        # Lifecycle scheduler: upcoming deadlines are a range read per status
+        Index("ix_matches_status_time", "status", "scheduled_time"),
+        # Delta sync reads rows changed since a timestamp
+        Index("ix_matches_created_at", "created_at"),
+        Index("ix_matches_updated_at", "updated_at"),
+    )
     
     match_number = Column(String, nullable=True, index=True)  # e.g., "M001", "QF-1"
     scheduled_time = Column(DateTime(timezone=True), nullable=False)
     actual_start_time = Column(DateTime(timezone=True), nullable=True)
     actual_end_time = Column(DateTime(timezone=True), nullable=True)
+    expected_end_time = Column(DateTime(timezone=True), nullable=True)  # Planned end, used for venue/team bookings
     status = Column(Enum(MatchStatus), default=MatchStatus.SCHEDULED, nullable=False)
     venue_name = Column(String, nullable=True)  # Legacy field, use venue_id instead
     notes = Column(Text, nullable=True)
+    round_number = Column(Integer, nullable=True)  # Round within a generated schedule, starting at 1
+    group_number = Column(Integer, nullable=True)  # Group-stage match of this group (1-based)
+    reminder_level = Column(Integer, default=0, nullable=False)  # Reminders sent (see MATCH_REMINDER_LEAD_MINUTES)
+    # Score counted in standings and statistics, None while no result is counted
+    result_home_score = Column(Integer, nullable=True)
+    result_away_score = Column(Integer, nullable=True)
+    
+    # Knockout brackets: the winner moves into next_match_id on the given side
+    bracket_position = Column(Integer, nullable=True)  # 1-based position within the round
+    next_match_id = Column(Integer, ForeignKey("matches.id"), nullable=True)
+    next_match_slot = Column(String, nullable=True)  # "home" or "away"
     
     # Foreign keys
     sport_id = Column(Integer, ForeignKey("sports.id"), nullable=False)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, Boolean, DateTime, Enum
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, Boolean, DateTime, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 from models.base import BaseModel
@@ -16,6 +16,11 @@ class NotificationType(str, enum.Enum):
 
 class Notification(BaseModel):
     __tablename__ = "notifications"
+    __table_args__ = (
+        # Delta sync reads rows changed since a timestamp
+        Index("ix_notifications_created_at", "created_at"),
+        Index("ix_notifications_updated_at", "updated_at"),
+    )
     
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     title = Column(String, nullable=False)
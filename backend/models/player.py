@@ -1,10 +1,15 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, Date
+from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, Date, Index
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 
 
 class Player(BaseModel):
     __tablename__ = "players"
+    __table_args__ = (
+        # Delta sync reads rows changed since a timestamp
+        Index("ix_players_created_at", "created_at"),
+        Index("ix_players_updated_at", "updated_at"),
+    )
     
     jersey_number = Column(Integer, nullable=True)
     position = Column(String, nullable=True)  # e.g., "Forward", "Goalkeeper", "Singles", "Doubles"
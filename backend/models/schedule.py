@@ -9,6 +9,8 @@ class ScheduleType(str, enum.Enum):
     KNOCKOUT = "knockout"
     LEAGUE = "league"
     CUSTOM = "custom"
+    SWISS = "swiss"
+    GROUP_KNOCKOUT = "group_knockout"  # Seeded groups feeding a knockout bracket
 
 
 class Schedule(BaseModel):
@@ -20,6 +22,8 @@ class Schedule(BaseModel):
     end_date = Column(DateTime(timezone=True), nullable=True)
     is_active = Column(Boolean, default=True)
     description = Column(Text, nullable=True)
+    rounds = Column(Integer, nullable=True)  # Swiss: rounds to play
+    generation_config = Column(Text, nullable=True)  # JSON participants/constraints/qualifier slots for later stages
     
     # Foreign keys
     sport_id = Column(Integer, ForeignKey("sports.id"), nullable=False)
@@ -29,3 +33,4 @@ class Schedule(BaseModel):
     sport = relationship("Sport", back_populates="schedules")
     tournament = relationship("Tournament", back_populates="schedules")
     matches = relationship("Match", back_populates="schedule")
+    standings = relationship("Standing", back_populates="schedule")
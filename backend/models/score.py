@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, String, Text
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, String, Text, Index
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 
@@ -6,12 +6,18 @@ from models.base import BaseModel
 class Score(BaseModel):
     """Current score for a match"""
     __tablename__ = "scores"
+    __table_args__ = (
+        # Delta sync reads rows changed since a timestamp
+        Index("ix_scores_created_at", "created_at"),
+        Index("ix_scores_updated_at", "updated_at"),
+    )
     
     match_id = Column(Integer, ForeignKey("matches.id"), unique=True, nullable=False)
     home_score = Column(Integer, default=0, nullable=False)
     away_score = Column(Integer, default=0, nullable=False)
     period = Column(String, nullable=True)  # e.g., "1st Half", "2nd Set", "Quarter 1"
     additional_info = Column(Text, nullable=True)  # JSON string for sport-specific data
+    last_seq = Column(Integer, default=0, nullable=False)  # Last ScoreUpdate.seq handed out for this match
     
     # Relationships
     match = relationship("Match", back_populates="scores")
@@ -20,8 +26,13 @@ class Score(BaseModel):
 class ScoreUpdate(BaseModel):
     """History of score updates for live tracking"""
     __tablename__ = "score_updates"
+    __table_args__ = (
+        # Incremental history fetches read (match_id, seq > cursor) straight off this index
+        Index("ix_score_updates_match_seq", "match_id", "seq", unique=True),
+    )
     
     match_id = Column(Integer, ForeignKey("matches.id"), nullable=False)
+    seq = Column(Integer, nullable=False)  # Monotonically increasing per match, starting at 1
     home_score = Column(Integer, default=0, nullable=False)
     away_score = Column(Integer, default=0, nullable=False)
     period = Column(String, nullable=True)
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, ForeignKey, Index
+from sqlalchemy.orm import relationship
+from models.base import BaseModel
+
+
+class Standing(BaseModel):
+    """A participant's record in a schedule's table (per group, for group stages)"""
+    __tablename__ = "standings"
+    __table_args__ = (
+        # A group's table is one range read
+        Index("ix_standings_schedule_group", "schedule_id", "group_number"),
+    )
+
+    schedule_id = Column(Integer, ForeignKey("schedules.id"), nullable=False)
+    group_number = Column(Integer, nullable=True)  # 1-based; None for a single table
+    team_id = Column(Integer, ForeignKey("teams.id"), nullable=True)  # Null for individual sports
+    player_id = Column(Integer, ForeignKey("players.id"), nullable=True)  # Individual sports
+    seed = Column(Integer, nullable=False, default=0)  # Seeding order, the last tie-breaker
+
+    played = Column(Integer, default=0, nullable=False)
+    won = Column(Integer, default=0, nullable=False)
+    drawn = Column(Integer, default=0, nullable=False)
+    lost = Column(Integer, default=0, nullable=False)
+    points = Column(Integer, default=0, nullable=False)
+    score_for = Column(Integer, default=0, nullable=False)
+    score_against = Column(Integer, default=0, nullable=False)
+
+    # Relationships
+    schedule = relationship("Schedule", back_populates="standings")
+    team = relationship("Team")
+    player = relationship("Player")
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Boolean
+from sqlalchemy import Column, String, Integer, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 
 
 class Team(BaseModel):
     __tablename__ = "teams"
+    __table_args__ = (
+        # Delta sync reads rows changed since a timestamp
+        Index("ix_teams_created_at", "created_at"),
+        Index("ix_teams_updated_at", "updated_at"),
+    )
     
     name = Column(String, nullable=False, index=True)
     code = Column(String, nullable=True)  # Team code/abbreviation
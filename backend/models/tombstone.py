@@ -0,0 +1,36 @@
+from sqlalchemy import Column, String, Integer, Index, event
+from sqlalchemy.orm import Session
+from models.base import BaseModel
+
+# Tables whose deletes are reported by GET /sync
+TRACKED_TABLES = {"matches", "scores", "teams", "players", "tournaments", "notifications"}
+
+# Tables whose rows are private to one user, and the column naming that user
+OWNER_COLUMNS = {"notifications": "user_id"}
+
+
+class Tombstone(BaseModel):
+    """Record of a deleted row so delta-sync clients can evict it (created_at is the deletion time)"""
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_created_at", "created_at"),
+    )
+
+    entity_type = Column(String, nullable=False)  # Table name of the deleted row
+    entity_id = Column(Integer, nullable=False)
+    owner_id = Column(Integer, nullable=True)  # Only this user may see the tombstone, if set
+
+
+@event.listens_for(Session, "before_flush")
+def record_tombstones(session, flush_context, instances):
+    """Write a tombstone in the same transaction as every ORM delete of a tracked row"""
+    for obj in list(session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table not in TRACKED_TABLES or obj.id is None:
+            continue
+        owner_column = OWNER_COLUMNS.get(table)
+        session.add(Tombstone(
+            entity_type=table,
+            entity_id=obj.id,
+            owner_id=getattr(obj, owner_column) if owner_column else None
+        ))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, Boolean, Enum
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, DateTime, Boolean, Enum, Index
 from sqlalchemy.orm import relationship
 import enum
 from models.base import BaseModel
@@ -13,6 +13,11 @@ class TournamentStatus(str, enum.Enum):
 
 class Tournament(BaseModel):
     __tablename__ = "tournaments"
+    __table_args__ = (
+        # Delta sync reads rows changed since a timestamp
+        Index("ix_tournaments_created_at", "created_at"),
+        Index("ix_tournaments_updated_at", "updated_at"),
+    )
     
     name = Column(String, nullable=False, index=True)
     description = Column(Text, nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey, Boolean
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, Boolean, DateTime, Index
 from sqlalchemy.orm import relationship
 from models.base import BaseModel
 
@@ -18,3 +18,21 @@ class Venue(BaseModel):
     # Relationships
     institution = relationship("Institution", back_populates="venues")
     matches = relationship("Match", back_populates="venue")
+    blackouts = relationship("VenueBlackout", back_populates="venue", cascade="all, delete-orphan")
+
+
+class VenueBlackout(BaseModel):
+    """A window during which a venue is closed (maintenance, weather, exams, ...)"""
+    __tablename__ = "venue_blackouts"
+    __table_args__ = (
+        Index("ix_venue_blackouts_venue_time", "venue_id", "start_time"),
+    )
+
+    venue_id = Column(Integer, ForeignKey("venues.id"), nullable=False)
+    start_time = Column(DateTime(timezone=True), nullable=False)
+    end_time = Column(DateTime(timezone=True), nullable=False)
+    reason = Column(String, nullable=True)
+    created_by = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    # Relationships
+    venue = relationship("Venue", back_populates="blackouts")
@@ -9,9 +9,12 @@ from schemas.auth import UserCreate, UserResponse, UserUpdate
 from dependencies import get_current_user_required as get_current_user
 from security.admin_service import is_admin
 from security.auth_service import get_password_hash, get_user_by_email, get_user_by_username
+from services.serialization import FastJSONResponse, RowSerializer
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
+USER_LIST_SERIALIZER = RowSerializer(UserResponse, User)
+
 
 def require_admin(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to require admin role"""
@@ -207,8 +210,8 @@ async def list_users(
     admin: User = Depends(require_admin)
 ):
     """List all users (Admin only)"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    rows = db.query(*USER_LIST_SERIALIZER.columns).order_by(User.id).offset(skip).limit(limit).all()
+    return FastJSONResponse(USER_LIST_SERIALIZER.serialize_all(rows))
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
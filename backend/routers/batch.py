@@ -0,0 +1,107 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from sqlalchemy.orm import Session
+from typing import Optional, Tuple
+from database import get_db
+from config import settings
+from models.auth import User
+from schemas.batch import BatchItem, BatchRequest, BatchResponse
+from dependencies import get_current_user
+from services.serialization import dumps
+
+router = APIRouter(prefix="/batch", tags=["Batch"])
+
+BATCH_PATH = settings.API_V1_PREFIX + router.prefix
+
+# Outer request headers that must not leak into sub-requests: sub-responses are embedded
+# uncompressed, and conditional headers belong to the batch itself
+DROPPED_HEADERS = {b"accept-encoding", b"content-length", b"content-type", b"if-none-match", b"if-modified-since"}
+
+
+def _item(item_id: Optional[str], status_code: int, body: bytes) -> bytes:
+    """One entry of the responses array; body is already-encoded JSON and is embedded as-is"""
+    return dumps({"id": item_id, "status": status_code})[:-1] + b',"body":' + body + b"}"
+
+
+async def _empty_receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _run(request: Request, scope: dict) -> Tuple[int, str, bytes]:
+    """Dispatch a sub-request straight to the router and collect its response"""
+    result = {"status": status.HTTP_500_INTERNAL_SERVER_ERROR, "content_type": ""}
+    chunks = []
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            result["status"] = message["status"]
+            for name, value in message.get("headers", []):
+                if name.lower() == b"content-type":
+                    result["content_type"] = value.decode("latin-1")
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    try:
+        await request.app.router(scope, _empty_receive, send)
+    except StarletteHTTPException as exc:  # Raised by the router itself, e.g. unknown path
+        return exc.status_code, "application/json", dumps({"detail": exc.detail})
+    except Exception:
+        return status.HTTP_500_INTERNAL_SERVER_ERROR, "application/json", dumps({"detail": "Internal Server Error"})
+    return result["status"], result["content_type"], b"".join(chunks)
+
+
+async def _execute(request: Request, item: BatchItem) -> bytes:
+    if item.method.upper() != "GET":
+        return _item(item.id, status.HTTP_405_METHOD_NOT_ALLOWED, dumps({"detail": "Only GET requests can be batched"}))
+    path, _, query = item.path.partition("?")
+    if not path.startswith("/") or path.startswith("//"):
+        return _item(item.id, status.HTTP_400_BAD_REQUEST, dumps({"detail": "Path must start with /"}))
+    full_path = settings.API_V1_PREFIX + path
+    if full_path.rstrip("/") == BATCH_PATH or full_path.startswith(BATCH_PATH + "/"):
+        return _item(item.id, status.HTTP_400_BAD_REQUEST, dumps({"detail": "Batch requests cannot be nested"}))
+
+    scope = dict(request.scope)
+    for key in ("path_params", "route", "endpoint"):
+        scope.pop(key, None)
+    scope.update({
+        "method": "GET",
+        "path": full_path,
+        "raw_path": full_path.encode(),
+        "query_string": query.encode(),
+        "headers": [(name, value) for name, value in request.scope["headers"] if name not in DROPPED_HEADERS],
+    })
+
+    status_code, content_type, body = await _run(request, scope)
+    if not body:
+        encoded = b"null"
+    elif content_type.startswith("application/json"):
+        encoded = body
+    else:
+        encoded = dumps(body.decode("utf-8", errors="replace"))
+    return _item(item.id, status_code, encoded)
+
+
+@router.post("", response_model=BatchResponse)
+async def batch(
+    batch_request: BatchRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+):
+    """
+    Execute several GET requests in one round trip.
+    Sub-requests run in order against the API routers, sharing this request's database
+    session and authenticated user; each result carries its own status and JSON body.
+    """
+    if len(batch_request.requests) > settings.BATCH_MAX_REQUESTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.BATCH_MAX_REQUESTS} requests can be batched"
+        )
+
+    # Picked up by get_db / get_current_user in every sub-request
+    request.state.db = db
+    request.state.current_user = current_user
+
+    parts = [await _execute(request, item) for item in batch_request.requests]
+    return Response(content=b'{"responses":[' + b",".join(parts) + b"]}", media_type="application/json")
@@ -0,0 +1,175 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session, aliased
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+import hashlib
+from database import get_db
+from config import settings
+from models.match import Match, MatchStatus
+from models.schedule import Schedule
+from models.sport import Sport
+from models.team import Team
+from models.tournament import Tournament
+from models.venue import Venue
+from services.cache import TTLCache
+from services.calendar import build_calendar, match_event
+from services.compression import CompressedPayload
+
+router = APIRouter(prefix="/calendar", tags=["Calendar"])
+
+# Feeds are keyed by a hash of the rows they are rendered from, so any change to a match, team
+# or venue in the feed produces a new key; the TTL only bounds how long superseded feeds linger.
+calendar_cache = TTLCache(ttl_seconds=settings.CALENDAR_CACHE_SECONDS, max_entries=512)
+
+HomeTeam = aliased(Team)
+AwayTeam = aliased(Team)
+
+EVENT_STATUS = {
+    MatchStatus.CANCELLED: "CANCELLED",
+    MatchStatus.POSTPONED: "TENTATIVE",
+}
+
+
+def _window_start() -> datetime:
+    """Feeds cover matches from CALENDAR_PAST_DAYS ago onwards, moving once a day"""
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None)
+    return today - timedelta(days=settings.CALENDAR_PAST_DAYS)
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """
+    Only If-None-Match is honoured: Last-Modified has one-second resolution and cannot see a
+    match leaving the feed or a renamed team, so If-Modified-Since alone never yields a 304
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    return if_none_match.strip() == "*" or etag in [tag.strip() for tag in if_none_match.split(",")]
+
+
+def _feed_rows(db: Session, scope, window_start: datetime) -> list:
+    """Every value a feed is rendered from, in feed order"""
+    return db.query(
+        Match.id,
+        Match.match_number,
+        Match.scheduled_time,
+        func.coalesce(Match.actual_end_time, Match.expected_end_time),
+        Match.status,
+        func.coalesce(Match.updated_at, Match.created_at),
+        Sport.name,
+        HomeTeam.name,
+        AwayTeam.name,
+        func.coalesce(Venue.name, Match.venue_name),
+        Venue.address
+    ).outerjoin(
+        Sport, Sport.id == Match.sport_id
+    ).outerjoin(
+        HomeTeam, HomeTeam.id == Match.home_team_id
+    ).outerjoin(
+        AwayTeam, AwayTeam.id == Match.away_team_id
+    ).outerjoin(
+        Venue, Venue.id == Match.venue_id
+    ).filter(
+        scope, Match.scheduled_time >= window_start
+    ).order_by(Match.scheduled_time, Match.id).all()
+
+
+def _feed_version(scope_key: tuple, name: str, window_start: datetime, rows: list) -> str:
+    """Strong validator: a digest of the feed's scope, name, window and rows"""
+    digest = hashlib.sha1(f"{scope_key}:{name}:{window_start.date()}".encode())
+    for row in rows:
+        digest.update(repr(tuple(row)).encode())
+    return f'"{digest.hexdigest()[:20]}"'
+
+
+def _render_feed(name: str, rows: list) -> bytes:
+    duration = timedelta(minutes=settings.CALENDAR_EVENT_MINUTES)
+    events = []
+    for (match_id, match_number, start, end, match_status, changed_at,
+         sport_name, home_name, away_name, venue_name, venue_address) in rows:
+        summary = f"{home_name or 'TBD'} vs {away_name or 'TBD'}"
+        if sport_name:
+            summary = f"{sport_name}: {summary}"
+        location = ", ".join(part for part in (venue_name, venue_address) if part)
+        events.append(match_event(
+            match_id,
+            summary,
+            start,
+            end,
+            changed_at or start,
+            location=location or None,
+            description=f"Match {match_number}" if match_number else None,
+            status=EVENT_STATUS.get(match_status, "CONFIRMED"),
+            duration=duration
+        ))
+    return build_calendar(name, events)
+
+
+def _feed_response(request: Request, db: Session, scope_key: tuple, name: str, scope) -> Response:
+    """Serve a feed, validated by a digest of its rows; rendering only happens on a cache miss"""
+    window_start = _window_start()
+    rows = _feed_rows(db, scope, window_start)
+    etag = _feed_version(scope_key, name, window_start, rows)
+    headers = {"ETag": etag, "Cache-Control": "public, no-cache"}
+    last_modified = max((row[5] for row in rows if row[5] is not None), default=None)
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified).replace(microsecond=0), usegmt=True)
+
+    if _not_modified(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cache_key = scope_key + (etag,)
+    payload = calendar_cache.get(cache_key)
+    if payload is None:
+        payload = CompressedPayload(_render_feed(name, rows), media_type="text/calendar")
+        calendar_cache.set(cache_key, payload)
+    return payload.response(request, headers=headers)
+
+
+@router.get("/teams/{team_id}.ics")
+async def team_calendar(team_id: int, request: Request, db: Session = Depends(get_db)):
+    """iCalendar feed of a team's matches (public)"""
+    name = db.query(Team.name).filter(Team.id == team_id).scalar()
+    if name is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Team not found"
+        )
+    scope = or_(Match.home_team_id == team_id, Match.away_team_id == team_id)
+    return _feed_response(request, db, ("team", team_id), name, scope)
+
+
+@router.get("/venues/{venue_id}.ics")
+async def venue_calendar(venue_id: int, request: Request, db: Session = Depends(get_db)):
+    """iCalendar feed of the matches at a venue (public)"""
+    name = db.query(Venue.name).filter(Venue.id == venue_id).scalar()
+    if name is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Venue not found"
+        )
+    return _feed_response(request, db, ("venue", venue_id), name, Match.venue_id == venue_id)
+
+
+@router.get("/tournaments/{tournament_id}.ics")
+async def tournament_calendar(tournament_id: int, request: Request, db: Session = Depends(get_db)):
+    """iCalendar feed of a public tournament's matches"""
+    tournament = db.query(Tournament.name, Tournament.is_public).filter(Tournament.id == tournament_id).first()
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    # Calendar clients cannot authenticate, so only public tournaments have feeds
+    if not tournament.is_public:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Tournament is not public"
+        )
+    scope = Match.schedule_id.in_(select(Schedule.id).where(Schedule.tournament_id == tournament_id))
+    return _feed_response(request, db, ("tournament", tournament_id), tournament.name, scope)
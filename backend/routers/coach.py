@@ -17,6 +17,8 @@ from schemas.team import TeamResponse
 from schemas.score import ScoreUpdate as ScoreUpdateSchema, ScoreResponse
 from dependencies import get_current_user_required as get_current_user
 from security.admin_service import is_admin_or_organizer
+from services.score_history import next_score_seq, invalidate_score_cache
+from services.match_completion import complete_match, correct_result
 from services.sport_scoring import (
     get_sport_code, get_scoring_handler, parse_additional_info,
     serialize_additional_info, SportCode, ScoreAction
@@ -369,6 +371,7 @@ async def update_match_score(
     # Create score update history
     db_score_update = ScoreUpdate(
         match_id=match_id,
+        seq=next_score_seq(db, match_id),
         home_score=score.home_score,
         away_score=score.away_score,
         period=score.period,
@@ -384,7 +387,11 @@ async def update_match_score(
         if not match.actual_start_time:
             match.actual_start_time = datetime.utcnow()
     
+    # A corrected result replaces the counted one and moves the (new) winner on
+    correct_result(db, match)
+    
     db.commit()
+    invalidate_score_cache(match_id)
     db.refresh(score)
     return score
 
@@ -421,8 +428,7 @@ async def end_match(
             detail="You don't have permission to end this match"
         )
     
-    match.status = MatchStatus.COMPLETED
-    match.actual_end_time = datetime.utcnow()
+    complete_match(db, match)
     
     db.commit()
     db.refresh(match)
@@ -0,0 +1,208 @@
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from sqlalchemy import func, or_, select
+from sqlalchemy.orm import Session
+from datetime import datetime
+from database import get_db
+from config import settings
+from models.auth import User, UserRole
+from models.institution import Institution
+from models.sport import Sport
+from models.team import Team
+from models.match import Match, MatchStatus, MatchParticipation
+from models.tournament import Tournament
+from models.notification import Notification
+from models.statistics import PlayerStatistics
+from schemas.dashboard import DashboardSummary
+from dependencies import get_current_user_required as get_current_user
+from security.admin_service import is_admin, is_admin_or_organizer
+from services.cache import TTLCache
+from services.compression import CompressedPayload
+from services.serialization import dumps
+
+router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
+
+# Dashboards are polled on every navigation; a few seconds of staleness is fine.
+# Entries are serialized payloads so their compressed variants are cached alongside.
+dashboard_cache = TTLCache(ttl_seconds=settings.DASHBOARD_CACHE_SECONDS)
+
+DASHBOARD_MATCH_LIMIT = 5
+
+
+def _count(model, *criteria):
+    """Scalar COUNT subquery so several card totals come back in one SELECT"""
+    return select(func.count(model.id)).where(*criteria).scalar_subquery()
+
+
+def _match_summary(db: Session, match_scope) -> dict:
+    """Matches grouped by status plus the next upcoming and current live matches in scope"""
+    status_query = db.query(Match.status, func.count(Match.id))
+    upcoming_query = db.query(Match).filter(
+        Match.status == MatchStatus.SCHEDULED,
+        Match.scheduled_time >= datetime.utcnow()
+    )
+    live_query = db.query(Match).filter(Match.status == MatchStatus.LIVE)
+    if match_scope is not None:
+        status_query = status_query.filter(match_scope)
+        upcoming_query = upcoming_query.filter(match_scope)
+        live_query = live_query.filter(match_scope)
+
+    by_status = {match_status.value: 0 for match_status in MatchStatus}
+    for match_status, count in status_query.group_by(Match.status).all():
+        by_status[match_status.value] = count
+
+    return {
+        "matches_by_status": by_status,
+        "upcoming_matches": upcoming_query.order_by(Match.scheduled_time).limit(DASHBOARD_MATCH_LIMIT).all(),
+        "live_matches": live_query.order_by(Match.scheduled_time).limit(DASHBOARD_MATCH_LIMIT).all()
+    }
+
+
+def _unread_count(user: User):
+    return _count(Notification, Notification.user_id == user.id, Notification.is_read == False)
+
+
+def _cached_summary(role: str, user: User, request: Request, build):
+    key = (role, user.id)
+    payload = dashboard_cache.get(key)
+    if payload is None:
+        summary = build()
+        summary["role"] = role
+        summary["generated_at"] = datetime.utcnow()
+        summary = DashboardSummary.model_validate(summary)
+        payload = CompressedPayload(dumps(summary.model_dump(mode="json")))
+        dashboard_cache.set(key, payload)
+    return payload.response(request)
+
+
+@router.get("/admin", response_model=DashboardSummary)
+async def admin_dashboard(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """System-wide totals for the admin dashboard"""
+    if not is_admin(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin access required"
+        )
+
+    def build():
+        totals = db.query(
+            _count(Institution),
+            _count(Institution, Institution.is_active == True),
+            _count(User),
+            _count(Tournament),
+            _unread_count(current_user)
+        ).one()
+        counts = {
+            "institutions": totals[0],
+            "active_institutions": totals[1],
+            "users": totals[2],
+            "tournaments": totals[3]
+        }
+        for role, count in db.query(User.role, func.count(User.id)).group_by(User.role).all():
+            counts[f"users_{role.value}"] = count
+        return {"counts": counts, "unread_notifications": totals[4], **_match_summary(db, None)}
+
+    return _cached_summary("admin", current_user, request, build)
+
+
+@router.get("/organizer", response_model=DashboardSummary)
+async def organizer_dashboard(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Totals for the organizer's institution"""
+    if not is_admin_or_organizer(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Organizer or Admin access required"
+        )
+    if not current_user.institution_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organizer is not associated with an institution"
+        )
+
+    def build():
+        institution_id = current_user.institution_id
+        totals = db.query(
+            _count(Sport, Sport.institution_id == institution_id),
+            _count(Team, Team.institution_id == institution_id),
+            _count(Tournament, Tournament.institution_id == institution_id),
+            _unread_count(current_user)
+        ).one()
+        sport_ids = select(Sport.id).where(Sport.institution_id == institution_id)
+        return {
+            "counts": {"sports": totals[0], "teams": totals[1], "tournaments": totals[2]},
+            "unread_notifications": totals[3],
+            **_match_summary(db, Match.sport_id.in_(sport_ids))
+        }
+
+    return _cached_summary("organizer", current_user, request, build)
+
+
+@router.get("/coach", response_model=DashboardSummary)
+async def coach_dashboard(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Teams and matches for the coach's teams"""
+    if current_user.role not in [UserRole.COACH, UserRole.ADMIN, UserRole.ORGANIZER]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Coach, Admin, or Organizer access required"
+        )
+
+    def build():
+        teams = db.query(Team).filter(Team.coach_id == current_user.id).all()
+        team_ids = [team.id for team in teams]
+        unread = db.query(_unread_count(current_user)).scalar()
+        match_scope = or_(Match.home_team_id.in_(team_ids), Match.away_team_id.in_(team_ids))
+        return {
+            "counts": {"teams": len(teams)},
+            "unread_notifications": unread,
+            "teams": teams,
+            **_match_summary(db, match_scope)
+        }
+
+    return _cached_summary("coach", current_user, request, build)
+
+
+@router.get("/player", response_model=DashboardSummary)
+async def player_dashboard(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Matches and statistics for the current player"""
+    if current_user.role != UserRole.PLAYER:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Player access required"
+        )
+
+    def build():
+        player = current_user.player_profile
+        unread = db.query(_unread_count(current_user)).scalar()
+        if not player:
+            return {"unread_notifications": unread, **_match_summary(db, Match.id.is_(None))}
+
+        matches_played = db.query(PlayerStatistics.matches_played).filter(
+            PlayerStatistics.player_id == player.id
+        ).scalar()
+        participations = select(MatchParticipation.match_id).where(MatchParticipation.player_id == player.id)
+        match_scope = Match.id.in_(participations)
+        if player.team_id:
+            match_scope = or_(match_scope, Match.home_team_id == player.team_id, Match.away_team_id == player.team_id)
+        return {
+            "counts": {"matches_played": matches_played or 0},
+            "unread_notifications": unread,
+            "teams": [player.team] if player.team else [],
+            **_match_summary(db, match_scope)
+        }
+
+    return _cached_summary("player", current_user, request, build)
@@ -0,0 +1,212 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, union
+from sqlalchemy.orm import aliased
+from models.auth import User
+from models.match import Match
+from models.player import Player
+from models.schedule import Schedule
+from models.score import Score, ScoreUpdate
+from models.sport import Sport
+from models.statistics import PlayerStatistics, TeamStatistics
+from models.team import Team
+from models.venue import Venue
+from dependencies import get_current_user_required as get_current_user
+from security.admin_service import is_admin, is_admin_or_organizer
+from services.export import MEDIA_TYPES, ExportFormat, stream_rows
+
+router = APIRouter(prefix="/export", tags=["Export"])
+
+HomeTeam = aliased(Team)
+AwayTeam = aliased(Team)
+
+
+def require_organizer(current_user: User = Depends(get_current_user)) -> User:
+    """Dependency to require organizer or admin role"""
+    if not is_admin_or_organizer(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Organizer or Admin access required"
+        )
+    return current_user
+
+
+def _institution_id(user: User) -> Optional[int]:
+    """Institution an export is limited to: the organizer's own, none for admins"""
+    if is_admin(user):
+        return None
+    if not user.institution_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Organizer is not associated with an institution"
+        )
+    return user.institution_id
+
+
+def _filter_matches(statement, institution_id, tournament_id, sport_id, date_from, date_to):
+    """Apply the institution scope and the shared tournament / sport / date filters to a statement involving Match"""
+    if institution_id is not None:
+        statement = statement.where(Match.sport_id.in_(select(Sport.id).where(Sport.institution_id == institution_id)))
+    if tournament_id:
+        statement = statement.where(
+            Match.schedule_id.in_(select(Schedule.id).where(Schedule.tournament_id == tournament_id))
+        )
+    if sport_id:
+        statement = statement.where(Match.sport_id == sport_id)
+    if date_from:
+        statement = statement.where(Match.scheduled_time >= date_from)
+    if date_to:
+        statement = statement.where(Match.scheduled_time <= date_to)
+    return statement
+
+
+def _tournament_team_ids(tournament_id: int):
+    """Teams that play at least one match in the tournament"""
+    scope = select(Schedule.id).where(Schedule.tournament_id == tournament_id)
+    return union(
+        select(Match.home_team_id).where(Match.schedule_id.in_(scope)),
+        select(Match.away_team_id).where(Match.schedule_id.in_(scope))
+    )
+
+
+def _export_response(statement, name: str, export_format: ExportFormat) -> StreamingResponse:
+    return StreamingResponse(
+        stream_rows(statement, export_format),
+        media_type=MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{export_format.value}"'}
+    )
+
+
+@router.get("/matches.{export_format}")
+async def export_matches(
+    export_format: ExportFormat,
+    tournament_id: Optional[int] = None,
+    sport_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    organizer: User = Depends(require_organizer)
+):
+    """Stream matches with team names and current score (Organizer only, own institution)"""
+    statement = select(
+        Match.id,
+        Match.match_number,
+        Match.scheduled_time,
+        Match.status,
+        Match.actual_start_time,
+        Match.actual_end_time,
+        Match.sport_id,
+        Sport.name.label("sport_name"),
+        Schedule.tournament_id,
+        Match.schedule_id,
+        Match.home_team_id,
+        HomeTeam.name.label("home_team_name"),
+        Match.away_team_id,
+        AwayTeam.name.label("away_team_name"),
+        Match.venue_id,
+        func.coalesce(Venue.name, Match.venue_name).label("venue_name"),
+        Score.home_score,
+        Score.away_score
+    ).select_from(Match).outerjoin(
+        Sport, Sport.id == Match.sport_id
+    ).outerjoin(
+        Schedule, Schedule.id == Match.schedule_id
+    ).outerjoin(
+        HomeTeam, HomeTeam.id == Match.home_team_id
+    ).outerjoin(
+        AwayTeam, AwayTeam.id == Match.away_team_id
+    ).outerjoin(
+        Venue, Venue.id == Match.venue_id
+    ).outerjoin(
+        Score, Score.match_id == Match.id
+    )
+    statement = _filter_matches(statement, _institution_id(organizer), tournament_id, sport_id, date_from, date_to)
+    return _export_response(statement.order_by(Match.id), "matches", export_format)
+
+
+@router.get("/scores.{export_format}")
+async def export_scores(
+    export_format: ExportFormat,
+    tournament_id: Optional[int] = None,
+    sport_id: Optional[int] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    organizer: User = Depends(require_organizer)
+):
+    """Stream the full score update history of the selected matches (Organizer only, own institution)"""
+    statement = select(
+        ScoreUpdate.match_id,
+        Match.match_number,
+        ScoreUpdate.seq,
+        ScoreUpdate.home_score,
+        ScoreUpdate.away_score,
+        ScoreUpdate.period,
+        ScoreUpdate.update_type,
+        ScoreUpdate.description,
+        ScoreUpdate.updated_at
+    ).join(Match, Match.id == ScoreUpdate.match_id)
+    statement = _filter_matches(statement, _institution_id(organizer), tournament_id, sport_id, date_from, date_to)
+    return _export_response(statement.order_by(ScoreUpdate.match_id, ScoreUpdate.seq), "scores", export_format)
+
+
+@router.get("/statistics/teams.{export_format}")
+async def export_team_statistics(
+    export_format: ExportFormat,
+    tournament_id: Optional[int] = None,
+    sport_id: Optional[int] = None,
+    organizer: User = Depends(require_organizer)
+):
+    """Stream team statistics (Organizer only, own institution)"""
+    statement = select(
+        TeamStatistics.team_id,
+        Team.name.label("team_name"),
+        Team.sport_id,
+        TeamStatistics.matches_played,
+        TeamStatistics.matches_won,
+        TeamStatistics.matches_lost,
+        TeamStatistics.matches_drawn,
+        TeamStatistics.goals_for,
+        TeamStatistics.goals_against,
+        TeamStatistics.sport_specific_stats,
+        TeamStatistics.updated_at
+    ).join(Team, Team.id == TeamStatistics.team_id)
+    institution_id = _institution_id(organizer)
+    if institution_id is not None:
+        statement = statement.where(Team.institution_id == institution_id)
+    if tournament_id:
+        statement = statement.where(Team.id.in_(_tournament_team_ids(tournament_id)))
+    if sport_id:
+        statement = statement.where(Team.sport_id == sport_id)
+    return _export_response(statement.order_by(TeamStatistics.team_id), "team_statistics", export_format)
+
+
+@router.get("/statistics/players.{export_format}")
+async def export_player_statistics(
+    export_format: ExportFormat,
+    tournament_id: Optional[int] = None,
+    sport_id: Optional[int] = None,
+    organizer: User = Depends(require_organizer)
+):
+    """Stream player statistics (Organizer only, own institution)"""
+    statement = select(
+        PlayerStatistics.player_id,
+        Player.team_id,
+        Player.jersey_number,
+        PlayerStatistics.matches_played,
+        PlayerStatistics.matches_won,
+        PlayerStatistics.matches_lost,
+        PlayerStatistics.matches_drawn,
+        PlayerStatistics.sport_specific_stats,
+        PlayerStatistics.updated_at
+    ).join(Player, Player.id == PlayerStatistics.player_id)
+    institution_id = _institution_id(organizer)
+    if institution_id is not None:
+        statement = statement.where(Player.team_id.in_(select(Team.id).where(Team.institution_id == institution_id)))
+    if tournament_id:
+        statement = statement.where(Player.team_id.in_(_tournament_team_ids(tournament_id)))
+    if sport_id:
+        statement = statement.where(
+            Player.team_id.in_(select(Team.id).where(Team.sport_id == sport_id))
+        )
+    return _export_response(statement.order_by(PlayerStatistics.player_id), "player_statistics", export_format)
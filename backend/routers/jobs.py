@@ -0,0 +1,81 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from database import get_db
+from config import settings
+from models.auth import User
+from schemas.job import ScheduleJobCreate, JobResponse
+from dependencies import get_current_user_required as get_current_user
+from security.admin_service import is_admin, is_admin_or_organizer
+from services.job_service import jobs, submit_schedule_job, submit_statistics_reconciliation
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+def require_organizer(current_user: User = Depends(get_current_user)) -> User:
+    """Dependency to require organizer or admin role"""
+    if not is_admin_or_organizer(current_user):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Organizer or Admin access required"
+        )
+    return current_user
+
+
+@router.post("/schedules", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_schedule_job(
+    job_data: ScheduleJobCreate,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """
+    Generate one or more schedules in the background (Organizer only).
+    Returns the queued job at once; poll GET /jobs/{id} for status and progress.
+    """
+    if not job_data.schedules:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one schedule is required"
+        )
+    if len(job_data.schedules) > settings.JOB_MAX_SCHEDULES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.JOB_MAX_SCHEDULES} schedules can be generated per job"
+        )
+
+    schedules = []
+    for schedule in job_data.schedules:
+        schedule_dict = schedule.dict()
+        if schedule_dict["tournament_id"] is None:
+            schedule_dict["tournament_id"] = job_data.tournament_id
+        schedules.append(schedule_dict)
+
+    job = submit_schedule_job(db, organizer.id, schedules)
+    return job.snapshot()
+
+
+@router.post("/statistics-reconciliation", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_statistics_reconciliation_job(
+    repair: bool = Query(False, description="Overwrite drifted counters with the recomputed values"),
+    organizer: User = Depends(require_organizer)
+):
+    """
+    Check team and player statistics against a full recompute in the background (Organizer only).
+    The job's result lists every row whose counters differ.
+    """
+    job = submit_statistics_reconciliation(organizer.id, repair)
+    return job.snapshot()
+
+
+@router.get("/{job_id}", response_model=JobResponse)
+async def get_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """Status and progress of a job (its creator or an admin)"""
+    job = jobs.get(job_id)
+    if job is None or (job.owner_id != current_user.id and not is_admin(current_user)):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    return job.snapshot()
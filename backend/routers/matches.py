@@ -1,22 +1,64 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload, aliased
 from typing import List, Optional
-from datetime import datetime
-from database import get_db
-from models.auth import User
+from datetime import datetime, timedelta
+import uuid
+from database import get_db, SessionLocal
+from config import settings
+from models.auth import User, UserRole
 from models.match import Match, MatchStatus, MatchParticipation
+from models.lineup import Lineup, LineupPlayer
+from models.player import Player
+from models.sport import Sport
+from models.team import Team
+from models.venue import Venue
 from models.schedule import Schedule, ScheduleType
 from models.score import Score, ScoreUpdate
-from schemas.match import MatchCreate, MatchResponse, MatchUpdate
-from schemas.schedule import ScheduleCreate, ScheduleResponse
+from schemas.match import MatchCreate, MatchResponse, MatchUpdate, MatchFullResponse, BracketResponse
+from schemas.schedule import ScheduleCreate, ScheduleResponse, SchedulePreview, RescheduleRequest, RescheduleResponse
 from schemas.score import ScoreUpdate as ScoreUpdateSchema, ScoreResponse
+from schemas.sport import SportResponse
+from schemas.standing import ScheduleStandings
+from schemas.team import TeamResponse
+from schemas.venue import VenueResponse
 from dependencies import get_current_user
 from typing import Optional
 from security.admin_service import is_admin_or_organizer
-from services.scheduling_service import generate_round_robin_schedule, generate_knockout_schedule
+from services.scheduling_service import (
+    create_generated_schedule, knockout_round_name, plan_schedule, plan_clash, write_plan, schedule_previews,
+    generate_next_swiss_round, unfinished_round_match
+)
+from services.match_completion import apply_result, complete_match, correct_result, revert_result
+from services.standings import recompute_standings, schedule_standings
+from services.rescheduling import reschedule_match, move_summary
+from services.venue_scheduler import match_duration_minutes
+from services.venue_bookings import venue_bookings, naive_utc, booking_ref, RELEASED_STATUSES
+from services.request_coalescing import SingleFlight
+from services.score_history import next_score_seq, serialize_score_update, score_cache, score_version, invalidate_score_cache
+from services.compression import CompressedPayload
+from services.serialization import FastJSONResponse, dumps
+from services.fieldsets import FieldsetSpec
 
 router = APIRouter(prefix="/matches", tags=["Matches"])
 
+# Live score reads spike when a goal is scored; identical in-flight reads share one query
+read_flight = SingleFlight()
+
+HomeTeam = aliased(Team)
+AwayTeam = aliased(Team)
+HomeEntry = aliased(MatchParticipation)
+AwayEntry = aliased(MatchParticipation)
+
+# Match rows are selected as one joined tuple per match; ?fields=/?include= narrow the column list
+MATCH_FIELDSET = FieldsetSpec(MatchResponse, Match, relations={
+    "sport": (SportResponse, Sport, Sport.id == Match.sport_id),
+    "home_team": (TeamResponse, HomeTeam, HomeTeam.id == Match.home_team_id),
+    "away_team": (TeamResponse, AwayTeam, AwayTeam.id == Match.away_team_id),
+    "venue": (VenueResponse, Venue, Venue.id == Match.venue_id),
+    "score": (ScoreResponse, Score, Score.match_id == Match.id)
+}, default_include=("sport", "home_team", "away_team"))
+
 
 def require_organizer(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to require organizer or admin role"""
@@ -34,27 +76,83 @@ async def create_schedule(
     db: Session = Depends(get_db),
     organizer: User = Depends(require_organizer)
 ):
-    """Create a new schedule and auto-generate matches"""
-    db_schedule = Schedule(**schedule_data.dict())
-    db.add(db_schedule)
+    """
+    Create a new schedule and auto-generate matches.
+    Generation runs inside the request; use POST /jobs/schedules for large tournaments.
+    """
+    db_schedule = create_generated_schedule(db, schedule_data.dict())
     db.commit()
     db.refresh(db_schedule)
-    
-    # Auto-generate matches based on schedule type
-    if schedule_data.schedule_type == ScheduleType.ROUND_ROBIN:
-        generate_round_robin_schedule(
-            db, db_schedule,
-            team_ids=schedule_data.team_ids,
-            player_ids=schedule_data.player_ids
+    return db_schedule
+
+
+# Fixture keys returned by previews (the rest is bracket wiring used when writing)
+PREVIEW_FIXTURE_KEYS = ("match_number", "round_number", "group_number", "bracket_position", "scheduled_time", "expected_end_time", "venue_id", "home_id", "away_id")
+
+# Roles that see line-ups (as require_coach on the coach line-up endpoints)
+LINEUP_ROLES = (UserRole.COACH, UserRole.ADMIN, UserRole.ORGANIZER)
+
+
+@router.post("/schedules/preview", response_model=SchedulePreview)
+async def preview_schedule(
+    schedule_data: ScheduleCreate,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """
+    Plan a schedule in memory and return its fixtures and quality metrics without writing
+    anything. Commit an accepted preview with POST /matches/schedules/previews/{id}/commit.
+    """
+    plan = plan_schedule(db, schedule_data.dict())
+    preview_id = uuid.uuid4().hex
+    schedule_previews.set(preview_id, (organizer.id, plan))
+    return FastJSONResponse({
+        "preview_id": preview_id,
+        "expires_in": settings.PREVIEW_TTL_SECONDS,
+        "fixtures": [{key: fixture.get(key) for key in PREVIEW_FIXTURE_KEYS} for fixture in plan.fixtures],
+        "metrics": plan.metrics,
+        "optimization": plan.optimization
+    })
+
+
+@router.post("/schedules/previews/{preview_id}/commit", response_model=ScheduleResponse, status_code=status.HTTP_201_CREATED)
+async def commit_schedule_preview(
+    preview_id: str,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """Persist a previewed schedule exactly as previewed, in one bulk write"""
+    entry = schedule_previews.get(preview_id)
+    if entry is None or entry[0] != organizer.id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Preview not found or expired"
         )
-    elif schedule_data.schedule_type == ScheduleType.KNOCKOUT:
-        generate_knockout_schedule(
-            db, db_schedule,
-            team_ids=schedule_data.team_ids,
-            player_ids=schedule_data.player_ids
+    schedule_previews.invalidate(preview_id)  # A preview is committed at most once
+    plan = entry[1]
+
+    # Venues may have been booked since the preview was planned
+    for fixture in plan.fixtures:
+        if fixture["venue_id"] is not None and venue_bookings.conflicts(
+            fixture["venue_id"], fixture["scheduled_time"], fixture["expected_end_time"]
+        ):
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=f"Venue {fixture['venue_id']} was booked at {fixture['scheduled_time'].isoformat()} after the preview; preview again"
+            )
+    # So may the teams or players, which must also keep their rest around each fixture
+    clash = plan_clash(db, plan)
+    if clash is not None:
+        fixture, participant_id = clash
+        side = "Team" if plan.is_team_sport else "Player"
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"{side} {participant_id} was booked near {fixture['scheduled_time'].isoformat()} after the preview; preview again"
         )
-    
+
+    db_schedule = write_plan(db, plan)
     db.commit()
+    db.refresh(db_schedule)
     return db_schedule
 
 
@@ -90,6 +188,189 @@ async def get_schedule(
     return schedule
 
 
+@router.get("/schedules/{schedule_id}/bracket", response_model=BracketResponse)
+async def get_bracket(
+    schedule_id: int,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+):
+    """Knockout bracket of a schedule, read in bracket order with one query (public endpoint)"""
+    rows = db.query(
+        Match.id,
+        Match.match_number,
+        Match.round_number,
+        Match.bracket_position,
+        Match.status,
+        Match.scheduled_time,
+        Match.next_match_id,
+        Match.next_match_slot,
+        Match.home_team_id,
+        HomeTeam.name,
+        HomeEntry.player_id,
+        Score.home_score,
+        Match.away_team_id,
+        AwayTeam.name,
+        AwayEntry.player_id,
+        Score.away_score
+    ).outerjoin(
+        HomeTeam, HomeTeam.id == Match.home_team_id
+    ).outerjoin(
+        AwayTeam, AwayTeam.id == Match.away_team_id
+    ).outerjoin(
+        HomeEntry, (HomeEntry.match_id == Match.id) & (HomeEntry.is_home == True)
+    ).outerjoin(
+        AwayEntry, (AwayEntry.match_id == Match.id) & (AwayEntry.is_home == False)
+    ).outerjoin(
+        Score, Score.match_id == Match.id
+    ).filter(
+        Match.schedule_id == schedule_id,
+        Match.bracket_position.isnot(None)
+    ).order_by(Match.round_number, Match.bracket_position).all()
+    
+    if not rows and not db.query(Schedule.id).filter(Schedule.id == schedule_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule not found"
+        )
+    
+    total_rounds = rows[-1][2] if rows else 0
+    rounds = {}
+    for row in rows:
+        round_number = row[2]
+        if round_number not in rounds:
+            rounds[round_number] = {
+                "round_number": round_number,
+                "name": knockout_round_name(round_number, total_rounds),
+                "matches": []
+            }
+        rounds[round_number]["matches"].append({
+            "id": row[0],
+            "match_number": row[1],
+            "bracket_position": row[3],
+            "status": row[4],
+            "scheduled_time": row[5],
+            "next_match_id": row[6],
+            "next_match_slot": row[7],
+            "home": {"team_id": row[8], "team_name": row[9], "player_id": row[10], "score": row[11]},
+            "away": {"team_id": row[12], "team_name": row[13], "player_id": row[14], "score": row[15]}
+        })
+    return FastJSONResponse({"schedule_id": schedule_id, "rounds": list(rounds.values())})
+
+
+@router.get("/schedules/{schedule_id}/standings", response_model=ScheduleStandings)
+async def get_standings(
+    schedule_id: int,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+):
+    """League table(s) of a schedule, one per group, from the stored standings rows (public endpoint)"""
+    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule not found"
+        )
+    return FastJSONResponse(schedule_standings(db, schedule))
+
+
+@router.post("/schedules/{schedule_id}/standings/recompute", response_model=ScheduleStandings)
+async def recompute_schedule_standings(
+    schedule_id: int,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """
+    Rebuild a schedule's standings from its completed matches (Organizer only), e.g. after
+    a score was corrected or the sport's points rules changed
+    """
+    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule not found"
+        )
+    if schedule.schedule_type == ScheduleType.KNOCKOUT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Knockout schedules have no standings"
+        )
+    recompute_standings(db, schedule)
+    db.commit()
+    return FastJSONResponse(schedule_standings(db, schedule))
+
+
+@router.post("/schedules/{schedule_id}/next-round", response_model=List[MatchResponse], status_code=status.HTTP_201_CREATED)
+async def pair_next_round(
+    schedule_id: int,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """
+    Pair the next round of a Swiss schedule now (Organizer only). Rounds are normally paired
+    automatically when the last match of the previous round is completed.
+    """
+    schedule = db.query(Schedule).filter(Schedule.id == schedule_id).first()
+    if not schedule:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Schedule not found"
+        )
+    if schedule.schedule_type != ScheduleType.SWISS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only Swiss schedules are paired round by round"
+        )
+    current_round = db.query(func.max(Match.round_number)).filter(Match.schedule_id == schedule_id).scalar() or 0
+    if current_round and unfinished_round_match(db, schedule_id, current_round) is not None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Round {current_round} is not finished"
+        )
+    if current_round >= (schedule.rounds or 0):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"All {schedule.rounds or 0} rounds have been paired"
+        )
+
+    match_ids = generate_next_swiss_round(db, schedule, current_round + 1)
+    db.commit()
+    return db.query(Match).filter(Match.id.in_(match_ids)).order_by(Match.bracket_position).all()
+
+
+def check_venue_free(
+    venue_id: Optional[int],
+    start: datetime,
+    end: datetime,
+    match_id: Optional[int] = None
+) -> None:
+    """Raise 409 if the venue is booked (changeover included) during [start, end)"""
+    if venue_id is None:
+        return
+    conflicts = venue_bookings.conflicts(venue_id, start, end, ignore=match_id)
+    if conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={
+                "message": "Venue is already booked at that time",
+                "conflicts": [
+                    {**booking_ref(key), "start": other_start.isoformat(), "end": other_end.isoformat()}
+                    for other_start, other_end, key in conflicts
+                ]
+            }
+        )
+
+
+def default_end_time(db: Session, sport_id: int, start: datetime) -> datetime:
+    """Planned end of a match from its sport's expected length"""
+    sport = db.query(Sport).filter(Sport.id == sport_id).first()
+    if not sport:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sport not found"
+        )
+    return start + timedelta(minutes=match_duration_minutes(sport))
+
+
 @router.post("", response_model=MatchResponse, status_code=status.HTTP_201_CREATED)
 async def create_match(
     match_data: MatchCreate,
@@ -99,6 +380,9 @@ async def create_match(
     """Create a new match manually"""
     match_dict = match_data.dict()
     player_ids = match_dict.pop("player_ids", None)
+    if match_dict["expected_end_time"] is None:
+        match_dict["expected_end_time"] = default_end_time(db, match_data.sport_id, match_data.scheduled_time)
+    check_venue_free(match_dict["venue_id"], match_dict["scheduled_time"], match_dict["expected_end_time"])
     
     db_match = Match(**match_dict, created_by=organizer.id)
     db.add(db_match)
@@ -125,20 +409,23 @@ async def list_matches(
     status: Optional[MatchStatus] = None,
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[str] = Query(None, description="Comma-separated fields, e.g. id,status,home_team.name"),
+    include: Optional[str] = Query(None, description="Relationships to embed: sport,home_team,away_team,venue,score"),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user)
 ):
     """List matches (public endpoint - no authentication required)"""
+    projection = MATCH_FIELDSET.projection(fields, include)
     try:
-        query = db.query(Match)
+        query = projection.query(db)
         if sport_id:
             query = query.filter(Match.sport_id == sport_id)
         if schedule_id:
             query = query.filter(Match.schedule_id == schedule_id)
         if status:
             query = query.filter(Match.status == status)
-        matches = query.offset(skip).limit(limit).all()
-        return matches
+        rows = query.order_by(Match.id).offset(skip).limit(limit).all()
+        return FastJSONResponse(projection.serialize_all(rows))
     except Exception as e:
         import traceback
         error_detail = f"{str(e)}\n{traceback.format_exc()}"
@@ -148,21 +435,107 @@ async def list_matches(
 @router.get("/{match_id}", response_model=MatchResponse)
 async def get_match(
     match_id: int,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user)
 ):
-    """Get match by ID (public endpoint)"""
+    """Get match by ID (public endpoint, supports ?fields= and ?include=)"""
+    projection = MATCH_FIELDSET.projection(fields, include)
+    row = projection.query(db).filter(Match.id == match_id).first()
+    if not row:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Match not found"
+        )
+    return FastJSONResponse(projection.serializer.serialize(row))
+
+
+@router.get("/{match_id}/full", response_model=MatchFullResponse)
+async def get_match_full(
+    match_id: int,
+    history_limit: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+):
+    """
+    Get a match with its sport, teams, venue, current score, score history (all of it, or the
+    latest history_limit events) and both line-ups (public endpoint; line-ups only for coaches,
+    organizers and admins, as on the line-up endpoints). Uses a fixed number of queries
+    regardless of size.
+    """
     match = db.query(Match).options(
         joinedload(Match.sport),
         joinedload(Match.home_team),
-        joinedload(Match.away_team)
+        joinedload(Match.away_team),
+        joinedload(Match.venue)
     ).filter(Match.id == match_id).first()
     if not match:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Match not found"
         )
-    return match
+    
+    score = db.query(Score).filter(Score.match_id == match_id).first()
+    if not score:
+        score = ScoreResponse(
+            id=0,
+            match_id=match_id,
+            home_score=0,
+            away_score=0,
+            created_at=datetime.utcnow()
+        )
+    
+    history = []
+    if history_limit is None:
+        history = [
+            serialize_score_update(update)
+            for update in db.query(ScoreUpdate).filter(ScoreUpdate.match_id == match_id).order_by(ScoreUpdate.seq)
+        ]
+    elif history_limit:
+        latest = db.query(ScoreUpdate).filter(
+            ScoreUpdate.match_id == match_id
+        ).order_by(ScoreUpdate.seq.desc()).limit(history_limit).all()
+        history = [serialize_score_update(update) for update in reversed(latest)]
+    
+    lineups = {}
+    # Line-ups are for the same roles as the coach line-up endpoints
+    if current_user is not None and current_user.role in LINEUP_ROLES:
+        # All line-ups with their players and names in a single joined query
+        rows = db.query(Lineup, LineupPlayer, Player.jersey_number, User.full_name, User.username).outerjoin(
+            LineupPlayer, LineupPlayer.lineup_id == Lineup.id
+        ).outerjoin(
+            Player, Player.id == LineupPlayer.player_id
+        ).outerjoin(
+            User, User.id == Player.user_id
+        ).filter(Lineup.match_id == match_id).order_by(Lineup.id, LineupPlayer.id).all()
+        
+        for lineup, lineup_player, jersey_number, full_name, username in rows:
+            entry = lineups.setdefault(lineup.id, {
+                "id": lineup.id,
+                "match_id": lineup.match_id,
+                "team_id": lineup.team_id,
+                "is_starting": lineup.is_starting,
+                "notes": lineup.notes,
+                "players": []
+            })
+            if lineup_player is not None:
+                entry["players"].append({
+                    "player_id": lineup_player.player_id,
+                    "position": lineup_player.position,
+                    "is_starting": lineup_player.is_starting,
+                    "role": lineup_player.role,
+                    "player_name": full_name or username,
+                    "jersey_number": jersey_number
+                })
+    
+    return {
+        "match": match,
+        "venue": match.venue,
+        "score": score,
+        "history": history,
+        "lineups": list(lineups.values())
+    }
 
 
 @router.patch("/{match_id}", response_model=MatchResponse)
@@ -181,6 +554,28 @@ async def update_match(
         )
     
     update_data = match_update.dict(exclude_unset=True)
+
+    # Rescheduling keeps the planned length unless a new end is given
+    if update_data.get("scheduled_time") and "expected_end_time" not in update_data:
+        if match.expected_end_time and match.scheduled_time:
+            shift = naive_utc(update_data["scheduled_time"]) - naive_utc(match.scheduled_time)
+            update_data["expected_end_time"] = match.expected_end_time + shift
+        else:
+            update_data["expected_end_time"] = default_end_time(db, match.sport_id, update_data["scheduled_time"])
+    new_status = update_data.get("status", match.status)
+    rebooking = match.status in RELEASED_STATUSES and new_status not in RELEASED_STATUSES
+    if rebooking or {"scheduled_time", "expected_end_time", "venue_id"} & update_data.keys():
+        if new_status not in RELEASED_STATUSES:
+            start = update_data.get("scheduled_time") or match.scheduled_time
+            end = update_data.get("expected_end_time") or match.expected_end_time or default_end_time(db, match.sport_id, start)
+            check_venue_free(update_data.get("venue_id", match.venue_id), start, end, match_id=match.id)
+
+    completing = update_data.get("status") == MatchStatus.COMPLETED
+    if completing:
+        update_data.pop("status")
+    # A completed match's counted result comes out before it changes (or is reopened) ...
+    if match.status == MatchStatus.COMPLETED:
+        revert_result(db, match)
     for field, value in update_data.items():
         setattr(match, field, value)
     
@@ -188,15 +583,45 @@ async def update_match(
     if match_update.status == MatchStatus.LIVE and not match.actual_start_time:
         match.actual_start_time = datetime.utcnow()
     
-    # If status changes to COMPLETED, set actual_end_time
-    if match_update.status == MatchStatus.COMPLETED and not match.actual_end_time:
-        match.actual_end_time = datetime.utcnow()
+    # Completion sets actual_end_time and advances bracket winners in this transaction
+    if completing:
+        complete_match(db, match)
+    elif match.status == MatchStatus.COMPLETED:
+        apply_result(db, match)  # ... and goes back in if it stays completed
     
     db.commit()
     db.refresh(match)
     return match
 
 
+@router.post("/{match_id}/reschedule", response_model=RescheduleResponse)
+async def reschedule_postponed_match(
+    match_id: int,
+    reschedule_data: RescheduleRequest,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """
+    Give a postponed match the earliest free slot from not_before on (Organizer only). Later
+    bracket or knockout matches that would now start too early move with it; nothing else
+    does. All moves are committed together, or none if some match finds no slot (409).
+    """
+    match = db.query(Match).filter(Match.id == match_id).first()
+    if not match:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Match not found"
+        )
+    if match.status != MatchStatus.POSTPONED:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only postponed matches can be rescheduled; set the status to postponed first"
+        )
+    moves = reschedule_match(db, match, reschedule_data.not_before, reschedule_data.venue_ids)
+    db.commit()
+    return {"moves": move_summary(moves)}
+
+
 @router.post("/{match_id}/score", response_model=ScoreResponse)
 async def update_score(
     match_id: int,
@@ -231,6 +656,7 @@ async def update_score(
     # Create score update history
     db_score_update = ScoreUpdate(
         match_id=match_id,
+        seq=next_score_seq(db, match_id),
         home_score=score.home_score,
         away_score=score.away_score,
         period=score_update.period,
@@ -246,51 +672,95 @@ async def update_score(
         if not match.actual_start_time:
             match.actual_start_time = datetime.utcnow()
     
+    # A corrected result replaces the counted one and moves the (new) winner on
+    correct_result(db, match)
+    
     db.commit()
+    invalidate_score_cache(match_id)
     db.refresh(score)
     return score
 
 
+async def _cached_read(key: tuple, loader, *args) -> CompressedPayload:
+    """
+    Serve a public score read from the short-lived cache, coalescing concurrent misses. A read
+    that began before the score changed is neither joined by later readers nor cached
+    """
+    payload = score_cache.get(key)
+    if payload is None:
+        version = score_version(key[1])
+        payload = await read_flight.do(key + (version,), loader, *args)
+        if score_version(key[1]) == version:
+            score_cache.set(key, payload)
+    return payload
+
+
+def _load_score_payload(match_id: int) -> CompressedPayload:
+    """Serialize the current score of a match (runs once per coalesced flight)"""
+    db = SessionLocal()
+    try:
+        score = db.query(Score).filter(Score.match_id == match_id).first()
+        if not score:
+            # Return default score if not set
+            score = ScoreResponse(
+                id=0,
+                match_id=match_id,
+                home_score=0,
+                away_score=0,
+                created_at=datetime.utcnow()
+            )
+        return CompressedPayload(ScoreResponse.model_validate(score).model_dump_json().encode())
+    finally:
+        db.close()
+
+
+def _load_score_history_payload(
+    match_id: int,
+    since_seq: Optional[int],
+    limit: Optional[int],
+    order: str
+) -> CompressedPayload:
+    """Serialize score update history of a match (runs once per coalesced flight)"""
+    db = SessionLocal()
+    try:
+        query = db.query(ScoreUpdate).filter(ScoreUpdate.match_id == match_id)
+        if since_seq is not None:
+            query = query.filter(ScoreUpdate.seq > since_seq)
+        query = query.order_by(ScoreUpdate.seq.desc() if order == "desc" else ScoreUpdate.seq)
+        if limit is not None:
+            query = query.limit(limit)
+        
+        return CompressedPayload(dumps([serialize_score_update(update) for update in query.all()]))
+    finally:
+        db.close()
+
+
 @router.get("/{match_id}/score", response_model=ScoreResponse)
 async def get_match_score(
     match_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
     current_user: Optional[User] = Depends(get_current_user)
 ):
-    """Get current match score (public endpoint)"""
-    score = db.query(Score).filter(Score.match_id == match_id).first()
-    if not score:
-        # Return default score if not set
-        return ScoreResponse(
-            id=0,
-            match_id=match_id,
-            home_score=0,
-            away_score=0,
-            created_at=datetime.utcnow()
-        )
-    return score
+    """Get current match score (public endpoint, cached briefly and coalesced)"""
+    payload = await _cached_read(("score", match_id), _load_score_payload, match_id)
+    return payload.response(request)
 
 
 @router.get("/{match_id}/score/history", response_model=List[dict])
 async def get_score_history(
     match_id: int,
-    db: Session = Depends(get_db),
+    request: Request,
+    since_seq: Optional[int] = Query(None, ge=0, description="Only return events with seq greater than this"),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    order: str = Query("asc", pattern="^(asc|desc)$"),
     current_user: Optional[User] = Depends(get_current_user)
 ):
-    """Get score update history for a match (public endpoint)"""
-    score_updates = db.query(ScoreUpdate).filter(
-        ScoreUpdate.match_id == match_id
-    ).order_by(ScoreUpdate.created_at).all()
-    
-    return [
-        {
-            "id": update.id,
-            "home_score": update.home_score,
-            "away_score": update.away_score,
-            "period": update.period,
-            "update_type": update.update_type,
-            "description": update.description,
-            "updated_at": update.updated_at.isoformat() if update.updated_at else None
-        }
-        for update in score_updates
-    ]
+    """
+    Get score update history for a match (public endpoint, cached briefly and coalesced).
+    Poll with since_seq set to the last seen seq to receive only new events.
+    """
+    payload = await _cached_read(
+        ("score_history", match_id, since_seq, limit, order),
+        _load_score_history_payload, match_id, since_seq, limit, order
+    )
+    return payload.response(request)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from database import get_db
 from models.auth import User
 from models.institution import Institution
@@ -13,9 +13,19 @@ from schemas.team import TeamCreate, TeamResponse
 from schemas.player import PlayerCreate, PlayerResponse
 from dependencies import get_current_user_required as get_current_user
 from security.admin_service import is_admin_or_organizer, can_manage_institution
+from services.fieldsets import FieldsetSpec
+from services.serialization import FastJSONResponse
 
 router = APIRouter(prefix="/organizer", tags=["Organizer"])
 
+TEAM_FIELDSET = FieldsetSpec(TeamResponse, Team, relations={
+    "sport": (SportResponse, Sport, Sport.id == Team.sport_id),
+    "institution": (InstitutionResponse, Institution, Institution.id == Team.institution_id)
+})
+PLAYER_FIELDSET = FieldsetSpec(PlayerResponse, Player, relations={
+    "team": (TeamResponse, Team, Team.id == Player.team_id)
+})
+
 
 def require_organizer(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to require organizer or admin role"""
@@ -137,17 +147,20 @@ async def list_teams(
     institution_id: int = None,
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     organizer: User = Depends(require_organizer)
 ):
-    """List teams"""
-    query = db.query(Team)
+    """List teams (supports ?fields= and ?include=sport,institution)"""
+    projection = TEAM_FIELDSET.projection(fields, include)
+    query = projection.query(db)
     if sport_id:
         query = query.filter(Team.sport_id == sport_id)
     if institution_id:
         query = query.filter(Team.institution_id == institution_id)
-    teams = query.offset(skip).limit(limit).all()
-    return teams
+    rows = query.order_by(Team.id).offset(skip).limit(limit).all()
+    return FastJSONResponse(projection.serialize_all(rows))
 
 
 @router.post("/players", response_model=PlayerResponse, status_code=status.HTTP_201_CREATED)
@@ -170,15 +183,18 @@ async def list_players(
     team_id: int = None,
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     organizer: User = Depends(require_organizer)
 ):
-    """List players"""
-    query = db.query(Player)
+    """List players (supports ?fields= and ?include=team)"""
+    projection = PLAYER_FIELDSET.projection(fields, include)
+    query = projection.query(db)
     if team_id:
         query = query.filter(Player.team_id == team_id)
-    players = query.offset(skip).limit(limit).all()
-    return players
+    rows = query.order_by(Player.id).offset(skip).limit(limit).all()
+    return FastJSONResponse(projection.serialize_all(rows))
 
 
 @router.get("/institution", response_model=InstitutionResponse)
@@ -11,6 +11,17 @@ from dependencies import get_current_user_required as get_current_user
 router = APIRouter(prefix="/statistics", tags=["Statistics"])
 
 
+# Rows are created by the first completed match (services/match_statistics); reads never write
+def empty_player_statistics(player_id: int) -> PlayerStatistics:
+    return PlayerStatistics(player_id=player_id, matches_played=0, matches_won=0, matches_lost=0, matches_drawn=0)
+
+
+def empty_team_statistics(team_id: int) -> TeamStatistics:
+    return TeamStatistics(
+        team_id=team_id, matches_played=0, matches_won=0, matches_lost=0, matches_drawn=0, goals_for=0, goals_against=0
+    )
+
+
 @router.get("/players/{player_id}", response_model=PlayerStatisticsResponse)
 async def get_player_statistics(
     player_id: int,
@@ -25,15 +36,7 @@ async def get_player_statistics(
             detail="Player not found"
         )
     
-    stats = db.query(PlayerStatistics).filter(PlayerStatistics.player_id == player_id).first()
-    if not stats:
-        # Create default stats if not exists
-        stats = PlayerStatistics(player_id=player_id)
-        db.add(stats)
-        db.commit()
-        db.refresh(stats)
-    
-    return stats
+    return db.query(PlayerStatistics).filter(PlayerStatistics.player_id == player_id).first() or empty_player_statistics(player_id)
 
 
 @router.get("/teams/{team_id}", response_model=TeamStatisticsResponse)
@@ -50,15 +53,7 @@ async def get_team_statistics(
             detail="Team not found"
         )
     
-    stats = db.query(TeamStatistics).filter(TeamStatistics.team_id == team_id).first()
-    if not stats:
-        # Create default stats if not exists
-        stats = TeamStatistics(team_id=team_id)
-        db.add(stats)
-        db.commit()
-        db.refresh(stats)
-    
-    return stats
+    return db.query(TeamStatistics).filter(TeamStatistics.team_id == team_id).first() or empty_team_statistics(team_id)
 
 
 @router.get("/players/me", response_model=PlayerStatisticsResponse)
@@ -74,11 +69,4 @@ async def get_my_statistics(
         )
     
     player_id = current_user.player_profile.id
-    stats = db.query(PlayerStatistics).filter(PlayerStatistics.player_id == player_id).first()
-    if not stats:
-        stats = PlayerStatistics(player_id=player_id)
-        db.add(stats)
-        db.commit()
-        db.refresh(stats)
-    
-    return stats
+    return db.query(PlayerStatistics).filter(PlayerStatistics.player_id == player_id).first() or empty_player_statistics(player_id)
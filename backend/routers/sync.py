@@ -0,0 +1,105 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy import or_, select
+from sqlalchemy.orm import Session
+from typing import Optional
+from database import get_db
+from models.auth import User, UserRole
+from models.match import Match
+from models.notification import Notification
+from models.player import Player
+from models.score import Score
+from models.team import Team
+from models.tombstone import Tombstone
+from models.tournament import Tournament
+from schemas.match import MatchResponse
+from schemas.notification import NotificationResponse
+from schemas.player import PlayerResponse
+from schemas.score import ScoreResponse
+from schemas.sync import SyncResponse
+from schemas.team import TeamResponse
+from schemas.tournament import TournamentResponse
+from dependencies import get_current_user
+from security.admin_service import is_admin_or_organizer
+from services.serialization import FastJSONResponse, RowSerializer
+from services.sync import decode_token, encode_token, sync_now
+
+router = APIRouter(prefix="/sync", tags=["Sync"])
+
+# Collection name -> (model, serializer); collection names are the table names
+SYNC_ENTITIES = {
+    "matches": (Match, RowSerializer(MatchResponse, Match)),
+    "scores": (Score, RowSerializer(ScoreResponse, Score)),
+    "teams": (Team, RowSerializer(TeamResponse, Team)),
+    "players": (Player, RowSerializer(PlayerResponse, Player)),
+    "tournaments": (Tournament, RowSerializer(TournamentResponse, Tournament)),
+    "notifications": (Notification, RowSerializer(NotificationResponse, Notification)),
+}
+
+
+def _visibility(user: Optional[User]) -> dict:
+    """
+    Extra criteria per collection for this caller; collections mapped to False are not synced.
+    Mirrors the read endpoints: matches, scores and teams are public, private tournaments need
+    a login, players follow the coach/organizer listings and notifications are per user.
+    """
+    if user is None:
+        return {"tournaments": Tournament.is_public == True, "players": False, "notifications": False}
+
+    visible = {"notifications": Notification.user_id == user.id}
+    if is_admin_or_organizer(user):
+        return visible
+    if user.role == UserRole.COACH:
+        visible["players"] = Player.team_id.in_(select(Team.id).where(Team.coach_id == user.id))
+    elif user.role == UserRole.PLAYER:
+        own_team = select(Player.team_id).where(Player.user_id == user.id).scalar_subquery()
+        visible["players"] = or_(Player.user_id == user.id, Player.team_id == own_team)
+    else:
+        visible["players"] = False
+    return visible
+
+
+@router.get("", response_model=SyncResponse)
+async def delta_sync(
+    since: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+):
+    """
+    Rows created, updated or deleted since the token (everything visible when omitted).
+    Pass the returned token as ?since= on the next call.
+    """
+    started_at = sync_now(db)
+    lower_bound = decode_token(since)
+    visibility = _visibility(current_user)
+
+    changes = {}
+    for name, (model, serializer) in SYNC_ENTITIES.items():
+        criteria = visibility.get(name)
+        if criteria is False:
+            continue
+        query = db.query(*serializer.columns)
+        if criteria is not None:
+            query = query.filter(criteria)
+        if lower_bound is not None:
+            query = query.filter(or_(model.created_at >= lower_bound, model.updated_at >= lower_bound))
+        changes[name] = serializer.serialize_all(query.order_by(model.id).all())
+
+    deleted = {name: [] for name in changes}
+    if lower_bound is not None:
+        owner_scope = Tombstone.owner_id.is_(None)
+        if current_user is not None:
+            owner_scope = or_(owner_scope, Tombstone.owner_id == current_user.id)
+        tombstones = db.query(Tombstone.entity_type, Tombstone.entity_id).filter(
+            Tombstone.created_at >= lower_bound,
+            Tombstone.entity_type.in_(list(changes)),
+            owner_scope
+        ).order_by(Tombstone.id).all()
+        for entity_type, entity_id in tombstones:
+            deleted[entity_type].append(entity_id)
+
+    return FastJSONResponse({
+        "token": encode_token(started_at),
+        "full": lower_bound is None,
+        "changes": changes,
+        "deleted": deleted
+    })
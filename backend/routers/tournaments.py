@@ -3,14 +3,26 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from database import get_db
 from models.auth import User
+from models.institution import Institution
 from models.tournament import Tournament, TournamentSport
-from schemas.tournament import TournamentCreate, TournamentResponse, TournamentUpdate
+from schemas.institution import InstitutionResponse
+from models.sport import Sport
+from schemas.standing import TournamentStandings
+from schemas.tournament import TournamentConflicts, TournamentCreate, TournamentResponse, TournamentUpdate
 from dependencies import get_current_user
 from typing import Optional
 from security.admin_service import is_admin_or_organizer
+from services.fieldsets import FieldsetSpec
+from services.player_conflicts import get_conflict_index
+from services.standings import tournament_standings
+from services.serialization import FastJSONResponse
 
 router = APIRouter(prefix="/tournaments", tags=["Tournaments"])
 
+TOURNAMENT_FIELDSET = FieldsetSpec(TournamentResponse, Tournament, relations={
+    "institution": (InstitutionResponse, Institution, Institution.id == Tournament.institution_id)
+})
+
 
 def require_organizer(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to require organizer or admin role"""
@@ -52,41 +64,47 @@ async def list_tournaments(
     is_public: Optional[bool] = None,
     skip: int = 0,
     limit: int = 100,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user)
 ):
-    """List tournaments (public endpoint)"""
-    query = db.query(Tournament)
+    """List tournaments (public endpoint, supports ?fields= and ?include=institution)"""
+    projection = TOURNAMENT_FIELDSET.projection(fields, include)
+    query = projection.query(db)
     if institution_id:
         query = query.filter(Tournament.institution_id == institution_id)
     if is_public is not None:
         query = query.filter(Tournament.is_public == is_public)
-    tournaments = query.offset(skip).limit(limit).all()
-    return tournaments
+    rows = query.order_by(Tournament.id).offset(skip).limit(limit).all()
+    return FastJSONResponse(projection.serialize_all(rows))
 
 
 @router.get("/{tournament_id}", response_model=TournamentResponse)
 async def get_tournament(
     tournament_id: int,
+    fields: Optional[str] = None,
+    include: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user)
 ):
-    """Get tournament by ID (public endpoint)"""
-    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
-    if not tournament:
+    """Get tournament by ID (public endpoint, supports ?fields= and ?include=institution)"""
+    projection = TOURNAMENT_FIELDSET.projection(fields, include)
+    row = projection.query(db).add_columns(Tournament.is_public).filter(Tournament.id == tournament_id).first()
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Tournament not found"
         )
     
     # Check if tournament is public or user has access
-    if not tournament.is_public and not current_user:
+    if not row[-1] and not current_user:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Tournament is not public"
         )
     
-    return tournament
+    return FastJSONResponse(projection.serializer.serialize(row))
 
 
 @router.patch("/{tournament_id}", response_model=TournamentResponse)
@@ -111,3 +129,52 @@ async def update_tournament(
     db.commit()
     db.refresh(tournament)
     return tournament
+
+
+@router.get("/{tournament_id}/conflicts", response_model=TournamentConflicts)
+async def get_player_conflicts(
+    tournament_id: int,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """Players booked into overlapping matches across the tournament's sports (Organizer only)"""
+    if not db.query(Tournament.id).filter(Tournament.id == tournament_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    index = get_conflict_index(db, tournament_id)
+    return {
+        "tournament_id": tournament_id,
+        "match_count": len(index.matches),
+        "player_count": len(index.player_matches),
+        "conflicts": index.conflicts(),
+    }
+
+
+@router.get("/{tournament_id}/sports/{sport_id}/standings", response_model=TournamentStandings)
+async def get_tournament_standings(
+    tournament_id: int,
+    sport_id: int,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user)
+):
+    """One standings table for a sport across all of the tournament's schedules (public endpoint)"""
+    tournament = db.query(Tournament.id, Tournament.is_public).filter(Tournament.id == tournament_id).first()
+    if not tournament:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Tournament not found"
+        )
+    if not tournament.is_public and not current_user:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Tournament is not public"
+        )
+    sport = db.query(Sport).filter(Sport.id == sport_id).first()
+    if not sport:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sport not found"
+        )
+    return FastJSONResponse(tournament_standings(db, tournament_id, sport))
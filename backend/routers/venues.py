@@ -1,10 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime, timedelta
 from database import get_db
+from config import settings
 from models.auth import User
-from models.venue import Venue
-from schemas.venue import VenueCreate, VenueResponse
+from models.venue import Venue, VenueBlackout
+from schemas.venue import VenueCreate, VenueResponse, VenueAvailability, VenueBlackoutCreate, VenueBlackoutResponse, VenueBlackoutResult
+from services.venue_bookings import venue_bookings, naive_utc, booking_ref, reload_after_commit
+from services.rescheduling import reschedule_for_blackout, move_summary
 from dependencies import get_current_user_required as get_current_user
 from security.admin_service import is_admin_or_organizer
 
@@ -67,6 +71,57 @@ async def get_venue(
     return venue
 
 
+@router.get("/{venue_id}/availability", response_model=VenueAvailability)
+async def get_venue_availability(
+    venue_id: int,
+    window_start: Optional[datetime] = Query(None, alias="from"),
+    window_end: Optional[datetime] = Query(None, alias="to"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Bookings and free periods of a venue between from (default now) and to (default a week later).
+    Answered from the in-memory booking index, not by scanning the venue's matches.
+    """
+    if not db.query(Venue.id).filter(Venue.id == venue_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Venue not found"
+        )
+    window_start = naive_utc(window_start) or datetime.utcnow().replace(second=0, microsecond=0)
+    window_end = naive_utc(window_end) or window_start + timedelta(days=7)
+    if window_end <= window_start or window_end - window_start > timedelta(days=settings.SCHEDULE_MAX_DAYS):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"to must be after from and at most {settings.SCHEDULE_MAX_DAYS} days later"
+        )
+
+    changeover = timedelta(minutes=settings.SCHEDULE_CHANGEOVER_MINUTES)
+    # Bookings up to a changeover outside the window still shorten its free periods
+    nearby = venue_bookings.bookings(venue_id, window_start - changeover, window_end + changeover)
+    free = []
+    cursor = window_start
+    for start, end, _ in nearby:
+        if start - changeover > cursor:
+            free.append({"start": cursor, "end": min(start - changeover, window_end)})
+        cursor = max(cursor, end + changeover)
+        if cursor >= window_end:
+            break
+    if cursor < window_end:
+        free.append({"start": cursor, "end": window_end})
+
+    return {
+        "venue_id": venue_id,
+        "start": window_start,
+        "end": window_end,
+        "bookings": [
+            {**booking_ref(key), "start": start, "end": end}
+            for start, end, key in nearby if start < window_end and end > window_start
+        ],
+        "free": [period for period in free if period["end"] > period["start"]]
+    }
+
+
 @router.patch("/{venue_id}", response_model=VenueResponse)
 async def update_venue(
     venue_id: int,
@@ -89,3 +144,78 @@ async def update_venue(
     db.commit()
     db.refresh(venue)
     return venue
+
+
+
+@router.get("/{venue_id}/blackouts", response_model=List[VenueBlackoutResponse])
+async def list_venue_blackouts(
+    venue_id: int,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """Closures of a venue that have not ended yet"""
+    return db.query(VenueBlackout).filter(
+        VenueBlackout.venue_id == venue_id,
+        VenueBlackout.end_time > datetime.utcnow()
+    ).order_by(VenueBlackout.start_time).all()
+
+
+@router.post("/{venue_id}/blackouts", response_model=VenueBlackoutResult, status_code=status.HTTP_201_CREATED)
+async def create_venue_blackout(
+    venue_id: int,
+    blackout_data: VenueBlackoutCreate,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """
+    Close a venue for a window and move the matches booked in it (Organizer only): to another
+    venue at the same time where possible, otherwise to the earliest free slot. The blackout
+    and every move are committed together; 409 (and nothing changes) if a match cannot be moved.
+    """
+    if not db.query(Venue.id).filter(Venue.id == venue_id).first():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Venue not found"
+        )
+    if naive_utc(blackout_data.end_time) <= naive_utc(blackout_data.start_time):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="end_time must be after start_time"
+        )
+
+    blackout = VenueBlackout(
+        venue_id=venue_id,
+        start_time=naive_utc(blackout_data.start_time),
+        end_time=naive_utc(blackout_data.end_time),
+        reason=blackout_data.reason,
+        created_by=organizer.id
+    )
+    db.add(blackout)
+    db.flush()
+    moves = reschedule_for_blackout(db, venue_id, blackout.start_time, blackout.end_time, blackout.id)
+    reload_after_commit(db, {venue_id})
+    db.commit()
+    db.refresh(blackout)
+    return {"blackout": blackout, "moves": move_summary(moves)}
+
+
+@router.delete("/{venue_id}/blackouts/{blackout_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_venue_blackout(
+    venue_id: int,
+    blackout_id: int,
+    db: Session = Depends(get_db),
+    organizer: User = Depends(require_organizer)
+):
+    """Reopen a venue early (Organizer only); matches already moved stay where they are"""
+    blackout = db.query(VenueBlackout).filter(
+        VenueBlackout.id == blackout_id, VenueBlackout.venue_id == venue_id
+    ).first()
+    if not blackout:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Blackout not found"
+        )
+    db.delete(blackout)
+    reload_after_commit(db, {venue_id})
+    db.commit()
+    return None
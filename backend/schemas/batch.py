@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import Any, List, Optional
+
+
+class BatchItem(BaseModel):
+    path: str  # Path under the API prefix, with query string, e.g. "/matches?status=live"
+    method: str = "GET"  # Only GET is executed
+    id: Optional[str] = None  # Echoed back so clients can match responses
+
+
+class BatchRequest(BaseModel):
+    requests: List[BatchItem]
+
+
+class BatchItemResponse(BaseModel):
+    id: Optional[str] = None
+    status: int
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    responses: List[BatchItemResponse]
@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import Optional, List, Dict
+from datetime import datetime
+from models.match import MatchStatus
+from schemas.team import TeamResponse
+
+
+class DashboardMatch(BaseModel):
+    id: int
+    match_number: Optional[str] = None
+    scheduled_time: datetime
+    status: MatchStatus
+    sport_id: int
+    home_team_id: Optional[int] = None
+    away_team_id: Optional[int] = None
+    venue_name: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class DashboardSummary(BaseModel):
+    role: str
+    counts: Dict[str, int] = {}  # Card totals for the caller's scope
+    matches_by_status: Dict[str, int] = {}
+    upcoming_matches: List[DashboardMatch] = []
+    live_matches: List[DashboardMatch] = []
+    unread_notifications: int = 0
+    teams: List[TeamResponse] = []  # Coach: teams they coach; player: their team
+    generated_at: datetime
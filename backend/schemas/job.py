@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from schemas.schedule import ScheduleCreate
+from services.job_service import JobStatus
+
+
+class ScheduleJobCreate(BaseModel):
+    schedules: List[ScheduleCreate]
+    tournament_id: Optional[int] = None  # Applied to schedules that don't set their own
+
+
+class JobScheduleResult(BaseModel):
+    name: str
+    sport_id: int
+    status: JobStatus
+    schedule_id: Optional[int] = None  # Set once the schedule is fully generated
+    match_count: int = 0  # Matches committed so far
+    error: Optional[str] = None
+
+
+class JobResponse(BaseModel):
+    id: str
+    kind: str
+    status: JobStatus
+    done: int  # Matches committed
+    total: int  # Matches planned so far; grows as schedules are planned
+    schedules: List[JobScheduleResult]
+    result: Optional[Dict[str, Any]] = None  # Jobs that don't generate schedules, e.g. statistics reconciliation
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
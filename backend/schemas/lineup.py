@@ -36,3 +36,14 @@ class LineupPlayerResponse(LineupPlayerBase):
     
     class Config:
         from_attributes = True
+
+
+class LineupPlayerDetail(LineupPlayerBase):
+    """Line-up entry with the player's display details"""
+    player_name: Optional[str] = None
+    jersey_number: Optional[int] = None
+
+
+class LineupDetailResponse(LineupBase):
+    id: int
+    players: List[LineupPlayerDetail] = []
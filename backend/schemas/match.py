@@ -4,6 +4,9 @@ from datetime import datetime
 from models.match import MatchStatus
 from schemas.sport import SportResponse
 from schemas.team import TeamResponse
+from schemas.venue import VenueResponse
+from schemas.score import ScoreResponse
+from schemas.lineup import LineupDetailResponse
 
 
 class MatchBase(BaseModel):
@@ -17,11 +20,15 @@ class MatchCreate(MatchBase):
     home_team_id: Optional[int] = None
     away_team_id: Optional[int] = None
     schedule_id: Optional[int] = None
+    venue_id: Optional[int] = None
+    expected_end_time: Optional[datetime] = None  # Defaults to the sport's expected match length
     player_ids: Optional[List[int]] = None  # For individual sports
 
 
 class MatchUpdate(BaseModel):
     scheduled_time: Optional[datetime] = None
+    expected_end_time: Optional[datetime] = None
+    venue_id: Optional[int] = None
     status: Optional[MatchStatus] = None
     notes: Optional[str] = None
     actual_start_time: Optional[datetime] = None
@@ -37,8 +44,14 @@ class MatchResponse(MatchBase):
     status: MatchStatus
     actual_start_time: Optional[datetime] = None
     actual_end_time: Optional[datetime] = None
+    expected_end_time: Optional[datetime] = None
     venue_name: Optional[str] = None
     venue_id: Optional[int] = None
+    round_number: Optional[int] = None
+    group_number: Optional[int] = None
+    bracket_position: Optional[int] = None
+    next_match_id: Optional[int] = None
+    next_match_slot: Optional[str] = None
     created_by: int
     created_at: datetime
     # Optional relationships (included when loaded)
@@ -48,3 +61,42 @@ class MatchResponse(MatchBase):
     
     class Config:
         from_attributes = True
+
+
+class BracketSide(BaseModel):
+    team_id: Optional[int] = None
+    team_name: Optional[str] = None
+    player_id: Optional[int] = None  # Individual sports
+    score: Optional[int] = None
+
+
+class BracketMatch(BaseModel):
+    id: int
+    match_number: Optional[str] = None
+    bracket_position: Optional[int] = None
+    status: MatchStatus
+    scheduled_time: datetime
+    home: BracketSide
+    away: BracketSide
+    next_match_id: Optional[int] = None
+    next_match_slot: Optional[str] = None
+
+
+class BracketRound(BaseModel):
+    round_number: int
+    name: str
+    matches: List[BracketMatch]
+
+
+class BracketResponse(BaseModel):
+    schedule_id: int
+    rounds: List[BracketRound]
+
+
+class MatchFullResponse(BaseModel):
+    """Everything the match detail page needs in one response"""
+    match: MatchResponse
+    venue: Optional[VenueResponse] = None
+    score: ScoreResponse
+    history: List[dict] = []  # Latest score events, oldest first
+    lineups: List[LineupDetailResponse] = []
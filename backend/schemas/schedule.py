@@ -1,6 +1,6 @@
 from pydantic import BaseModel
 from typing import Optional, List
-from datetime import datetime
+from datetime import datetime, time
 from models.schedule import ScheduleType
 
 
@@ -14,13 +14,105 @@ class ScheduleBase(BaseModel):
 
 class ScheduleCreate(ScheduleBase):
     sport_id: int
+    tournament_id: Optional[int] = None
     team_ids: Optional[List[int]] = None  # Teams/players to schedule
     player_ids: Optional[List[int]] = None  # For individual sports
+    double_round_robin: bool = False  # Round robin: play everyone home and away
+    rounds: Optional[int] = None  # Swiss: rounds to play (default: ceil(log2(participants)))
+    group_count: Optional[int] = None  # Group + knockout: groups (default: groups of GROUP_DEFAULT_SIZE)
+    qualifiers_per_group: int = 2  # Group + knockout: places that go through to the bracket
+    # Slot constraints; defaults come from settings and the sport's match_config
+    venue_ids: Optional[List[int]] = None  # Defaults to the institution's active venues
+    day_start: Optional[time] = None
+    day_end: Optional[time] = None
+    rest_minutes: Optional[int] = None
+    match_minutes: Optional[int] = None
+    matches_per_day: Optional[int] = None  # Cap on this schedule's matches per day
+    optimize_seconds: Optional[float] = None  # Improve the generated slots for up to this long
+
+
+class ScheduleFixture(BaseModel):
+    match_number: str
+    round_number: Optional[int] = None
+    group_number: Optional[int] = None
+    bracket_position: Optional[int] = None
+    scheduled_time: datetime
+    expected_end_time: datetime
+    venue_id: Optional[int] = None
+    home_id: Optional[int] = None  # Team id for team sports, player id otherwise; None = TBD
+    away_id: Optional[int] = None
+
+
+class ParticipantRest(BaseModel):
+    participant_id: int
+    matches: int
+    min_rest_days: Optional[float] = None
+    avg_rest_days: Optional[float] = None
+
+
+class VenueUtilization(BaseModel):
+    venue_id: Optional[int] = None
+    matches: int
+    booked_minutes: int
+    utilization: Optional[float] = None  # Share of the daily windows across the span
+
+
+class ScheduleMetrics(BaseModel):
+    match_count: int
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    span_days: int
+    min_rest_days: Optional[float] = None
+    avg_rest_days: Optional[float] = None
+    rest: List[ParticipantRest]
+    venues: List[VenueUtilization]
+
+
+class OptimizationSample(BaseModel):
+    elapsed_ms: int
+    iteration: int
+    objective: float  # Best objective so far
+
+
+class OptimizationReport(BaseModel):
+    initial_objective: float
+    objective: float
+    iterations: int
+    accepted: int
+    trajectory: List[OptimizationSample]
+
+
+class SchedulePreview(BaseModel):
+    preview_id: str
+    expires_in: int  # Seconds the preview can still be committed
+    fixtures: List[ScheduleFixture]
+    metrics: ScheduleMetrics
+    optimization: Optional[OptimizationReport] = None
+
+
+class RescheduleRequest(BaseModel):
+    not_before: Optional[datetime] = None  # Earliest new start; defaults to now
+    venue_ids: Optional[List[int]] = None  # Allowed venues; default: the match's venue, then its institution's
+
+
+class MatchMove(BaseModel):
+    match_id: int
+    from_venue_id: Optional[int] = None
+    from_time: datetime
+    venue_id: Optional[int] = None
+    scheduled_time: datetime
+    expected_end_time: datetime
+
+
+class RescheduleResponse(BaseModel):
+    moves: List[MatchMove]  # Every match that moved, the requested one first
 
 
 class ScheduleResponse(ScheduleBase):
     id: int
     sport_id: int
+    tournament_id: Optional[int] = None
+    rounds: Optional[int] = None
     is_active: bool
     created_at: datetime
     
@@ -0,0 +1,36 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class StandingRow(BaseModel):
+    position: int
+    team_id: Optional[int] = None
+    player_id: Optional[int] = None  # Individual sports
+    name: Optional[str] = None
+    played: int
+    won: int
+    drawn: int
+    lost: int
+    score_for: int
+    score_against: int
+    score_difference: int
+    points: int
+
+
+class StandingsGroup(BaseModel):
+    group_number: Optional[int] = None  # None for a single league table
+    rows: List[StandingRow]
+
+
+class ScheduleStandings(BaseModel):
+    schedule_id: int
+    sport_id: int
+    tie_breakers: List[str]  # Applied in order after points; the seed breaks any remaining tie
+    groups: List[StandingsGroup]
+
+
+class TournamentStandings(BaseModel):
+    tournament_id: int
+    sport_id: int
+    tie_breakers: List[str]
+    rows: List[StandingRow]
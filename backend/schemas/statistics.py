@@ -4,14 +4,14 @@ from datetime import datetime
 
 
 class PlayerStatisticsResponse(BaseModel):
-    id: int
+    id: Optional[int] = None  # None until the player's first completed match
     player_id: int
     matches_played: int
     matches_won: int
     matches_lost: int
     matches_drawn: int
     sport_specific_stats: Optional[str] = None
-    created_at: datetime
+    created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
     class Config:
@@ -19,7 +19,7 @@ class PlayerStatisticsResponse(BaseModel):
 
 
 class TeamStatisticsResponse(BaseModel):
-    id: int
+    id: Optional[int] = None  # None until the team's first completed match
     team_id: int
     matches_played: int
     matches_won: int
@@ -28,7 +28,7 @@ class TeamStatisticsResponse(BaseModel):
     goals_for: int
     goals_against: int
     sport_specific_stats: Optional[str] = None
-    created_at: datetime
+    created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
     class Config:
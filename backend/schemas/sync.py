@@ -0,0 +1,9 @@
+from pydantic import BaseModel
+from typing import Any, Dict, List
+
+
+class SyncResponse(BaseModel):
+    token: str  # Pass back as ?since= on the next sync
+    full: bool  # True when no token was given and changes hold every visible row
+    changes: Dict[str, List[Dict[str, Any]]]  # Created or updated rows per collection
+    deleted: Dict[str, List[int]]  # Deleted ids per collection
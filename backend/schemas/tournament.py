@@ -35,3 +35,24 @@ class TournamentResponse(TournamentBase):
     
     class Config:
         from_attributes = True
+
+
+class ConflictMatch(BaseModel):
+    match_id: int
+    sport_id: int
+    start: datetime
+    end: datetime
+
+
+class PlayerConflict(BaseModel):
+    player_id: int
+    player_name: Optional[str] = None
+    first: ConflictMatch
+    second: ConflictMatch
+
+
+class TournamentConflicts(BaseModel):
+    tournament_id: int
+    match_count: int
+    player_count: int
+    conflicts: List[PlayerConflict]
@@ -1,6 +1,7 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
+from schemas.schedule import MatchMove
 
 
 class VenueBase(BaseModel):
@@ -22,3 +23,44 @@ class VenueResponse(VenueBase):
     
     class Config:
         from_attributes = True
+
+
+class VenueBooking(BaseModel):
+    match_id: Optional[int] = None
+    blackout_id: Optional[int] = None  # Set instead of match_id while the venue is closed
+    start: datetime
+    end: datetime
+
+
+class VenuePeriod(BaseModel):
+    start: datetime
+    end: datetime
+
+
+class VenueAvailability(BaseModel):
+    venue_id: int
+    start: datetime
+    end: datetime
+    bookings: List[VenueBooking]
+    free: List[VenuePeriod]  # Gaps a match can be placed in, changeover already left around bookings
+
+
+class VenueBlackoutCreate(BaseModel):
+    start_time: datetime
+    end_time: datetime
+    reason: Optional[str] = None
+
+
+class VenueBlackoutResponse(VenueBlackoutCreate):
+    id: int
+    venue_id: int
+    created_by: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class VenueBlackoutResult(BaseModel):
+    blackout: VenueBlackoutResponse
+    moves: List[MatchMove]  # Matches moved out of the closed window
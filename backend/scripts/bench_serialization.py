@@ -0,0 +1,118 @@
+"""
+Microbenchmark: per-item cost of serializing match lists.
+Compares the ORM + Pydantic from_attributes + stdlib json path with the
+column tuple + RowSerializer + fast encoder path used by GET /matches.
+
+Run from backend/: python -m scripts.bench_serialization [items] [repeats]
+Uses a throwaway in-memory SQLite database, never the configured one.
+"""
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, aliased
+from database import Base
+from models.auth import User, UserRole
+from models.institution import Institution
+from models.sport import Sport, SportType
+from models.team import Team
+from models.match import Match, MatchStatus
+from schemas.match import MatchResponse
+from schemas.sport import SportResponse
+from schemas.team import TeamResponse
+from services.serialization import RowSerializer, dumps, orjson
+
+
+def build_fixture(db, items: int):
+    institution = Institution(name="Bench University", code="BU")
+    db.add(institution)
+    db.flush()
+    organizer = User(email="bench@bu.edu", username="bench", hashed_password="x",
+                     role=UserRole.ORGANIZER, institution_id=institution.id)
+    db.add(organizer)
+    db.flush()
+    sport = Sport(name="Football", code="FOOTBALL", sport_type=SportType.TEAM,
+                  rules="[\"Offside rule applies\"]" * 10, match_config="{\"periods\": 2}",
+                  institution_id=institution.id, organizer_id=organizer.id)
+    db.add(sport)
+    db.flush()
+    teams = [Team(name=f"Team {i}", code=f"T{i}", institution_id=institution.id, sport_id=sport.id)
+             for i in range(20)]
+    db.add_all(teams)
+    db.flush()
+    start = datetime(2026, 1, 1, 9, 0)
+    db.add_all([
+        Match(match_number=f"M{i:04d}", scheduled_time=start + timedelta(hours=i),
+              status=MatchStatus.SCHEDULED, sport_id=sport.id,
+              home_team_id=teams[i % 20].id, away_team_id=teams[(i + 1) % 20].id,
+              created_by=organizer.id)
+        for i in range(items)
+    ])
+    db.commit()
+
+
+def pydantic_path(db, items: int) -> bytes:
+    matches = db.query(Match).limit(items).all()
+    payload = [MatchResponse.model_validate(match).model_dump(mode="json") for match in matches]
+    return json.dumps(payload).encode()
+
+
+def row_path(db, items: int, serializer: RowSerializer, home, away) -> bytes:
+    rows = db.query(*serializer.columns).outerjoin(
+        Sport, Sport.id == Match.sport_id
+    ).outerjoin(
+        home, home.id == Match.home_team_id
+    ).outerjoin(
+        away, away.id == Match.away_team_id
+    ).limit(items).all()
+    return dumps(serializer.serialize_all(rows))
+
+
+def timed(label: str, fn, items: int, repeats: int) -> float:
+    fn()  # warm up caches and compiled statements
+    started = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    elapsed = time.perf_counter() - started
+    per_item_us = elapsed / (repeats * items) * 1_000_000
+    print(f"{label:<40} {per_item_us:8.2f} us/item")
+    return per_item_us
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        build_fixture(db, items)
+
+    home, away = aliased(Team), aliased(Team)
+    serializer = RowSerializer(MatchResponse, Match, nested={
+        "sport": (SportResponse, Sport),
+        "home_team": (TeamResponse, home),
+        "away_team": (TeamResponse, away)
+    })
+
+    print(f"{items} matches per response, {repeats} repeats, encoder: {'orjson' if orjson else 'json'}")
+
+    def run_pydantic():
+        # Fresh session each time: the endpoint never sees a warm identity map
+        with Session() as db:
+            return pydantic_path(db, items)
+
+    def run_rows():
+        with Session() as db:
+            return row_path(db, items, serializer, home, away)
+
+    assert json.loads(run_pydantic()) == json.loads(run_rows()), "serializers disagree"
+    slow = timed("ORM + Pydantic + json", run_pydantic, items, repeats)
+    fast = timed("row tuples + RowSerializer + encoder", run_rows, items, repeats)
+    print(f"speedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+iCalendar (RFC 5545) rendering for match feeds.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+
+PRODID = "-//Uni Arena//Match Calendar//EN"
+
+
+def _escape(text: str) -> str:
+    """Escape a TEXT property value"""
+    return (
+        text.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets as the spec requires"""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line
+    parts = []
+    limit = 75
+    while encoded:
+        cut = min(limit, len(encoded))
+        while cut < len(encoded) and (encoded[cut] & 0xC0) == 0x80:  # Never split a UTF-8 sequence
+            cut -= 1
+        parts.append(encoded[:cut].decode("utf-8"))
+        encoded = encoded[cut:]
+        limit = 74  # Continuation lines start with a space
+    return "\r\n ".join(parts)
+
+
+def format_utc(value: datetime) -> str:
+    """UTC date-time form (naive values are stored as UTC)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def match_event(
+    match_id: int,
+    summary: str,
+    start: datetime,
+    end: Optional[datetime],
+    stamp: datetime,
+    location: Optional[str] = None,
+    description: Optional[str] = None,
+    status: str = "CONFIRMED",
+    duration: timedelta = timedelta(hours=2)
+) -> List[str]:
+    """Content lines of one VEVENT"""
+    if end is None or end <= start:
+        end = start + duration
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:match-{match_id}@uni-arena",
+        f"DTSTAMP:{format_utc(stamp)}",
+        f"DTSTART:{format_utc(start)}",
+        f"DTEND:{format_utc(end)}",
+        f"SUMMARY:{_escape(summary)}",
+        f"STATUS:{status}",
+    ]
+    if location:
+        lines.append(f"LOCATION:{_escape(location)}")
+    if description:
+        lines.append(f"DESCRIPTION:{_escape(description)}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+def build_calendar(name: str, events: Iterable[List[str]]) -> bytes:
+    """Wrap events in a VCALENDAR and encode it"""
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape(name)}",
+    ]
+    for event in events:
+        lines.extend(event)
+    lines.append("END:VCALENDAR")
+    return ("\r\n".join(_fold(line) for line in lines) + "\r\n").encode("utf-8")
@@ -0,0 +1,115 @@
+"""
+Response compression helpers shared by the compression middleware and cached payloads.
+gzip is always available; Brotli is used when the brotli (or brotlicffi) package is installed.
+"""
+import gzip
+import threading
+import zlib
+from typing import Dict, Optional
+from starlette.requests import Request
+from starlette.responses import Response
+from config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli
+    except ImportError:
+        brotli = None
+
+BROTLI_AVAILABLE = brotli is not None
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported content-coding from an Accept-Encoding header, or None for identity"""
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        token, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if token:
+            accepted[token.strip()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    if BROTLI_AVAILABLE and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def is_compressible(content_type: Optional[str]) -> bool:
+    """Whether a response of this content type is on the compression allowlist"""
+    if not content_type:
+        return False
+    return content_type.split(";", 1)[0].strip().lower() in settings.COMPRESSION_CONTENT_TYPES
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """Compress a complete body with the given content-coding"""
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.GZIP_LEVEL)
+
+
+class StreamCompressor:
+    """Incremental compressor that flushes after every chunk so streamed responses stay progressive"""
+
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=settings.BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(settings.GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class CompressedPayload:
+    """
+    A serialized response body stored together with its compressed variants.
+    Cached payloads are compressed at most once per encoding, however many clients read them.
+    """
+
+    def __init__(self, body: bytes, media_type: str = "application/json"):
+        self.body = body
+        self.media_type = media_type
+        self._encoded: Dict[str, bytes] = {}
+        self._lock = threading.Lock()
+
+    def encoded(self, encoding: str) -> bytes:
+        data = self._encoded.get(encoding)
+        if data is None:
+            with self._lock:
+                data = self._encoded.get(encoding)
+                if data is None:
+                    data = compress(self.body, encoding)
+                    self._encoded[encoding] = data
+        return data
+
+    def response(self, request: Request, status_code: int = 200, headers: Optional[Dict[str, str]] = None) -> Response:
+        """Build a response in the best encoding the client accepts"""
+        headers = dict(headers or {})
+        encoding = None
+        if len(self.body) >= settings.COMPRESSION_MINIMUM_SIZE and is_compressible(self.media_type):
+            encoding = negotiate_encoding(request.headers.get("accept-encoding", ""))
+            headers["Vary"] = "Accept-Encoding"
+        if encoding is None:
+            return Response(content=self.body, status_code=status_code, headers=headers, media_type=self.media_type)
+        headers["Content-Encoding"] = encoding
+        return Response(content=self.encoded(encoding), status_code=status_code, headers=headers,
+                        media_type=self.media_type)
@@ -0,0 +1,128 @@
+"""
+Sparse fieldsets (?fields= / ?include=) for list and detail endpoints.
+The requested projection is pushed down into the SELECT column list: unrequested columns are
+never read and unrequested relationships are never joined.
+
+    ?fields=id,status,scheduled_time,home_team.name,away_team.name
+    ?include=sport,home_team
+
+`id` is always returned, at the top level and for every included relationship.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from services.serialization import RowSerializer, column_names
+
+# Distinct (fields, include) combinations kept compiled per resource
+MAX_CACHED_PROJECTIONS = 256
+
+
+class Projection:
+    """A compiled column list, the joins it needs and the serializer for its rows"""
+
+    def __init__(self, entity, top: List[str], groups: List[Tuple[str, Any, List[str]]], joins: List[Tuple[Any, Any]]):
+        self.entity = entity
+        self.joins = joins
+        self.serializer = RowSerializer.from_names(entity, top, groups)
+
+    def query(self, db: Session):
+        """Base query selecting exactly the projected columns"""
+        query = db.query(*self.serializer.columns).select_from(self.entity)
+        for target, onclause in self.joins:
+            query = query.outerjoin(target, onclause)
+        return query
+
+    def serialize_all(self, rows) -> List[Dict[str, Any]]:
+        return self.serializer.serialize_all(rows)
+
+
+class FieldsetSpec:
+    """
+    Describes which columns and relationships of a resource can be projected.
+    relations maps a response key to (response schema, entity or alias, join condition).
+    default_include lists the relationships returned when the client asks for nothing specific.
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        entity,
+        relations: Optional[Dict[str, Tuple[Type[BaseModel], Any, Any]]] = None,
+        default_include: Sequence[str] = ()
+    ):
+        self.entity = entity
+        self.columns = column_names(schema, entity)
+        self.relations = {
+            name: (target, onclause, column_names(target_schema, target))
+            for name, (target_schema, target, onclause) in (relations or {}).items()
+        }
+        self.default_include = tuple(default_include)
+        self._compiled: Dict[Tuple[str, str], Projection] = {}
+
+    def _bad_request(self, unknown: List[str]) -> HTTPException:
+        allowed = self.columns + [f"{name}.{column}" for name, (_, _, cols) in self.relations.items() for column in cols]
+        return HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field(s): {', '.join(unknown)}. Allowed: {', '.join(allowed)}"
+        )
+
+    def projection(self, fields: Optional[str] = None, include: Optional[str] = None) -> Projection:
+        """Compile (or reuse) the projection for a fields/include query string pair"""
+        key = ((fields or "").strip(), (include or "").strip())
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compile(*key)
+            if len(self._compiled) < MAX_CACHED_PROJECTIONS:
+                self._compiled[key] = compiled
+        return compiled
+
+    def _compile(self, fields: str, include: str) -> Projection:
+        requested_top: Optional[List[str]] = None
+        nested: Dict[str, Optional[List[str]]] = {}  # None means every column of the relation
+        unknown = []
+
+        for name in filter(None, (part.strip() for part in include.split(","))):
+            if name in self.relations:
+                nested.setdefault(name, None)
+            else:
+                unknown.append(name)
+
+        if fields:
+            requested_top = []
+            for token in filter(None, (part.strip() for part in fields.split(","))):
+                relation, _, column = token.partition(".")
+                if column:
+                    if relation in self.relations and column in self.relations[relation][2]:
+                        nested[relation] = (nested.get(relation) or []) + [column]
+                    else:
+                        unknown.append(token)
+                elif token in self.relations:
+                    nested.setdefault(token, None)
+                elif token in self.columns:
+                    requested_top.append(token)
+                else:
+                    unknown.append(token)
+        elif not include:
+            nested = {name: None for name in self.default_include}
+
+        if unknown:
+            raise self._bad_request(unknown)
+
+        if requested_top is None:
+            top = list(self.columns)
+        else:
+            top = ["id"] + [name for name in dict.fromkeys(requested_top) if name != "id"]
+
+        groups = []
+        joins = []
+        for name in self.relations:  # Stable relation order regardless of query string order
+            if name not in nested:
+                continue
+            target, onclause, all_columns = self.relations[name]
+            requested = nested[name]
+            columns = all_columns if requested is None else ["id"] + [c for c in dict.fromkeys(requested) if c != "id"]
+            groups.append((name, target, columns))
+            joins.append((target, onclause))
+
+        return Projection(self.entity, top, groups, joins)
@@ -0,0 +1,101 @@
+"""
+Sorted interval index for booking checks.
+Intervals are half-open [start, end). Ordinary ones (matches) are kept sorted by start, and an
+overlap query only looks at those starting in (start - longest ordinary interval, end), found
+by bisection. Intervals longer than long_after (multi-day blackouts) are kept apart in a short
+list that is checked directly, so one of them cannot widen every later scan. Lengths are
+counted, so removing the longest interval narrows the scan again.
+"""
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from datetime import timedelta
+from typing import Any, Hashable, List, Optional, Tuple
+
+Interval = Tuple[Any, Any, Optional[Hashable]]  # (start, end, key)
+
+LONG_INTERVAL = timedelta(hours=12)
+
+
+class IntervalIndex:
+    def __init__(self, long_after=LONG_INTERVAL):
+        self.long_after = long_after
+        self._starts: List[Any] = []
+        self._intervals: List[Interval] = []
+        self._lengths: Counter = Counter()  # length -> how many sorted intervals have it
+        self._longest = None
+        self._long: List[Interval] = []
+
+    def __len__(self) -> int:
+        return len(self._intervals) + len(self._long)
+
+    def add(self, start, end, key: Optional[Hashable] = None) -> None:
+        length = end - start
+        if length > self.long_after:
+            self._long.append((start, end, key))
+            return
+        index = bisect_right(self._starts, start)
+        self._starts.insert(index, start)
+        self._intervals.insert(index, (start, end, key))
+        self._lengths[length] += 1
+        if self._longest is None or length > self._longest:
+            self._longest = length
+
+    def remove(self, start, key: Hashable) -> bool:
+        """Remove the interval with this start and key; returns whether one was found"""
+        index = bisect_left(self._starts, start)
+        while index < len(self._starts) and self._starts[index] == start:
+            if self._intervals[index][2] == key:
+                _, end, _ = self._intervals[index]
+                del self._starts[index]
+                del self._intervals[index]
+                self._forget_length(end - start)
+                return True
+            index += 1
+        for position, interval in enumerate(self._long):
+            if interval[0] == start and interval[2] == key:
+                del self._long[position]
+                return True
+        return False
+
+    def _forget_length(self, length) -> None:
+        self._lengths[length] -= 1
+        if self._lengths[length] == 0:
+            del self._lengths[length]
+            if length == self._longest:
+                self._longest = max(self._lengths) if self._lengths else None
+
+    def overlapping(self, start, end) -> List[Interval]:
+        """Intervals sharing any time with [start, end), in start order"""
+        found = []
+        if self._intervals:
+            low = bisect_right(self._starts, start - self._longest)
+            high = bisect_left(self._starts, end)
+            found = [interval for interval in self._intervals[low:high] if interval[1] > start]
+        long = [interval for interval in self._long if interval[0] < end and interval[1] > start]
+        if long:
+            found = sorted(found + long, key=lambda interval: interval[0])
+        return found
+
+    def is_free(self, start, end, ignore: Optional[Hashable] = None) -> bool:
+        """Whether [start, end) overlaps nothing (other than the interval keyed ignore)"""
+        return all(key is not None and key == ignore for _, _, key in self.overlapping(start, end))
+
+    def intervals(self) -> List[Interval]:
+        if not self._long:
+            return list(self._intervals)
+        return sorted(self._intervals + self._long, key=lambda interval: interval[0])
+
+
+def build_index(intervals, long_after=LONG_INTERVAL) -> IntervalIndex:
+    """Index from (start, end, key) triples, sorted once instead of inserted one by one"""
+    index = IntervalIndex(long_after)
+    ordered = []
+    for interval in intervals:
+        (index._long if interval[1] - interval[0] > long_after else ordered).append(interval)
+    ordered.sort(key=lambda interval: interval[0])
+    index._intervals = ordered
+    index._starts = [interval[0] for interval in ordered]
+    index._lengths = Counter(end - start for start, end, _ in ordered)
+    if ordered:
+        index._longest = max(index._lengths)
+    return index
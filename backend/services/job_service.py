@@ -0,0 +1,273 @@
+"""
+Background schedule generation and statistics reconciliation.
+A job is split into parts that run on a shared thread pool, each with its own database
+session, and reports status and progress through an in-memory registry polled at
+GET /jobs/{id}. Like the other in-process caches, the registry is per worker process.
+Schedules whose sports share venues run in the same part, one after another, so they see
+each other's bookings; so do schedules of one tournament that share players, so each sees
+the other's matches when keeping a player's sports apart. Other parts run in parallel.
+"""
+import enum
+import logging
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+from fastapi import HTTPException, status
+from sqlalchemy import delete, insert
+from sqlalchemy.orm import Session
+from config import settings
+from database import SessionLocal
+from models.match import Match, MatchParticipation
+from models.schedule import Schedule
+from models.standing import Standing
+from models.sport import Sport
+from models.tombstone import Tombstone
+from services.cache import TTLCache
+from services.match_statistics import reconcile_statistics
+from services.scheduling_service import GenerationProgress, create_generated_schedule, load_participants
+from services.player_conflicts import conflicts_changed, participant_players
+from services.venue_bookings import reload_after_commit
+from services.venue_scheduler import resolve_venue_ids
+
+logger = logging.getLogger(__name__)
+
+executor = ThreadPoolExecutor(max_workers=settings.JOB_WORKERS, thread_name_prefix="jobs")
+jobs = TTLCache(ttl_seconds=settings.JOB_RESULT_SECONDS, max_entries=10000)
+
+
+class JobStatus(str, enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job:
+    """State of one job; updated from worker threads through its lock"""
+
+    def __init__(self, kind: str, owner_id: int, schedules: List[Dict], parts: int):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.owner_id = owner_id
+        self.status = JobStatus.QUEUED
+        self.done = 0
+        self.total = 0  # Grows as each schedule is planned
+        self.schedules = [
+            {"name": data["name"], "sport_id": data["sport_id"], "status": JobStatus.QUEUED,
+             "schedule_id": None, "match_count": 0, "error": None}
+            for data in schedules
+        ]
+        self.result: Optional[Dict] = None  # Outcome of jobs that don't generate schedules
+        self.error: Optional[str] = None
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._planned: Dict[int, int] = {}
+        self._pending_parts = parts
+        self._lock = threading.Lock()
+
+    def mark_running(self) -> None:
+        with self._lock:
+            self._mark_running()
+
+    def _mark_running(self) -> None:
+        if self.started_at is None:
+            self.started_at = datetime.utcnow()
+            self.status = JobStatus.RUNNING
+
+    def update_schedule(self, index: int, **fields) -> None:
+        with self._lock:
+            self._mark_running()
+            self.schedules[index].update(fields)
+
+    def set_result(self, result: Optional[Dict] = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self.result = result
+            self.error = error
+
+    def add_progress(self, index: int, planned: int = 0, written: int = 0) -> None:
+        with self._lock:
+            self.total += planned
+            self.done += written
+            self._planned[index] = self._planned.get(index, 0) + planned
+            self.schedules[index]["match_count"] += written
+
+    def fail_schedule(self, index: int, error: str) -> None:
+        """Mark a schedule failed; its discarded matches no longer count as progress"""
+        with self._lock:
+            entry = self.schedules[index]
+            self.total -= self._planned.pop(index, 0)
+            self.done -= entry["match_count"]
+            entry.update(status=JobStatus.FAILED, error=error, schedule_id=None, match_count=0)
+
+    def part_finished(self) -> None:
+        with self._lock:
+            self._pending_parts -= 1
+            if self._pending_parts > 0:
+                return
+            failed = self.error is not None or any(entry["status"] == JobStatus.FAILED for entry in self.schedules)
+            self.status = JobStatus.FAILED if failed else JobStatus.SUCCEEDED
+            self.finished_at = datetime.utcnow()
+        jobs.set(self.id, self)  # Finished jobs stay queryable for JOB_RESULT_SECONDS from now
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            return {
+                "id": self.id,
+                "kind": self.kind,
+                "status": self.status,
+                "done": self.done,
+                "total": self.total,
+                "schedules": [dict(entry) for entry in self.schedules],
+                "result": self.result,
+                "error": self.error,
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at,
+            }
+
+
+class JobProgress(GenerationProgress):
+    """Commits every chunk of generated matches and reports it to the job"""
+    chunk_size = settings.JOB_COMMIT_CHUNK_SIZE
+
+    def __init__(self, job: Job, index: int, db: Session):
+        self.job = job
+        self.index = index
+        self.db = db
+        self.schedule_id: Optional[int] = None
+
+    def planned(self, schedule_id: int, count: int) -> None:
+        self.schedule_id = schedule_id
+        self.job.add_progress(self.index, planned=count)
+
+    def written(self, count: int) -> None:
+        self.db.commit()
+        self.job.add_progress(self.index, written=count)
+
+
+def discard_schedule(schedule_id: int) -> None:
+    """Remove a partly committed schedule and its matches after a failed generation"""
+    with SessionLocal() as db:
+        rows = db.query(Match.id, Match.venue_id).filter(Match.schedule_id == schedule_id).all()
+        match_ids = [match_id for match_id, _ in rows]
+        if match_ids:
+            db.execute(delete(MatchParticipation).where(MatchParticipation.match_id.in_(match_ids)))
+            db.execute(delete(Match).where(Match.id.in_(match_ids)))
+            # Bulk deletes bypass the ORM tombstone hook; sync clients may already have these rows
+            db.execute(insert(Tombstone), [{"entity_type": "matches", "entity_id": match_id} for match_id in match_ids])
+            reload_after_commit(db, {venue_id for _, venue_id in rows})
+            conflicts_changed(db)
+        db.execute(delete(Standing).where(Standing.schedule_id == schedule_id))
+        db.execute(delete(Schedule).where(Schedule.id == schedule_id))
+        db.commit()
+
+
+def generate_schedules(job: Job, entries: List[tuple]) -> None:
+    """One part of a job: generate (index, ScheduleCreate fields) entries in order"""
+    try:
+        for index, schedule_data in entries:
+            job.update_schedule(index, status=JobStatus.RUNNING)
+            db = SessionLocal()
+            progress = JobProgress(job, index, db)
+            try:
+                schedule = create_generated_schedule(db, schedule_data, progress)
+                db.commit()
+                job.update_schedule(index, status=JobStatus.SUCCEEDED, schedule_id=schedule.id)
+            except Exception as exc:
+                db.rollback()
+                if isinstance(exc, HTTPException):
+                    error = str(exc.detail)
+                else:
+                    logger.exception("Schedule generation failed")
+                    error = "Internal error while generating the schedule"
+                if progress.schedule_id is not None:
+                    discard_schedule(progress.schedule_id)
+                job.fail_schedule(index, error)
+            finally:
+                db.close()
+    finally:
+        job.part_finished()
+
+
+def plan_parts(db: Session, schedules: List[Dict]) -> List[List[tuple]]:
+    """
+    Group schedules into parts that are safe to run in parallel: schedules of the same sport,
+    whose venues overlap, or that share players within a tournament end up in the same part
+    (in request order).
+    """
+    sport_ids = {data["sport_id"] for data in schedules}
+    sports = {sport.id: sport for sport in db.query(Sport).filter(Sport.id.in_(sport_ids))}
+    missing = sport_ids - sports.keys()
+    if missing:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Sport not found: {', '.join(str(sport_id) for sport_id in sorted(missing))}"
+        )
+
+    # Union-find over schedule indexes, joined through shared sports, venues and tournament players
+    parent = list(range(len(schedules)))
+
+    def find(index):
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    owner_of: Dict[tuple, int] = {}
+    for index, data in enumerate(schedules):
+        keys = [("sport", data["sport_id"])]
+        keys += [("venue", venue_id) for venue_id in resolve_venue_ids(db, sports[data["sport_id"]], data.get("venue_ids"))]
+        if data.get("tournament_id") is not None:
+            sport = sports[data["sport_id"]]
+            participants = load_participants(db, sport, data.get("team_ids"), data.get("player_ids"))
+            keys += [
+                ("player", data["tournament_id"], player_id)
+                for player_ids in participant_players(db, sport, participants).values() for player_id in player_ids
+            ]
+        for key in keys:
+            if key in owner_of:
+                parent[find(index)] = find(owner_of[key])
+            else:
+                owner_of[key] = index
+
+    parts: Dict[int, List[tuple]] = {}
+    for index, data in enumerate(schedules):
+        parts.setdefault(find(index), []).append((index, data))
+    return list(parts.values())
+
+
+def submit_schedule_job(db: Session, owner_id: int, schedules: List[Dict]) -> Job:
+    """Register a job generating these schedules and start it; returns immediately"""
+    parts = plan_parts(db, schedules)
+    job = Job("schedules", owner_id, schedules, parts=len(parts))
+    jobs.set(job.id, job)
+    for entries in parts:
+        executor.submit(generate_schedules, job, entries)
+    return job
+
+
+def reconcile_statistics_job(job: Job, repair: bool) -> None:
+    """Verify team and player statistics against a full recompute, repairing drifted rows if asked"""
+    try:
+        job.mark_running()
+        with SessionLocal() as db:
+            report = reconcile_statistics(db, repair)
+            if repair:
+                db.commit()
+        job.set_result(result=report)
+    except Exception:
+        logger.exception("Statistics reconciliation failed")
+        job.set_result(error="Internal error while reconciling statistics")
+    finally:
+        job.part_finished()
+
+
+def submit_statistics_reconciliation(owner_id: int, repair: bool = False) -> Job:
+    """Register a statistics reconciliation job and start it; returns immediately"""
+    job = Job("statistics", owner_id, [], parts=1)
+    jobs.set(job.id, job)
+    executor.submit(reconcile_statistics_job, job, repair)
+    return job
@@ -0,0 +1,135 @@
+"""
+Side effects of a match being completed.
+Every code path that sets a match to COMPLETED goes through complete_match, so follow-up
+work (bracket advancement, standings, team and player statistics, group qualifiers, the next
+Swiss round, ...) happens once and in the caller's transaction.
+The score counted in the standings and statistics is kept on the match (result_home_score/
+result_away_score), so completing a match again, or reopening it, first takes that result back out.
+"""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from models.match import Match, MatchParticipation, MatchStatus
+from models.score import Score
+from services.match_statistics import record_match_statistics
+from services.scheduling_service import advance_group_stage, advance_swiss_schedule
+from services.standings import record_result
+
+
+def match_winner_side(db: Session, match: Match) -> Optional[str]:
+    """Winning side ("home"/"away") from the current score, None for a draw or no score"""
+    score = db.query(Score.home_score, Score.away_score).filter(Score.match_id == match.id).first()
+    if score is None or score.home_score == score.away_score:
+        return None
+    return "home" if score.home_score > score.away_score else "away"
+
+
+def advance_winner(db: Session, match: Match, side: str) -> None:
+    """Place the winner into its slot of the next bracket match (a primary-key lookup)"""
+    next_match = db.get(Match, match.next_match_id)
+    if next_match is None:
+        return
+    slot = match.next_match_slot or "home"
+    if match.home_team_id is not None or match.away_team_id is not None:
+        winner_team_id = match.home_team_id if side == "home" else match.away_team_id
+        setattr(next_match, f"{slot}_team_id", winner_team_id)
+        return
+
+    # Individual sports: sides are participations
+    winner = db.query(MatchParticipation.player_id).filter(
+        MatchParticipation.match_id == match.id,
+        MatchParticipation.is_home == (side == "home")
+    ).scalar()
+    if winner is None:
+        return
+    is_home = slot == "home"
+    existing = db.query(MatchParticipation).filter(
+        MatchParticipation.match_id == next_match.id,
+        MatchParticipation.is_home == is_home
+    ).first()
+    if existing:
+        existing.player_id = winner
+    else:
+        db.add(MatchParticipation(match_id=next_match.id, player_id=winner, is_home=is_home))
+
+
+def clear_slot(db: Session, match: Match) -> None:
+    """Empty the next bracket match's slot that this match feeds"""
+    next_match = db.get(Match, match.next_match_id)
+    if next_match is None:
+        return
+    slot = match.next_match_slot or "home"
+    if match.home_team_id is not None or match.away_team_id is not None:
+        setattr(next_match, f"{slot}_team_id", None)
+        return
+    db.query(MatchParticipation).filter(
+        MatchParticipation.match_id == next_match.id,
+        MatchParticipation.is_home == (slot == "home")
+    ).delete(synchronize_session=False)
+
+
+def correct_result(db: Session, match: Match) -> None:
+    """
+    Follow a score change of a completed match (call once the new score is flushed): the old
+    result is taken out of the standings and statistics and the new one counted, and the winner
+    is placed again, or the slot emptied if the result is now a draw, as long as the next match
+    has not started. Does not commit.
+    """
+    if match.status != MatchStatus.COMPLETED:
+        return
+    apply_result(db, match)
+    if match.next_match_id is None:
+        return
+    next_status = db.query(Match.status).filter(Match.id == match.next_match_id).scalar()
+    if next_status not in (MatchStatus.SCHEDULED, MatchStatus.POSTPONED):
+        return
+    side = match_winner_side(db, match)
+    if side is None:
+        clear_slot(db, match)
+    else:
+        advance_winner(db, match, side)
+
+
+def revert_result(db: Session, match: Match) -> None:
+    """Take the match's counted result back out of the standings and statistics. Does not commit"""
+    if match.result_home_score is None or match.result_away_score is None:
+        return
+    record_match_statistics(db, match, match.result_home_score, match.result_away_score, sign=-1)
+    record_result(db, match, match.result_home_score, match.result_away_score, sign=-1)
+    match.result_home_score = match.result_away_score = None
+    db.flush()  # Statistics rows hold pending SQL increments; a re-count must not replace them
+
+
+def apply_result(db: Session, match: Match) -> None:
+    """Count the current score in the standings and statistics, replacing any result counted before. Does not commit"""
+    revert_result(db, match)
+    score = db.query(Score.home_score, Score.away_score).filter(Score.match_id == match.id).first()
+    if score is None or score.home_score is None or score.away_score is None:
+        return
+    record_match_statistics(db, match, score.home_score, score.away_score)
+    record_result(db, match, score.home_score, score.away_score)
+    match.result_home_score, match.result_away_score = score.home_score, score.away_score
+
+
+def complete_match(db: Session, match: Match) -> None:
+    """
+    Mark a match COMPLETED and run completion side effects. Does not commit.
+    A drawn knockout match is completed but nobody advances until the result is corrected
+    (correct_result, from the score endpoints).
+    """
+    was_completed = match.status == MatchStatus.COMPLETED
+    match.status = MatchStatus.COMPLETED
+    if not match.actual_end_time:
+        match.actual_end_time = datetime.utcnow()
+    apply_result(db, match)
+    if was_completed:
+        return
+
+    if match.next_match_id is not None:
+        side = match_winner_side(db, match)
+        if side is not None:
+            advance_winner(db, match, side)
+    if match.schedule_id is not None and match.group_number is not None:
+        advance_group_stage(db, match.schedule_id, match.group_number)
+    elif match.schedule_id is not None and match.round_number is not None:
+        advance_swiss_schedule(db, match.schedule_id, match.round_number)
@@ -0,0 +1,309 @@
+"""
+Automatic match lifecycle.
+A background thread keeps the upcoming deadlines of scheduled and live matches in a heap:
+a reminder at each lead time before kick-off, LIVE once kick-off plus a grace window has
+passed, and COMPLETED once the expected end plus a grace window has passed. It sleeps until
+the earliest deadline instead of scanning matches every tick. Bracket and group matches
+without a score are left LIVE for an organizer to enter the result, since completing them
+would advance nobody and skip the table.
+The heap is refilled from one range read on (status, scheduled_time) every
+LIFECYCLE_REFRESH_SECONDS, and sooner after a commit that changes a match. Every action
+re-reads its row and claims it with a conditional UPDATE, so stale heap entries are skipped
+and several worker processes never double-send a reminder.
+"""
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+from sqlalchemy import event, func, insert, or_, update
+from sqlalchemy.orm import Session
+from config import settings
+from database import SessionLocal
+from models.match import Match, MatchParticipation, MatchStatus
+from models.notification import Notification, NotificationType
+from models.player import Player
+from models.score import Score
+from models.team import Team
+from services.match_completion import complete_match
+from services.score_history import invalidate_score_cache
+from services.venue_bookings import naive_utc
+from services.venue_scheduler import expected_end
+
+logger = logging.getLogger(__name__)
+
+# session.info key set when a flush changed a match, so the heap is refilled after commit
+CHANGED_KEY = "match_lifecycle_changed"
+
+REMIND, GO_LIVE, CLOSE = "remind", "live", "close"
+
+Deadline = Tuple[datetime, int, str]  # (when, match_id, action)
+
+
+def reminder_leads() -> List[timedelta]:
+    """Configured lead times, longest first: reminder level n is sent at kick-off minus leads[n - 1]"""
+    return [timedelta(minutes=minutes) for minutes in sorted(set(settings.MATCH_REMINDER_LEAD_MINUTES), reverse=True)]
+
+
+def due_reminder_level(start: datetime, now: datetime) -> int:
+    """Highest reminder level whose lead time has been reached (0 if none, or the match has started)"""
+    if now >= start:
+        return 0
+    level = 0
+    for index, lead in enumerate(reminder_leads(), 1):
+        if start - lead <= now:
+            level = index
+    return level
+
+
+def close_deadline(start: datetime, end: Optional[datetime]) -> datetime:
+    """When a live match is completed automatically"""
+    return expected_end(start, end) + timedelta(minutes=settings.LIFECYCLE_CLOSE_GRACE_MINUTES)
+
+
+def reminder_recipients(db: Session, match: Match) -> List[int]:
+    """Users to remind: the teams' coaches and active players, or an individual match's players"""
+    team_ids = [team_id for team_id in (match.home_team_id, match.away_team_id) if team_id is not None]
+    user_ids = set()
+    if team_ids:
+        user_ids.update(coach_id for (coach_id,) in db.query(Team.coach_id).filter(
+            Team.id.in_(team_ids), Team.coach_id.isnot(None)
+        ))
+        user_ids.update(user_id for (user_id,) in db.query(Player.user_id).filter(
+            Player.team_id.in_(team_ids), Player.is_active == True
+        ))
+    user_ids.update(user_id for (user_id,) in db.query(Player.user_id).join(
+        MatchParticipation, MatchParticipation.player_id == Player.id
+    ).filter(MatchParticipation.match_id == match.id))
+    return sorted(user_ids)
+
+
+def match_label(db: Session, match: Match) -> str:
+    """"Home vs Away" for team matches, the match number otherwise"""
+    team_ids = [team_id for team_id in (match.home_team_id, match.away_team_id) if team_id is not None]
+    if len(team_ids) == 2:
+        names = dict(db.query(Team.id, Team.name).filter(Team.id.in_(team_ids)).all())
+        return f"{names.get(match.home_team_id)} vs {names.get(match.away_team_id)}"
+    return f"Match {match.match_number or match.id}"
+
+
+def has_result(db: Session, match_id: int) -> bool:
+    """Whether both sides of the match have a score"""
+    return db.query(Score.id).filter(
+        Score.match_id == match_id, Score.home_score.isnot(None), Score.away_score.isnot(None)
+    ).first() is not None
+
+
+class MatchLifecycle:
+    """Deadline heap and the thread that acts on it"""
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self.heap: List[Deadline] = []
+        self.wake = threading.Event()
+        self.stopping = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.last_reload: Optional[datetime] = None
+        self.reload_requested = False
+
+    def start(self) -> None:
+        if self.thread is not None and self.thread.is_alive():
+            return
+        self.stopping.clear()
+        self.thread = threading.Thread(target=self.run, name="match-lifecycle", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        self.stopping.set()
+        self.wake.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+
+    def request_reload(self) -> None:
+        """Refill the heap soon (matches were created, moved or changed status)"""
+        self.reload_requested = True
+        self.wake.set()
+
+    def run(self) -> None:
+        while not self.stopping.is_set():
+            now = datetime.utcnow()
+            try:
+                if self.reload_due(now):
+                    self.reload(now)
+                self.fire_due(now)
+            except Exception:
+                logger.exception("Match lifecycle sweep failed")
+            self.wake.wait(self.sleep_seconds(datetime.utcnow()))
+            self.wake.clear()
+
+    def reload_due(self, now: datetime) -> bool:
+        if self.last_reload is None:
+            return True
+        if self.reload_requested and now >= self.last_reload + timedelta(seconds=settings.LIFECYCLE_MIN_RELOAD_SECONDS):
+            return True
+        return now >= self.last_reload + timedelta(seconds=settings.LIFECYCLE_REFRESH_SECONDS)
+
+    def sleep_seconds(self, now: datetime) -> float:
+        """Until the earliest deadline or the next refill, whichever comes first"""
+        wake_at = self.last_reload + timedelta(seconds=settings.LIFECYCLE_REFRESH_SECONDS)
+        if self.reload_requested:
+            wake_at = min(wake_at, self.last_reload + timedelta(seconds=settings.LIFECYCLE_MIN_RELOAD_SECONDS))
+        if self.heap:
+            wake_at = min(wake_at, self.heap[0][0])
+        return max((wake_at - now).total_seconds(), 0.0)
+
+    def reload(self, now: datetime) -> None:
+        """
+        Rebuild the heap from matches that can reach a deadline before the next refill: scheduled
+        ones kicking off within the longest reminder lead (and not older than the lookback), and
+        every live one. Both are range reads on the (status, scheduled_time) index.
+        """
+        self.reload_requested = False
+        self.last_reload = now
+        leads = reminder_leads()
+        horizon = now + timedelta(seconds=settings.LIFECYCLE_REFRESH_SECONDS) + (leads[0] if leads else timedelta())
+        live_grace = timedelta(minutes=settings.LIFECYCLE_LIVE_GRACE_MINUTES)
+        heap: List[Deadline] = []
+        db = self.session_factory()
+        try:
+            scheduled = db.query(Match.id, Match.scheduled_time, Match.reminder_level).filter(
+                Match.status == MatchStatus.SCHEDULED,
+                Match.scheduled_time >= now - timedelta(hours=settings.LIFECYCLE_LOOKBACK_HOURS),
+                Match.scheduled_time < horizon
+            )
+            for match_id, start, reminder_level in scheduled:
+                start = naive_utc(start)
+                heap.append((start + live_grace, match_id, GO_LIVE))
+                for lead in leads[reminder_level or 0:]:
+                    heap.append((max(start - lead, now), match_id, REMIND))
+            live = db.query(Match.id, Match.scheduled_time, Match.expected_end_time).filter(Match.status == MatchStatus.LIVE)
+            for match_id, start, end in live:
+                heap.append((close_deadline(naive_utc(start), naive_utc(end)), match_id, CLOSE))
+        finally:
+            db.close()
+        heapq.heapify(heap)
+        self.heap = heap
+
+    def fire_due(self, now: datetime) -> None:
+        """Act on every deadline that has passed, each in its own transaction"""
+        if not self.heap or self.heap[0][0] > now:
+            return
+        db = self.session_factory()
+        try:
+            while self.heap and self.heap[0][0] <= now:
+                _, match_id, action = heapq.heappop(self.heap)
+                try:
+                    if action == REMIND:
+                        self.send_reminder(db, match_id, now)
+                    elif action == GO_LIVE:
+                        self.go_live(db, match_id, now)
+                    else:
+                        self.close(db, match_id, now)
+                except Exception:
+                    db.rollback()
+                    logger.exception("Match lifecycle %s failed for match %s", action, match_id)
+        finally:
+            db.close()
+
+    def send_reminder(self, db: Session, match_id: int, now: datetime) -> None:
+        """Notify the match's coaches and players once per reached lead time"""
+        match = db.get(Match, match_id)
+        if match is None or match.status != MatchStatus.SCHEDULED:
+            return
+        level = due_reminder_level(naive_utc(match.scheduled_time), now)
+        if level == 0:
+            return
+        # Claim the level: only one sweep (in any process) sends it
+        claimed = db.execute(
+            update(Match).where(
+                Match.id == match_id,
+                Match.status == MatchStatus.SCHEDULED,
+                or_(Match.reminder_level.is_(None), Match.reminder_level < level)
+            ).values(reminder_level=level)
+        ).rowcount
+        if not claimed:
+            db.rollback()
+            return
+        recipients = reminder_recipients(db, match)
+        if recipients:
+            message = f"{match_label(db, match)} starts at {naive_utc(match.scheduled_time):%Y-%m-%d %H:%M} UTC"
+            db.execute(insert(Notification), [
+                {
+                    "user_id": user_id,
+                    "title": "Match Reminder",
+                    "message": message,
+                    "notification_type": NotificationType.MATCH_REMINDER,
+                    "link_url": f"/matches/{match_id}",
+                }
+                for user_id in recipients
+            ])
+        db.commit()
+
+    def go_live(self, db: Session, match_id: int, now: datetime) -> None:
+        """Flip a scheduled match to LIVE once kick-off plus the grace window has passed"""
+        row = db.query(Match.scheduled_time, Match.expected_end_time).filter(
+            Match.id == match_id, Match.status == MatchStatus.SCHEDULED
+        ).first()
+        if row is None:
+            return
+        start = naive_utc(row.scheduled_time)
+        if start + timedelta(minutes=settings.LIFECYCLE_LIVE_GRACE_MINUTES) > now:
+            return  # Moved later since the heap was filled; the refill has its new deadline
+        claimed = db.execute(
+            update(Match).where(Match.id == match_id, Match.status == MatchStatus.SCHEDULED).values(
+                status=MatchStatus.LIVE,
+                actual_start_time=func.coalesce(Match.actual_start_time, row.scheduled_time)
+            )
+        ).rowcount
+        db.commit()
+        if claimed:
+            invalidate_score_cache(match_id)
+            heapq.heappush(self.heap, (close_deadline(start, naive_utc(row.expected_end_time)), match_id, CLOSE))
+
+    def close(self, db: Session, match_id: int, now: datetime) -> None:
+        """Complete a live match once its expected end plus the grace window has passed"""
+        match = db.query(Match).filter(Match.id == match_id, Match.status == MatchStatus.LIVE).with_for_update().first()
+        if match is None:
+            db.rollback()
+            return
+        planned_end = expected_end(naive_utc(match.scheduled_time), naive_utc(match.expected_end_time))
+        if planned_end + timedelta(minutes=settings.LIFECYCLE_CLOSE_GRACE_MINUTES) > now:
+            db.rollback()
+            return
+        if (match.next_match_id is not None or match.group_number is not None) and not has_result(db, match_id):
+            db.rollback()
+            logger.debug("Match %s has no result; left live", match_id)
+            return
+        if not match.actual_end_time:
+            match.actual_end_time = planned_end  # Nobody ended it; the planned end is the best estimate
+        complete_match(db, match)
+        db.commit()
+        invalidate_score_cache(match_id)
+
+
+match_lifecycle = MatchLifecycle()
+
+
+@event.listens_for(Match.scheduled_time, "set")
+def reset_reminders(target, value, oldvalue, initiator):
+    """A moved match gets its reminders again, for the new time"""
+    if isinstance(oldvalue, datetime) and value != oldvalue:
+        target.reminder_level = 0
+
+
+@event.listens_for(Session, "after_flush")
+def collect_match_changes(session, flush_context):
+    if any(isinstance(obj, Match) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def refill_deadlines(session):
+    if session.info.pop(CHANGED_KEY, False) and match_lifecycle.thread is not None:
+        match_lifecycle.request_reload()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_match_changes(session, previous_transaction):
+    session.info.pop(CHANGED_KEY, None)
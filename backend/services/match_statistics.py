@@ -0,0 +1,175 @@
+"""
+Team and player statistics, maintained incrementally.
+complete_match adds each result to the rows of both teams and of the players on record for
+the match (individual-sport participations and line-ups), in the caller's transaction, and
+takes it back out (sign=-1) before counting a reopened or corrected match again.
+Only matches with a score count. reconcile_statistics recomputes every counter from completed
+matches with a few GROUP BY queries and reports, and optionally repairs, rows that drifted
+(e.g. a score corrected after completion).
+"""
+from typing import Dict, List, Tuple
+from sqlalchemy import case, func, select, union, union_all
+from sqlalchemy.orm import Session
+from models.lineup import Lineup, LineupPlayer
+from models.match import Match, MatchParticipation, MatchStatus
+from models.score import Score
+from models.statistics import PlayerStatistics, TeamStatistics
+
+COUNTERS = ("matches_played", "matches_won", "matches_drawn", "matches_lost")
+TEAM_COUNTERS = COUNTERS + ("goals_for", "goals_against")
+
+
+def outcome_column(scored: int, conceded: int) -> str:
+    if scored > conceded:
+        return "matches_won"
+    return "matches_drawn" if scored == conceded else "matches_lost"
+
+
+def add_result(
+    db: Session, model, key_column: str, rows: Dict[int, object], key: int, scored: int, conceded: int, sign: int = 1
+) -> None:
+    """
+    Add one result to a statistics row (sign=-1 subtracts it). Existing rows get SQL increments,
+    so two matches of the same team completing at once don't lose an update; missing rows are
+    created with the result.
+    """
+    outcome = outcome_column(scored, conceded)
+    row = rows.get(key)
+    if row is None:
+        if sign < 0:
+            return  # Nothing was counted
+        values = {column: 0 for column in COUNTERS}
+        values.update(matches_played=1, **{outcome: 1})
+        if model is TeamStatistics:
+            values.update(goals_for=scored, goals_against=conceded)
+        rows[key] = model(**{key_column: key}, **values)
+        db.add(rows[key])
+        return
+    row.matches_played = model.matches_played + sign
+    setattr(row, outcome, getattr(model, outcome) + sign)
+    if model is TeamStatistics:
+        row.goals_for = TeamStatistics.goals_for + sign * scored
+        row.goals_against = TeamStatistics.goals_against + sign * conceded
+
+
+def match_player_sides(db: Session, match: Match) -> Dict[int, bool]:
+    """Players on record for a match and whether they played for the home side"""
+    sides = dict(db.query(MatchParticipation.player_id, MatchParticipation.is_home).filter(
+        MatchParticipation.match_id == match.id
+    ).all())
+    for player_id, team_id in db.query(LineupPlayer.player_id, Lineup.team_id).join(
+        Lineup, Lineup.id == LineupPlayer.lineup_id
+    ).filter(Lineup.match_id == match.id):
+        sides.setdefault(player_id, team_id == match.home_team_id)
+    return sides
+
+
+def record_match_statistics(db: Session, match: Match, home_score: int, away_score: int, sign: int = 1) -> None:
+    """Add a match's result to its teams' and players' statistics (sign=-1 subtracts it). Does not commit"""
+    team_sides = [
+        (team_id, scored, conceded)
+        for team_id, scored, conceded in (
+            (match.home_team_id, home_score, away_score),
+            (match.away_team_id, away_score, home_score),
+        )
+        if team_id is not None
+    ]
+    if team_sides:
+        rows = {
+            row.team_id: row
+            for row in db.query(TeamStatistics).filter(TeamStatistics.team_id.in_([team_id for team_id, _, _ in team_sides]))
+        }
+        for team_id, scored, conceded in team_sides:
+            add_result(db, TeamStatistics, "team_id", rows, team_id, scored, conceded, sign)
+
+    player_sides = match_player_sides(db, match)
+    if player_sides:
+        rows = {
+            row.player_id: row
+            for row in db.query(PlayerStatistics).filter(PlayerStatistics.player_id.in_(list(player_sides)))
+        }
+        for player_id, is_home in player_sides.items():
+            scored, conceded = (home_score, away_score) if is_home else (away_score, home_score)
+            add_result(db, PlayerStatistics, "player_id", rows, player_id, scored, conceded, sign)
+
+
+def _aggregate(sides, key) -> select:
+    """Counters per key from (key, scored, conceded) rows: one GROUP BY"""
+    return select(
+        key,
+        func.count(),
+        func.sum(case((sides.c.scored > sides.c.conceded, 1), else_=0)),
+        func.sum(case((sides.c.scored == sides.c.conceded, 1), else_=0)),
+        func.sum(case((sides.c.scored < sides.c.conceded, 1), else_=0)),
+        func.sum(sides.c.scored),
+        func.sum(sides.c.conceded),
+    ).group_by(key)
+
+
+def recompute_team_statistics(db: Session) -> Dict[int, Tuple[int, ...]]:
+    """TEAM_COUNTERS per team from every completed, scored match"""
+    sides = union_all(*(
+        select(team_column.label("team_id"), scored_column.label("scored"), conceded_column.label("conceded")).join(
+            Score, Score.match_id == Match.id
+        ).where(Match.status == MatchStatus.COMPLETED, team_column.isnot(None))
+        for team_column, scored_column, conceded_column in (
+            (Match.home_team_id, Score.home_score, Score.away_score),
+            (Match.away_team_id, Score.away_score, Score.home_score),
+        )
+    )).subquery()
+    return {row[0]: tuple(row[1:]) for row in db.execute(_aggregate(sides, sides.c.team_id))}
+
+
+def recompute_player_statistics(db: Session) -> Dict[int, Tuple[int, ...]]:
+    """COUNTERS per player from every completed, scored match they are on record for"""
+    on_record = union(
+        select(MatchParticipation.match_id, MatchParticipation.player_id, MatchParticipation.is_home),
+        select(Lineup.match_id, LineupPlayer.player_id, (Lineup.team_id == Match.home_team_id).label("is_home")).join(
+            Lineup, Lineup.id == LineupPlayer.lineup_id
+        ).join(Match, Match.id == Lineup.match_id)
+    ).subquery()
+    sides = select(
+        on_record.c.player_id,
+        case((on_record.c.is_home, Score.home_score), else_=Score.away_score).label("scored"),
+        case((on_record.c.is_home, Score.away_score), else_=Score.home_score).label("conceded"),
+    ).join(Match, Match.id == on_record.c.match_id).join(Score, Score.match_id == Match.id).where(
+        Match.status == MatchStatus.COMPLETED
+    ).subquery()
+    return {row[0]: tuple(row[1:5]) for row in db.execute(_aggregate(sides, sides.c.player_id))}
+
+
+def _reconcile(db: Session, model, key_column: str, counters: Tuple[str, ...], expected: Dict[int, Tuple[int, ...]], repair: bool) -> List[Dict]:
+    mismatches = []
+    rows = {getattr(row, key_column): row for row in db.query(model)}
+    for key in sorted(rows.keys() | expected.keys()):
+        row = rows.get(key)
+        values = expected.get(key, (0,) * len(counters))
+        stored = tuple((getattr(row, column) or 0) if row is not None else 0 for column in counters)
+        if stored == tuple(values):
+            continue
+        mismatches.append({
+            key_column: key,
+            "stored": dict(zip(counters, stored)),
+            "expected": dict(zip(counters, values)),
+        })
+        if repair:
+            if row is None:
+                row = model(**{key_column: key})
+                db.add(row)
+            for column, value in zip(counters, values):
+                setattr(row, column, value)
+    return mismatches
+
+
+def reconcile_statistics(db: Session, repair: bool = False) -> Dict:
+    """
+    Compare every statistics row against a full recompute. With repair, drifted rows are set to
+    the recomputed values and missing ones created (the caller commits)
+    """
+    teams = _reconcile(db, TeamStatistics, "team_id", TEAM_COUNTERS, recompute_team_statistics(db), repair)
+    players = _reconcile(db, PlayerStatistics, "player_id", COUNTERS, recompute_player_statistics(db), repair)
+    return {
+        "team_mismatches": teams,
+        "player_mismatches": players,
+        "repaired": repair and bool(teams or players),
+    }
@@ -0,0 +1,186 @@
+"""
+Cross-sport player conflicts within a tournament.
+A player is in a match through their team (the home or away side), an individual-sport
+participation, or a lineup entry. The index maps every upcoming match of a tournament to its
+players and every player to their matches, so the generators can keep a player's sports
+apart and a validation pass can list every overlap with one sweep per player.
+Indexes are cached per tournament and dropped whenever a commit touches matches, players,
+participations or lineups.
+"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import event, func, select
+from sqlalchemy.orm import Session
+from config import settings
+from models.auth import User
+from models.lineup import Lineup, LineupPlayer
+from models.match import Match, MatchParticipation, MatchStatus
+from models.player import Player
+from models.schedule import Schedule
+from models.sport import Sport, SportType
+from services.cache import TTLCache
+from services.venue_bookings import naive_utc
+from services.venue_scheduler import SlotScheduler, expected_end
+
+conflict_indexes = TTLCache(ttl_seconds=settings.CONFLICT_INDEX_TTL_SECONDS, max_entries=100)
+_generation = [0]  # Bumped on every invalidation, so an index built across a commit is not cached
+
+# Matches that still take a player's time
+BUSY_STATUSES = (MatchStatus.SCHEDULED, MatchStatus.LIVE)
+
+# session.info key set when a flush or bulk write changed who plays when
+CHANGED_KEY = "player_conflicts_changed"
+TRACKED_MODELS = (Match, MatchParticipation, Player, Lineup, LineupPlayer)
+
+Booking = Tuple[datetime, datetime, int]  # (start, end, match_id)
+
+
+class PlayerConflictIndex:
+    """Player <-> match membership of a tournament's upcoming matches"""
+
+    def __init__(self, tournament_id: int):
+        self.tournament_id = tournament_id
+        self.matches: Dict[int, Tuple[datetime, datetime, int]] = {}  # match_id -> (start, end, sport_id)
+        self.match_players: Dict[int, Set[int]] = {}
+        self.player_matches: Dict[int, List[Booking]] = {}  # In start order
+        self.player_names: Dict[int, Optional[str]] = {}
+
+    def bookings(self, player_ids: Iterable[int]) -> List[Booking]:
+        """Every match of these players (each once)"""
+        seen = {}
+        for player_id in player_ids:
+            for booking in self.player_matches.get(player_id, ()):
+                seen[booking[2]] = booking
+        return list(seen.values())
+
+    def conflicts(self) -> List[Dict]:
+        """Every pair of a player's matches that overlap: a sweep over each player's sorted matches"""
+        found = []
+        for player_id, bookings in self.player_matches.items():
+            for index, (start, end, match_id) in enumerate(bookings):
+                for other_start, other_end, other_id in bookings[index + 1:]:
+                    if other_start >= end:
+                        break  # Sorted by start: nothing later overlaps this one
+                    found.append({
+                        "player_id": player_id,
+                        "player_name": self.player_names.get(player_id),
+                        "first": self._match_entry(match_id),
+                        "second": self._match_entry(other_id),
+                    })
+        return sorted(found, key=lambda conflict: (conflict["first"]["start"], conflict["player_id"]))
+
+    def _match_entry(self, match_id: int) -> Dict:
+        start, end, sport_id = self.matches[match_id]
+        return {"match_id": match_id, "sport_id": sport_id, "start": start, "end": end}
+
+
+def build_conflict_index(db: Session, tournament_id: int) -> PlayerConflictIndex:
+    """Index a tournament's upcoming matches with four queries (matches, team members, participations, lineups)"""
+    index = PlayerConflictIndex(tournament_id)
+    scope = select(Schedule.id).where(Schedule.tournament_id == tournament_id)
+    end_column = func.coalesce(Match.expected_end_time, Match.actual_end_time)
+    rows = db.query(
+        Match.id, Match.sport_id, Match.scheduled_time, end_column, Match.home_team_id, Match.away_team_id
+    ).filter(Match.schedule_id.in_(scope), Match.status.in_(BUSY_STATUSES)).all()
+
+    team_matches: Dict[int, List[int]] = {}
+    for match_id, sport_id, start, end, home_team_id, away_team_id in rows:
+        start = naive_utc(start)
+        index.matches[match_id] = (start, expected_end(start, naive_utc(end)), sport_id)
+        index.match_players[match_id] = set()
+        for team_id in (home_team_id, away_team_id):
+            if team_id is not None:
+                team_matches.setdefault(team_id, []).append(match_id)
+    if not rows:
+        return index
+
+    match_scope = select(Match.id).where(Match.schedule_id.in_(scope), Match.status.in_(BUSY_STATUSES))
+    members = db.query(Player.id, Player.team_id, User.full_name).join(User, User.id == Player.user_id).filter(
+        Player.team_id.in_(list(team_matches)), Player.is_active == True
+    )
+    for player_id, team_id, name in members:
+        index.player_names[player_id] = name
+        for match_id in team_matches[team_id]:
+            index.match_players[match_id].add(player_id)
+    entries = db.query(MatchParticipation.match_id, MatchParticipation.player_id).filter(
+        MatchParticipation.match_id.in_(match_scope)
+    ).union_all(
+        db.query(Lineup.match_id, LineupPlayer.player_id).join(LineupPlayer, LineupPlayer.lineup_id == Lineup.id).filter(
+            Lineup.match_id.in_(match_scope)
+        )
+    )
+    unnamed = set()
+    for match_id, player_id in entries:
+        if match_id in index.match_players:
+            index.match_players[match_id].add(player_id)
+            if player_id not in index.player_names:
+                unnamed.add(player_id)
+    if unnamed:
+        index.player_names.update(db.query(Player.id, User.full_name).join(User, User.id == Player.user_id).filter(
+            Player.id.in_(unnamed)
+        ).all())
+
+    for match_id, player_ids in index.match_players.items():
+        start, end, _ = index.matches[match_id]
+        for player_id in player_ids:
+            index.player_matches.setdefault(player_id, []).append((start, end, match_id))
+    for bookings in index.player_matches.values():
+        bookings.sort()
+    return index
+
+
+def get_conflict_index(db: Session, tournament_id: int) -> PlayerConflictIndex:
+    """The tournament's cached index, built on first use after a change"""
+    index = conflict_indexes.get(tournament_id)
+    if index is None:
+        generation = _generation[0]
+        index = build_conflict_index(db, tournament_id)
+        if _generation[0] == generation and not db.info.get(CHANGED_KEY):  # Committed state only
+            conflict_indexes.set(tournament_id, index)
+    return index
+
+
+def participant_players(db: Session, sport: Sport, participants: List[int]) -> Dict[int, Set[int]]:
+    """Players behind each participant: a team's active players, or the player itself"""
+    if sport.sport_type != SportType.TEAM:
+        return {player_id: {player_id} for player_id in participants}
+    players: Dict[int, Set[int]] = {team_id: set() for team_id in participants}
+    for player_id, team_id in db.query(Player.id, Player.team_id).filter(
+        Player.team_id.in_(participants), Player.is_active == True
+    ):
+        players[team_id].add(player_id)
+    return players
+
+
+def avoid_player_conflicts(db: Session, scheduler: SlotScheduler, sport: Sport, participants: List[int], tournament_id: int) -> None:
+    """Make the scheduler treat participants as busy whenever one of their players plays elsewhere in the tournament"""
+    index = get_conflict_index(db, tournament_id)
+    if not index.player_matches:
+        return
+    for participant_id, player_ids in participant_players(db, sport, participants).items():
+        bookings = index.bookings(player_ids)
+        if bookings:
+            scheduler.add_participant_bookings(participant_id, bookings)
+
+
+def conflicts_changed(db: Session) -> None:
+    """Drop cached indexes once db commits (for writes that bypass the ORM, e.g. bulk inserts)"""
+    db.info[CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_flush")
+def collect_membership_changes(session, flush_context):
+    if any(isinstance(obj, TRACKED_MODELS) for obj in (*session.new, *session.dirty, *session.deleted)):
+        session.info[CHANGED_KEY] = True
+
+
+@event.listens_for(Session, "after_commit")
+def drop_conflict_indexes(session):
+    if session.info.pop(CHANGED_KEY, False):
+        _generation[0] += 1
+        conflict_indexes.invalidate()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_membership_changes(session, previous_transaction):
+    session.info.pop(CHANGED_KEY, None)
@@ -0,0 +1,34 @@
+"""
+Single-flight request coalescing for hot read endpoints.
+Concurrent identical requests share one in-flight computation and receive the same result.
+"""
+import asyncio
+from typing import Any, Callable, Dict, Hashable
+from starlette.concurrency import run_in_threadpool
+
+
+class SingleFlight:
+    """Collapse concurrent calls with the same key into a single execution"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+
+    def _forget(self, key: Hashable, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def do(self, key: Hashable, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run fn(*args) in the threadpool, or join the identical call already in flight.
+        The shared task is shielded so a disconnecting caller does not cancel it for the others.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(run_in_threadpool(fn, *args))
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """Number of distinct keys currently being computed"""
+        return len(self._inflight)
@@ -0,0 +1,267 @@
+"""
+Incremental rescheduling after a postponement or a venue blackout.
+Only fixtures that actually clash are moved: the displaced matches, then any match that now
+starts before the matches feeding it (bracket feeders, or a group feeding the knockout) have
+ended and left the minimum rest. Each one takes the earliest slot where the venue booking
+index shows the venue free and its participants' own bookings, read per participant over
+the search window, leave them their rest. The work grows with the disruption rather than
+with the size of the tournament. Moves are applied to the caller's session and committed
+with it, so they land all together or not at all.
+"""
+import json
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+from config import settings
+from models.match import Match, MatchParticipation, MatchStatus
+from models.schedule import Schedule
+from models.sport import Sport
+from models.venue import Venue
+from services.interval_index import IntervalIndex
+from services.venue_bookings import venue_bookings, naive_utc
+from services.venue_scheduler import blackout_key, expected_end
+
+Participant = Tuple[str, int]  # ("team", id) or ("player", id)
+
+# Matches that still hold their slot and may have to make way
+MOVABLE_STATUSES = (MatchStatus.SCHEDULED,)
+# Matches whose bookings a move has to respect
+BOOKED_STATUSES = (MatchStatus.SCHEDULED, MatchStatus.LIVE)
+
+
+class Rescheduler:
+    """Moves matches one at a time, seeing both the committed bookings and its own moves"""
+
+    def __init__(self, db: Session, venue_ids: Optional[List[int]] = None):
+        self.db = db
+        self.venue_ids = venue_ids  # Restrict moves to these venues; default: the match's institution
+        self.rest = timedelta(minutes=settings.SCHEDULE_MIN_REST_MINUTES)
+        self.changeover = timedelta(minutes=settings.SCHEDULE_CHANGEOVER_MINUTES)
+        self.step = timedelta(minutes=settings.RESCHEDULE_STEP_MINUTES)
+        self.horizon = timedelta(days=settings.RESCHEDULE_HORIZON_DAYS)
+        self.moving: Set[int] = set()  # Matches being moved; their old bookings no longer count
+        self.placed: Dict[Optional[int], IntervalIndex] = {}  # venue -> bookings made here (and new blackouts)
+        self.participants: Dict[Participant, Tuple[datetime, datetime, IntervalIndex]] = {}  # loaded window + bookings
+        self.booked: Dict[Participant, List[Tuple[datetime, datetime, int]]] = {}  # Bookings made here, per participant
+        self.new_slots: Dict[int, Tuple[Optional[int], datetime, datetime]] = {}
+        self.moves: List[Dict] = []
+        self._venue_options: Dict[int, List[Optional[int]]] = {}
+
+    def block_venue(self, venue_id: int, start: datetime, end: datetime, blackout_id: Optional[int] = None) -> None:
+        """Treat a venue as closed during [start, end), e.g. for a blackout not committed yet"""
+        self.placed.setdefault(venue_id, IntervalIndex()).add(naive_utc(start), naive_utc(end), blackout_key(blackout_id))
+
+    def reschedule(self, matches: List[Match], not_before: Dict[int, datetime]) -> List[Dict]:
+        """
+        Move matches (each no earlier than its not_before) and whatever has to follow them.
+        Raises 409, leaving the session unchanged, if any of them finds no slot in the horizon.
+        """
+        for match in matches:
+            self._release(match)
+        queue = deque((match, not_before[match.id]) for match in matches)
+        while queue:
+            match, earliest = queue.popleft()
+            self._place(match, earliest)
+            for follower, follower_earliest in self._followers(match):
+                if follower.id not in self.moving:
+                    self._release(follower)
+                    queue.append((follower, follower_earliest))
+
+        for match in [move["match"] for move in self.moves]:
+            venue_id, start, end = self.new_slots[match.id]
+            match.venue_id, match.scheduled_time, match.expected_end_time = venue_id, start, end
+            if match.status == MatchStatus.POSTPONED:
+                match.status = MatchStatus.SCHEDULED
+        return self.moves
+
+    def _release(self, match: Match) -> None:
+        """Forget a match's current booking before it is placed again"""
+        self.moving.add(match.id)
+        start = naive_utc(match.scheduled_time)
+        for participant in self._participants_of(match):
+            loaded = self.participants.get(participant)
+            if loaded is not None:
+                loaded[2].remove(start, match.id)
+
+    def _place(self, match: Match, earliest: datetime) -> None:
+        start = naive_utc(match.scheduled_time)
+        duration = expected_end(start, naive_utc(match.expected_end_time)) - start
+        participants = self._participants_of(match)
+        venue_ids = self._venues_for(match)
+        for candidate in self._starts(earliest, duration):
+            end = candidate + duration
+            if not all(self._participant_free(participant, candidate, end) for participant in participants):
+                continue
+            for venue_id in venue_ids:
+                if self._venue_free(venue_id, candidate, end):
+                    self._book(match, participants, venue_id, candidate, end)
+                    return
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"No free slot for match {match.id} within {self.horizon.days} days of {earliest.isoformat()}"
+        )
+
+    def _book(self, match: Match, participants: List[Participant], venue_id: Optional[int], start: datetime, end: datetime) -> None:
+        self.placed.setdefault(venue_id, IntervalIndex()).add(start, end, match.id)
+        for participant in participants:
+            self.participants[participant][2].add(start, end, match.id)
+            self.booked.setdefault(participant, []).append((start, end, match.id))
+        self.new_slots[match.id] = (venue_id, start, end)
+        self.moves.append({
+            "match": match,
+            "match_id": match.id,
+            "from_venue_id": match.venue_id,
+            "from_time": naive_utc(match.scheduled_time),
+            "venue_id": venue_id,
+            "scheduled_time": start,
+            "expected_end_time": end,
+        })
+
+    def _starts(self, earliest: datetime, duration: timedelta) -> Iterator[datetime]:
+        """earliest itself, then every step inside the daily window, up to the horizon"""
+        day_end = datetime.combine(earliest.date(), settings.SCHEDULE_DAY_END)
+        if earliest.time() >= settings.SCHEDULE_DAY_START and earliest + duration <= day_end:
+            yield earliest
+        day = earliest.date()
+        last = earliest + self.horizon
+        while day <= last.date():
+            slot = datetime.combine(day, settings.SCHEDULE_DAY_START)
+            while slot + duration <= datetime.combine(day, settings.SCHEDULE_DAY_END):
+                if earliest < slot <= last:
+                    yield slot
+                slot += self.step
+            day += timedelta(days=1)
+
+    def _venue_free(self, venue_id: Optional[int], start: datetime, end: datetime) -> bool:
+        if venue_id is None:
+            return True
+        if any(key not in self.moving for _, _, key in venue_bookings.conflicts(venue_id, start, end)):
+            return False
+        placed = self.placed.get(venue_id)
+        return placed is None or not placed.overlapping(start - self.changeover, end + self.changeover)
+
+    def _venues_for(self, match: Match) -> List[Optional[int]]:
+        """The match's own venue first, then the requested venues or its institution's active ones"""
+        if self.venue_ids is not None:
+            return sorted(self.venue_ids, key=lambda venue_id: venue_id != match.venue_id)
+        if match.venue_id is None:
+            return [None]
+        options = self._venue_options.get(match.sport_id)
+        if options is None:
+            options = [venue_id for (venue_id,) in self.db.query(Venue.id).join(
+                Sport, Sport.institution_id == Venue.institution_id
+            ).filter(Sport.id == match.sport_id, Venue.is_active == True).order_by(Venue.id)]
+            self._venue_options[match.sport_id] = options
+        return [match.venue_id] + [venue_id for venue_id in options if venue_id != match.venue_id]
+
+    def _participants_of(self, match: Match) -> List[Participant]:
+        if match.home_team_id is not None or match.away_team_id is not None:
+            return [("team", team_id) for team_id in (match.home_team_id, match.away_team_id) if team_id is not None]
+        return [("player", player_id) for (player_id,) in self.db.query(MatchParticipation.player_id).filter(
+            MatchParticipation.match_id == match.id
+        )]
+
+    def _participant_free(self, participant: Participant, start: datetime, end: datetime) -> bool:
+        # Bookings of matches being moved were dropped on release; their new slots are in the index
+        return not self._participant_bookings(participant, start, end).overlapping(start - self.rest, end + self.rest)
+
+    def _participant_bookings(self, participant: Participant, start: datetime, end: datetime) -> IntervalIndex:
+        """Bookings of a participant, read once per search window (re-read if a search goes past it)"""
+        loaded = self.participants.get(participant)
+        if loaded is not None and loaded[0] <= start - self.rest and end + self.rest <= loaded[1]:
+            return loaded[2]
+        window_start = min(start, loaded[0] if loaded else start) - timedelta(days=1)
+        window_end = max(end + self.horizon, loaded[1] if loaded else end) + timedelta(days=1)
+        kind, participant_id = participant
+        end_column = func.coalesce(Match.expected_end_time, Match.actual_end_time)
+        query = self.db.query(Match.id, Match.scheduled_time, end_column).filter(
+            Match.scheduled_time >= window_start - timedelta(days=1),  # Long matches reach into the window
+            Match.scheduled_time < window_end,
+            Match.status.in_(BOOKED_STATUSES)
+        )
+        if kind == "team":
+            query = query.filter(or_(Match.home_team_id == participant_id, Match.away_team_id == participant_id))
+        else:
+            query = query.join(MatchParticipation, MatchParticipation.match_id == Match.id).filter(
+                MatchParticipation.player_id == participant_id
+            )
+        index = IntervalIndex()
+        for match_id, match_start, match_end in query:
+            if match_id not in self.moving:
+                match_start = naive_utc(match_start)
+                index.add(match_start, expected_end(match_start, naive_utc(match_end)), match_id)
+        for booking in self.booked.get(participant, []):
+            index.add(*booking)
+        self.participants[participant] = (window_start, window_end, index)
+        return index
+
+    def _end_of(self, match_id: int, start: datetime, end: Optional[datetime]) -> datetime:
+        if match_id in self.new_slots:
+            return self.new_slots[match_id][2]
+        return expected_end(naive_utc(start), naive_utc(end))
+
+    def _followers(self, match: Match) -> List[Tuple[Match, datetime]]:
+        """Matches fed by this one that would now start before their feeders end and rest"""
+        followers: List[Tuple[Match, datetime]] = []
+        if match.next_match_id is not None:
+            feeders = self.db.query(Match.id, Match.scheduled_time, Match.expected_end_time).filter(
+                Match.next_match_id == match.next_match_id, Match.status != MatchStatus.CANCELLED
+            ).all()
+            followers += self._late([match.next_match_id], feeders)
+        if match.group_number is not None and match.schedule_id is not None:
+            config = json.loads(self.db.query(Schedule.generation_config).filter(
+                Schedule.id == match.schedule_id
+            ).scalar() or "{}")
+            prefix = f"{match.group_number}-"
+            numbers = [slot[0] for key, slot in (config.get("qualifier_slots") or {}).items() if key.startswith(prefix)]
+            if numbers:
+                feeders = self.db.query(Match.id, Match.scheduled_time, Match.expected_end_time).filter(
+                    Match.schedule_id == match.schedule_id,
+                    Match.group_number == match.group_number,
+                    Match.status != MatchStatus.CANCELLED
+                ).all()
+                follower_ids = [match_id for (match_id,) in self.db.query(Match.id).filter(
+                    Match.schedule_id == match.schedule_id, Match.match_number.in_(numbers)
+                )]
+                followers += self._late(follower_ids, feeders)
+        return followers
+
+    def _late(self, follower_ids: List[int], feeders) -> List[Tuple[Match, datetime]]:
+        ready = max(self._end_of(feeder_id, start, end) for feeder_id, start, end in feeders) + self.rest
+        late = []
+        for follower_id in follower_ids:
+            follower = self.db.get(Match, follower_id)
+            if follower is None or follower.status not in MOVABLE_STATUSES or follower.id in self.moving:
+                continue
+            if naive_utc(follower.scheduled_time) < ready:
+                late.append((follower, ready))
+        return late
+
+
+def move_summary(moves: List[Dict]) -> List[Dict]:
+    """Moves as response rows (without the Match objects)"""
+    return [{key: value for key, value in move.items() if key != "match"} for move in moves]
+
+
+def reschedule_match(db: Session, match: Match, not_before: Optional[datetime] = None, venue_ids: Optional[List[int]] = None) -> List[Dict]:
+    """Give a postponed match a new slot (and move what depends on it). Does not commit"""
+    earliest = naive_utc(not_before) or datetime.utcnow().replace(second=0, microsecond=0)
+    return Rescheduler(db, venue_ids).reschedule([match], {match.id: earliest})
+
+
+def reschedule_for_blackout(db: Session, venue_id: int, start: datetime, end: datetime, blackout_id: Optional[int] = None) -> List[Dict]:
+    """
+    Move the matches a venue closure displaces: the same time on another venue when one is
+    free, otherwise the earliest slot after that. Does not commit.
+    """
+    start, end = naive_utc(start), naive_utc(end)
+    displaced_ids = [key for _, _, key in venue_bookings.conflicts(venue_id, start, end) if not isinstance(key, tuple)]
+    matches = db.query(Match).filter(
+        Match.id.in_(displaced_ids), Match.status.in_(MOVABLE_STATUSES)
+    ).order_by(Match.scheduled_time).all() if displaced_ids else []
+    rescheduler = Rescheduler(db)
+    rescheduler.block_venue(venue_id, start, end, blackout_id)
+    return rescheduler.reschedule(matches, {match.id: naive_utc(match.scheduled_time) for match in matches})
@@ -0,0 +1,73 @@
+"""
+Quality metrics of planned fixtures, computed in memory: tournament span, rest between each
+participant's matches and how much of each venue's daily window is used.
+"""
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+DAY_SECONDS = 24 * 3600
+
+
+def _days(delta: timedelta) -> float:
+    return round(delta.total_seconds() / DAY_SECONDS, 2)
+
+
+def plan_metrics(fixtures: List[Dict], scheduler=None) -> Dict:
+    """Metrics of fixtures with scheduled_time, expected_end_time, venue_id, home_id and away_id"""
+    if not fixtures:
+        return {"match_count": 0, "start": None, "end": None, "span_days": 0,
+                "min_rest_days": None, "avg_rest_days": None, "rest": [], "venues": []}
+
+    start = min(fixture["scheduled_time"] for fixture in fixtures)
+    end = max(fixture["expected_end_time"] for fixture in fixtures)
+    span_days = (end.date() - start.date()).days + 1
+
+    # Rest: time from the end of one match to the start of the participant's next
+    matches_of: Dict[int, List[Dict]] = {}
+    for fixture in fixtures:
+        for participant_id in (fixture["home_id"], fixture["away_id"]):
+            if participant_id is not None:
+                matches_of.setdefault(participant_id, []).append(fixture)
+    rest = []
+    all_gaps: List[timedelta] = []
+    for participant_id, matches in matches_of.items():
+        matches.sort(key=lambda fixture: fixture["scheduled_time"])
+        gaps = [later["scheduled_time"] - earlier["expected_end_time"] for earlier, later in zip(matches, matches[1:])]
+        all_gaps += gaps
+        rest.append({
+            "participant_id": participant_id,
+            "matches": len(matches),
+            "min_rest_days": _days(min(gaps)) if gaps else None,
+            "avg_rest_days": _days(sum(gaps, timedelta()) / len(gaps)) if gaps else None,
+        })
+    rest.sort(key=lambda entry: (entry["min_rest_days"] is None, entry["min_rest_days"] or 0))
+
+    # Utilization: booked minutes over the daily window of every day in the span
+    window_minutes: Optional[float] = None
+    venue_ids = []
+    if scheduler is not None:
+        window = datetime.combine(start.date(), scheduler.day_end) - datetime.combine(start.date(), scheduler.day_start)
+        window_minutes = window.total_seconds() / 60 * span_days
+        venue_ids = list(scheduler.venue_ids)
+    booked: Dict[Optional[int], List[float]] = {venue_id: [0, 0] for venue_id in venue_ids}
+    for fixture in fixtures:
+        entry = booked.setdefault(fixture["venue_id"], [0, 0])
+        entry[0] += 1
+        entry[1] += (fixture["expected_end_time"] - fixture["scheduled_time"]).total_seconds() / 60
+    venues = [{
+        "venue_id": venue_id,
+        "matches": matches,
+        "booked_minutes": round(minutes),
+        "utilization": round(minutes / window_minutes, 3) if window_minutes else None,
+    } for venue_id, (matches, minutes) in booked.items()]
+
+    return {
+        "match_count": len(fixtures),
+        "start": start,
+        "end": end,
+        "span_days": span_days,
+        "min_rest_days": _days(min(all_gaps)) if all_gaps else None,
+        "avg_rest_days": _days(sum(all_gaps, timedelta()) / len(all_gaps)) if all_gaps else None,
+        "rest": rest,
+        "venues": venues,
+    }
@@ -0,0 +1,243 @@
+"""
+Local-search improvement of planned fixtures (simulated annealing).
+Starting from the greedy placement, matches swap slots with each other or move to free grid
+slots. A weighted objective penalises short or uneven rest, the same participant playing
+early again and again, and idle gaps between matches on a venue day. A move only changes the
+participants and venue days it touches, so it is scored by recomputing just those terms.
+Moves that break the rest, venue or daily-cap constraints are rejected outright. Knockout
+matches stay within their own round's time window, so round order is kept.
+"""
+import math
+import random
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from config import settings
+from services.interval_index import build_index
+from services.venue_scheduler import SlotScheduler
+
+DAY_SECONDS = 24 * 3600
+
+Slot = Tuple[Optional[int], datetime]  # (venue_id, start)
+
+
+class ScheduleOptimizer:
+    def __init__(self, fixtures: List[Dict], scheduler: SlotScheduler, linked: bool, rng: Optional[random.Random] = None):
+        self.fixtures = fixtures
+        self.scheduler = scheduler
+        self.rng = rng or random.Random()
+        self.duration = scheduler.duration
+        self.slot_numbers = {slot: number for number, slot in enumerate(scheduler.slots_per_day)}
+        self.rest_weight = settings.OPTIMIZER_REST_WEIGHT
+        self.early_weight = settings.OPTIMIZER_EARLY_WEIGHT
+        self.idle_weight = settings.OPTIMIZER_IDLE_WEIGHT
+        self.early_before = settings.OPTIMIZER_EARLY_BEFORE
+
+        self.slots: List[Slot] = [(fixture["venue_id"], fixture["scheduled_time"]) for fixture in fixtures]
+        self.occupied: Dict[Slot, int] = {slot: index for index, slot in enumerate(self.slots)}
+        self.day_counts: Dict[date, int] = {}
+        self.venue_days: Dict[Tuple[Optional[int], date], Dict[int, int]] = {}  # -> {slot number: matches}
+        for venue_id, start in self.slots:
+            self._count(venue_id, start, 1)
+
+        # Bookings that existed before this plan (keyed by match id; planned ones have no key)
+        self.external_venues = {
+            venue_id: build_index([interval for interval in index.intervals() if interval[2] is not None])
+            for venue_id, index in scheduler.venues.items()
+        }
+        self.external_participants: Dict[int, List[Tuple[datetime, datetime]]] = {}
+        self.matches_of: Dict[int, List[int]] = {}
+        for index, fixture in enumerate(fixtures):
+            for participant_id in (fixture["home_id"], fixture["away_id"]):
+                if participant_id is not None:
+                    self.matches_of.setdefault(participant_id, []).append(index)
+        for participant_id in self.matches_of:
+            known = scheduler.participants.get(participant_id)
+            self.external_participants[participant_id] = [
+                (start, end) for start, end, key in (known.intervals() if known else []) if key is not None
+            ]
+
+        # Matches may swap within a group and move to free slots inside the group's window
+        if linked:
+            rounds: Dict[int, List[int]] = {}
+            for index, fixture in enumerate(fixtures):
+                rounds.setdefault(fixture["round_number"], []).append(index)
+            self.groups = list(rounds.values())
+        else:
+            self.groups = [list(range(len(fixtures)))]
+        self.group_of = {index: number for number, group in enumerate(self.groups) for index in group}
+        self.group_slots = [self._grid_between(min(self.slots[i][1] for i in group), max(self.slots[i][1] for i in group)) for group in self.groups]
+
+        self.participant_costs = {participant_id: self._participant_cost(participant_id)[0] for participant_id in self.matches_of}
+        self.venue_day_costs = {key: self._venue_day_cost(key) for key in self.venue_days}
+        self.objective = sum(self.participant_costs.values()) + sum(self.venue_day_costs.values())
+
+    def _grid_between(self, first: datetime, last: datetime) -> List[datetime]:
+        starts = []
+        day = first.date()
+        while day <= last.date():
+            starts += [datetime.combine(day, slot) for slot in self.scheduler.slots_per_day
+                       if first <= datetime.combine(day, slot) <= last]
+            day += timedelta(days=1)
+        return starts
+
+    def _participant_cost(self, participant_id: int) -> Tuple[float, bool]:
+        """(weighted rest + early-slot cost, whether every gap respects the minimum rest)"""
+        planned = [self.slots[index][1] for index in self.matches_of[participant_id]]
+        bookings = sorted([(start, start + self.duration) for start in planned] + self.external_participants[participant_id])
+        rest_cost = 0.0
+        for (_, previous_end), (next_start, _) in zip(bookings, bookings[1:]):
+            gap = (next_start - previous_end).total_seconds()
+            if gap < self.scheduler.rest.total_seconds():
+                return math.inf, False
+            rest_cost += DAY_SECONDS / max(gap, 60)
+        early = sum(1 for start in planned if start.time() < self.early_before)
+        return self.rest_weight * rest_cost + self.early_weight * early * early, True
+
+    def _venue_day_cost(self, key) -> float:
+        """Idle grid slots between a venue's first and last match of the day"""
+        numbers = self.venue_days.get(key)
+        if not numbers:
+            return 0.0
+        return self.idle_weight * (max(numbers) - min(numbers) + 1 - len(numbers))
+
+    def _count(self, venue_id: Optional[int], start: datetime, change: int) -> None:
+        """Track matches per day and per venue-day slot (counts, as a swap passes through doubles)"""
+        self.day_counts[start.date()] = self.day_counts.get(start.date(), 0) + change
+        numbers = self.venue_days.setdefault((venue_id, start.date()), {})
+        number = self.slot_numbers[start.time()]
+        numbers[number] = numbers.get(number, 0) + change
+        if not numbers[number]:
+            del numbers[number]
+
+    def _set_slot(self, index: int, slot: Slot) -> None:
+        old_slot = self.slots[index]
+        if self.occupied.get(old_slot) == index:
+            del self.occupied[old_slot]
+        self._count(*old_slot, -1)
+        self.slots[index] = slot
+        self.occupied[slot] = index
+        self._count(*slot, 1)
+
+    def _random_move(self) -> Optional[List[Tuple[int, Slot]]]:
+        """A move as (fixture index, new slot) assignments, or None if the draw is unusable"""
+        index = self.rng.randrange(len(self.fixtures))
+        group = self.group_of[index]
+        if self.rng.random() < 0.5:
+            other = self.rng.choice(self.groups[group])
+            if other == index:
+                return None
+            return [(index, self.slots[other]), (other, self.slots[index])]
+        start = self.rng.choice(self.group_slots[group])
+        venue_id = self.rng.choice(self.scheduler.venue_ids)
+        if (venue_id, start) in self.occupied:
+            return None
+        cap = self.scheduler.matches_per_day
+        if cap and start.date() != self.slots[index][1].date() and self.day_counts.get(start.date(), 0) >= cap:
+            return None
+        external = self.external_venues.get(venue_id)
+        if external is not None and not external.is_free(start, start + self.duration + self.scheduler.changeover):
+            return None
+        return [(index, (venue_id, start))]
+
+    def _try(self, move: List[Tuple[int, Slot]], temperature: float) -> Optional[float]:
+        """Apply the move if accepted; returns its objective delta, or None if rejected"""
+        previous = [(index, self.slots[index]) for index, _ in move]
+        participants = {participant_id for index, _ in move for participant_id in
+                        (self.fixtures[index]["home_id"], self.fixtures[index]["away_id"]) if participant_id is not None}
+        venue_days = {(venue_id, start.date()) for _, (venue_id, start) in previous + move}
+        before = sum(self.participant_costs[p] for p in participants) + sum(self.venue_day_costs.get(key, 0.0) for key in venue_days)
+
+        for index, slot in move:
+            self._set_slot(index, slot)
+        participant_costs = {}
+        for participant_id in participants:
+            cost, feasible = self._participant_cost(participant_id)
+            if not feasible:
+                break
+            participant_costs[participant_id] = cost
+        else:
+            venue_day_costs = {key: self._venue_day_cost(key) for key in venue_days}
+            delta = sum(participant_costs.values()) + sum(venue_day_costs.values()) - before
+            if delta <= 0 or (temperature > 0 and self.rng.random() < math.exp(-delta / temperature)):
+                self.participant_costs.update(participant_costs)
+                self.venue_day_costs.update(venue_day_costs)
+                self.objective += delta
+                return delta
+
+        for index, slot in previous:
+            self._set_slot(index, slot)
+        for index, slot in previous:  # A swap's second restore can evict the first from occupied
+            self.occupied[slot] = index
+        return None
+
+    def _initial_temperature(self, samples: int = 100) -> float:
+        """Mean uphill delta of random moves, measured without keeping them"""
+        uphill = []
+        for _ in range(samples):
+            move = self._random_move()
+            if move is None:
+                continue
+            previous = [(index, self.slots[index]) for index, _ in move]
+            objective = self.objective
+            delta = self._try(move, math.inf)
+            if delta is None:
+                continue
+            if delta > 0:
+                uphill.append(delta)
+            self._try(previous, math.inf)
+            self.objective = objective
+        return sum(uphill) / len(uphill) if uphill else 1.0
+
+    def run(self, budget_seconds: float) -> Dict:
+        """Anneal for budget_seconds of wall-clock time, then keep the best schedule seen"""
+        began = time.perf_counter()
+        initial = self.objective
+        best = self.objective
+        best_slots = list(self.slots)
+        trajectory = [{"elapsed_ms": 0, "iteration": 0, "objective": round(initial, 3)}]
+        if len(self.fixtures) < 2:
+            return self._report(initial, 0, 0, trajectory)
+
+        start_temperature = self._initial_temperature()
+        end_temperature = start_temperature * 1e-3
+        sample_every = budget_seconds / settings.OPTIMIZER_TRAJECTORY_POINTS
+        next_sample = sample_every
+        iterations = accepted = 0
+        elapsed = 0.0
+        while elapsed < budget_seconds:
+            temperature = start_temperature * (end_temperature / start_temperature) ** (elapsed / budget_seconds)
+            for _ in range(100):  # Check the clock every 100 moves
+                iterations += 1
+                move = self._random_move()
+                if move is None or self._try(move, temperature) is None:
+                    continue
+                accepted += 1
+                if self.objective < best - 1e-9:
+                    best = self.objective
+                    best_slots = list(self.slots)
+            elapsed = time.perf_counter() - began
+            if elapsed >= next_sample:
+                trajectory.append({"elapsed_ms": round(elapsed * 1000), "iteration": iterations, "objective": round(best, 3)})
+                next_sample += sample_every
+
+        for index, (venue_id, start) in enumerate(best_slots):
+            self.fixtures[index].update(venue_id=venue_id, scheduled_time=start, expected_end_time=start + self.duration)
+        if trajectory[-1]["iteration"] != iterations:
+            trajectory.append({"elapsed_ms": round(elapsed * 1000), "iteration": iterations, "objective": round(best, 3)})
+        return self._report(initial, iterations, accepted, trajectory, best)
+
+    def _report(self, initial: float, iterations: int, accepted: int, trajectory: List[Dict], final: Optional[float] = None) -> Dict:
+        return {
+            "initial_objective": round(initial, 3),
+            "objective": round(initial if final is None else final, 3),
+            "iterations": iterations,
+            "accepted": accepted,
+            "trajectory": trajectory,
+        }
+
+
+def optimize_fixtures(fixtures: List[Dict], scheduler: SlotScheduler, linked: bool, budget_seconds: float) -> Dict:
+    """Improve fixtures in place within the time budget; returns the optimization report"""
+    budget_seconds = min(max(budget_seconds, 0), settings.OPTIMIZER_MAX_SECONDS)
+    return ScheduleOptimizer(fixtures, scheduler, linked).run(budget_seconds)
@@ -1,200 +1,709 @@
+import itertools
+import json
+import math
+from datetime import datetime
+from fastapi import HTTPException, status
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from config import settings
 from models.sport import Sport, SportType
 from models.team import Team
 from models.player import Player
 from models.match import Match, MatchStatus, MatchParticipation
 from models.schedule import Schedule, ScheduleType
-from datetime import time
+from models.standing import Standing
+from services.venue_scheduler import SchedulingConstraints, SlotScheduler, build_scheduler
+from services.venue_bookings import reload_after_commit, naive_utc
+from services.swiss_pairing import SwissResults, load_results, swiss_pairings
+from services.standings import StandingsRules, rank_rows, record_byes, standing_rows
+from services.player_conflicts import avoid_player_conflicts, conflicts_changed
+from services.schedule_metrics import plan_metrics
+from services.schedule_optimizer import optimize_fixtures
+from services.cache import TTLCache
 
+# Previews awaiting commit: preview_id -> (owner user id, SchedulePlan)
+schedule_previews = TTLCache(ttl_seconds=settings.PREVIEW_TTL_SECONDS, max_entries=settings.PREVIEW_MAX_ENTRIES)
 
-def generate_round_robin_schedule(
+
+class GenerationProgress:
+    """
+    Hooks called while fixtures are written; the defaults do nothing.
+    With a chunk_size, matches are written (and reported) in chunks of that many.
+    """
+    chunk_size: Optional[int] = None
+
+    def planned(self, schedule_id: int, count: int) -> None:
+        """count more matches of the (flushed) schedule are about to be written"""
+
+    def written(self, count: int) -> None:
+        """count matches were just written; may commit"""
+
+
+def load_participants(
     db: Session,
-    schedule: Schedule,
+    sport: Sport,
     team_ids: Optional[List[int]] = None,
-    player_ids: Optional[List[int]] = None,
-    matches_per_day: int = 4,
-    start_time: time = time(9, 0),  # 9 AM default
-    match_duration_minutes: int = 90
-) -> List[Match]:
+    player_ids: Optional[List[int]] = None
+) -> List[int]:
+    """Team ids for team sports, player ids otherwise; defaults to everyone in the sport"""
+    if sport.sport_type == SportType.TEAM:
+        if team_ids:
+            return list(team_ids)
+        return [team_id for (team_id,) in db.query(Team.id).filter(Team.sport_id == sport.id).order_by(Team.id)]
+    # INDIVIDUAL or MIXED
+    if player_ids:
+        return list(player_ids)
+    return [player_id for (player_id,) in db.query(Player.id).join(Team).filter(Team.sport_id == sport.id).order_by(Player.id)]
+
+
+def round_robin_rounds(participants: List[int], double: bool = False) -> List[List[Tuple[int, int]]]:
     """
-    Generate round-robin schedule for teams or players.
-    Each team/player plays against every other team/player once.
+    Berger tables (circle method): a list of rounds, each a list of (home, away) pairs.
+    Nobody plays twice in a round; with an odd count one participant rests each round.
+    Home and away counts differ by at most one per participant, and the home/away pattern
+    has the minimum number of breaks (consecutive home or away games).
+    A double round robin repeats every round with home and away swapped.
     """
-    matches = []
-    sport = db.query(Sport).filter(Sport.id == schedule.sport_id).first()
-    if not sport:
-        return matches
-    
-    participants = []
-    
-    if sport.sport_type == SportType.TEAM:
-        if not team_ids:
-            teams = db.query(Team).filter(Team.sport_id == sport.id).all()
-            team_ids = [team.id for team in teams]
-        participants = team_ids
-    else:  # INDIVIDUAL or MIXED
-        if not player_ids:
-            players = db.query(Player).join(Team).filter(Team.sport_id == sport.id).all()
-            player_ids = [player.id for player in players]
-        participants = player_ids
-    
-    if len(participants) < 2:
-        return matches
-    
-    # Generate all possible matchups
-    matchups = []
-    for i in range(len(participants)):
-        for j in range(i + 1, len(participants)):
-            matchups.append((participants[i], participants[j]))
-    
-    # Schedule matches across days
-    current_date = schedule.start_date.date()
-    matches_today = 0
-    match_number = 1
-    
-    for home_id, away_id in matchups:
-        # Calculate match time
-        match_time = datetime.combine(current_date, start_time)
-        match_time += timedelta(minutes=matches_today * match_duration_minutes)
-        
-        # Create match
-        match_data = {
-            "match_number": f"M{match_number:03d}",
-            "scheduled_time": match_time,
-            "status": MatchStatus.SCHEDULED,
-            "sport_id": sport.id,
-            "schedule_id": schedule.id,
-            "created_by": sport.organizer_id
-        }
-        
-        if sport.sport_type == SportType.TEAM:
-            match_data["home_team_id"] = home_id
-            match_data["away_team_id"] = away_id
-        
-        db_match = Match(**match_data)
-        db.add(db_match)
-        db.flush()  # Flush to get the match ID
-        
-        # For individual sports, create participations
-        if sport.sport_type != SportType.TEAM:
-            db.add(MatchParticipation(match_id=db_match.id, player_id=home_id, is_home=True))
-            db.add(MatchParticipation(match_id=db_match.id, player_id=away_id, is_home=False))
-        
-        matches.append(db_match)
-        match_number += 1
-        matches_today += 1
-        
-        # Move to next day if we've reached matches_per_day
-        if matches_today >= matches_per_day:
-            matches_today = 0
-            current_date += timedelta(days=1)
-            # Update start_date if needed
-            if current_date > schedule.start_date.date():
-                schedule.start_date = datetime.combine(current_date, start_time)
+    entries: List[Optional[int]] = list(participants)
+    if len(entries) % 2:
+        entries.append(None)  # Bye
+    n = len(entries)
+    fixed = n - 1  # Index that stays put while the others rotate around it
+    rounds = []
+    for r in range(fixed):
+        pairs = []
+        # The fixed entry alternates home and away from one round to the next
+        pairs.append((entries[r], entries[fixed]) if r % 2 == 0 else (entries[fixed], entries[r]))
+        for k in range(1, n // 2):
+            first, second = entries[(r + k) % fixed], entries[(r - k) % fixed]
+            pairs.append((first, second) if k % 2 == 0 else (second, first))
+        rounds.append([(home, away) for home, away in pairs if home is not None and away is not None])
+    if double:
+        rounds += [[(away, home) for home, away in pairs] for pairs in rounds]
+    return rounds
+
+
+def build_round_robin_fixtures(rounds: List[List[Tuple[int, int]]], scheduler: SlotScheduler) -> List[Dict]:
+    """Place the rounds, in order, on conflict-free venue slots; nothing is written yet"""
+    fixtures = []
+    for round_number, pairs in enumerate(rounds, start=1):
+        for home_id, away_id in pairs:
+            venue_id, start, end = scheduler.place(home_id, away_id)
+            fixtures.append({
+                "match_number": f"M{len(fixtures) + 1:03d}",
+                "round_number": round_number,
+                "scheduled_time": start,
+                "expected_end_time": end,
+                "venue_id": venue_id,
+                "home_id": home_id,
+                "away_id": away_id,
+            })
+    return fixtures
+
+
+def insert_fixtures(
+    db: Session,
+    plan: "SchedulePlan",
+    schedule_id: int,
+    fixtures: List[Dict],
+    progress: Optional[GenerationProgress] = None
+) -> List[int]:
+    """
+    Write fixtures with one multi-row INSERT ... RETURNING for the matches and one for the
+    participations of individual sports (per chunk, if progress sets a chunk_size). Fixture
+    match numbers must be unique; a None home_id/away_id leaves that side TBD.
+    Returns the new match ids in fixture order.
+    """
+    if not fixtures:
+        return []
+    chunk_size = (progress.chunk_size if progress else None) or len(fixtures)
+    match_ids = []
+    for offset in range(0, len(fixtures), chunk_size):
+        chunk = fixtures[offset:offset + chunk_size]
+        match_ids += _insert_chunk(db, plan.is_team_sport, plan.sport_id, plan.organizer_id, schedule_id, chunk)
+        if progress:
+            progress.written(len(chunk))
+    return match_ids
+
+
+def _insert_chunk(db: Session, is_team_sport: bool, sport_id: int, organizer_id: int, schedule_id: int, fixtures: List[Dict]) -> List[int]:
+    rows = []
+    for fixture in fixtures:
+        rows.append({
+            "match_number": fixture["match_number"],
+            "round_number": fixture.get("round_number"),
+            "group_number": fixture.get("group_number"),
+            "scheduled_time": fixture["scheduled_time"],
+            "expected_end_time": fixture.get("expected_end_time"),
+            "venue_id": fixture.get("venue_id"),
+            "status": fixture.get("status", MatchStatus.SCHEDULED),
+            "sport_id": sport_id,
+            "schedule_id": schedule_id,
+            "created_by": organizer_id,
+            "home_team_id": fixture["home_id"] if is_team_sport else None,
+            "away_team_id": fixture["away_id"] if is_team_sport else None,
+            "bracket_position": fixture.get("bracket_position"),
+            "next_match_id": fixture.get("next_match_id"),
+            "next_match_slot": fixture.get("next_slot"),
+        })
+    # Fixture match numbers are unique, so returned ids are paired by number rather than relying
+    # on RETURNING row order (which would force one INSERT per row without a sentinel column)
+    returned = dict(db.execute(insert(Match).returning(Match.match_number, Match.id), rows).all())
+    match_ids = [returned[fixture["match_number"]] for fixture in fixtures]
+    reload_after_commit(db, {row["venue_id"] for row in rows})
+    conflicts_changed(db)
+
+    if not is_team_sport:
+        participations = []
+        for match_id, fixture in zip(match_ids, fixtures):
+            if fixture["home_id"] is not None:
+                participations.append({"match_id": match_id, "player_id": fixture["home_id"], "is_home": True})
+            if fixture["away_id"] is not None:
+                participations.append({"match_id": match_id, "player_id": fixture["away_id"], "is_home": False})
+        if participations:
+            db.execute(insert(MatchParticipation), participations)
+    return match_ids
+
+
+def plan_round_robin(participants: List[int], scheduler: SlotScheduler, double_round_robin: bool = False) -> List[Dict]:
+    """
+    Round-robin fixtures: each team/player plays every other once (twice, home and away, for
+    a double round robin), one game per round, on venue slots chosen by the constraint scheduler.
+    """
+    rounds = round_robin_rounds(participants, double=double_round_robin)
+    return build_round_robin_fixtures(rounds, scheduler)
+
+
+def knockout_round_name(round_number: int, total_rounds: int) -> str:
+    """Final, Semi-Final, Quarter-Final, then Round of N"""
+    remaining = total_rounds - round_number
+    if remaining < 3:
+        return ["Final", "Semi-Final", "Quarter-Final"][remaining]
+    return f"Round of {2 ** (remaining + 1)}"
+
+
+def seed_order(size: int) -> List[int]:
+    """Standard bracket seed positions (1 v size, 2 v size-1, ...) with top seeds kept apart"""
+    order = [1]
+    while len(order) < size:
+        mirror = 2 * len(order) + 1
+        order = [seed for top in order for seed in (top, mirror - top)]
+    return order
+
+
+def knockout_bracket(participants: List[int]) -> List[List[Dict]]:
+    """
+    Plan a single-elimination bracket: a list of rounds, each a list of match dicts with
+    round_number, bracket_position, home_id, away_id (None = TBD) and the next position/slot
+    the winner moves to. participants are in seed order; the bracket is padded to a power of
+    two with byes, which go to the top seeds and are resolved up front: a seed with a bye has
+    no first-round match and is placed straight into its second-round slot.
+    """
+    size = 1
+    while size < len(participants):
+        size *= 2
+    total_rounds = size.bit_length() - 1
+    seeded = [participants[seed - 1] if seed <= len(participants) else None for seed in seed_order(size)]
+
+    rounds = []
+    for round_number in range(1, total_rounds + 1):
+        count = size >> round_number
+        rounds.append([{
+            "round_number": round_number,
+            "bracket_position": position,
+            "home_id": None,
+            "away_id": None,
+            "next_position": (position + 1) // 2 if round_number < total_rounds else None,
+            "next_slot": ("home" if position % 2 else "away") if round_number < total_rounds else None,
+        } for position in range(1, count + 1)])
+
+    first_round = []
+    for match, (home_id, away_id) in zip(rounds[0], zip(seeded[0::2], seeded[1::2])):
+        if home_id is not None and away_id is not None:
+            match["home_id"], match["away_id"] = home_id, away_id
+            first_round.append(match)
+        else:  # Bye: the seed advances without playing
+            advancing = home_id if home_id is not None else away_id
+            rounds[1][match["next_position"] - 1][f"{match['next_slot']}_id"] = advancing
+    rounds[0] = first_round
+    return rounds
+
+
+def knockout_match_number(match: Dict, total_rounds: int) -> str:
+    return f"{knockout_round_name(match['round_number'], total_rounds)}-{match['bracket_position']}"
+
+
+def plan_knockout(participants: List[int], scheduler: SlotScheduler) -> List[Dict]:
+    """
+    Knockout fixtures for a linked match tree, in round order. Every match of every round is
+    planned up front (later rounds with TBD sides); each names the bracket position and slot
+    its winner advances to, which write_plan turns into next_match_id/next_match_slot.
+    """
+    return place_knockout_rounds(knockout_bracket(participants), scheduler)
+
+
+def place_knockout_rounds(rounds: List[List[Dict]], scheduler: SlotScheduler, not_before: Optional[datetime] = None) -> List[Dict]:
+    """Place knockout_bracket rounds on slots, round after round, from not_before on"""
+    total_rounds = len(rounds)
     
-    return matches
+    # Slots are assigned in playing order: a round starts once every match of the previous
+    # round has ended and its winners have had their rest
+    fixtures = []
+    for matches in rounds:
+        round_fixtures = []
+        for match in matches:
+            venue_id, start, end = scheduler.place(match["home_id"], match["away_id"], not_before=not_before)
+            round_fixtures.append({
+                **match,
+                "match_number": knockout_match_number(match, total_rounds),
+                "scheduled_time": start,
+                "expected_end_time": end,
+                "venue_id": venue_id,
+            })
+        if round_fixtures:
+            not_before = max(fixture["expected_end_time"] for fixture in round_fixtures) + scheduler.rest
+        fixtures += round_fixtures
+    return fixtures
+
+
+def seed_groups(participants: List[int], group_count: int) -> List[List[int]]:
+    """Snake seeding: seeds 1..g go to groups 1..g, the next g back from g to 1, and so on"""
+    groups: List[List[int]] = [[] for _ in range(group_count)]
+    for seed, participant_id in enumerate(participants):
+        lap, offset = divmod(seed, group_count)
+        groups[offset if lap % 2 == 0 else group_count - 1 - offset].append(participant_id)
+    return groups
+
+
+def plan_group_stage(groups: List[List[int]], scheduler: SlotScheduler) -> List[Dict]:
+    """
+    Round-robin fixtures for every group. Groups play side by side: round r of every group is
+    placed before round r + 1 of any, matches interleaved across groups so all groups share
+    the earliest slots.
+    """
+    group_rounds = [round_robin_rounds(group) for group in groups]
+    fixtures = []
+    counts = [0] * len(groups)
+    for round_index in range(max(len(rounds) for rounds in group_rounds)):
+        pairs = [rounds[round_index] if round_index < len(rounds) else [] for rounds in group_rounds]
+        for board in range(max(len(group_pairs) for group_pairs in pairs)):
+            for group_index, group_pairs in enumerate(pairs):
+                if board >= len(group_pairs):
+                    continue
+                home_id, away_id = group_pairs[board]
+                venue_id, start, end = scheduler.place(home_id, away_id)
+                counts[group_index] += 1
+                fixtures.append({
+                    "match_number": f"G{group_index + 1}-{counts[group_index]:03d}",
+                    "round_number": round_index + 1,
+                    "group_number": group_index + 1,
+                    "scheduled_time": start,
+                    "expected_end_time": end,
+                    "venue_id": venue_id,
+                    "home_id": home_id,
+                    "away_id": away_id,
+                })
+    return fixtures
+
+
+def qualifier_seeding(group_count: int, qualifiers_per_group: int) -> List[Tuple[int, int]]:
+    """
+    Qualifiers as (group, place) in bracket seed order: all group winners, then all runners-up,
+    and so on. Each lower place's group order is rotated as needed so that no first-round
+    match is between two qualifiers of the same group.
+    """
+    first = None
+    rotations = itertools.product(range(group_count), repeat=qualifiers_per_group - 1)
+    for shifts in itertools.islice(rotations, 1000):  # A clash-free order is normally among the first few
+        qualifiers = [(group, 1) for group in range(1, group_count + 1)]
+        for place, shift in enumerate(shifts, start=2):
+            qualifiers += [((group + shift) % group_count + 1, place) for group in range(group_count)]
+        if all(match["home_id"][0] != match["away_id"][0] for match in knockout_bracket(qualifiers)[0]):
+            return qualifiers
+        first = first or qualifiers
+    return first  # A single group always meets itself
 
 
-def generate_knockout_schedule(
+def plan_group_bracket(group_count: int, qualifiers_per_group: int, scheduler: SlotScheduler, not_before: datetime) -> Tuple[List[Dict], Dict[str, List[str]]]:
+    """
+    The knockout stage fed by the groups, with every side TBD. Returns the fixtures and, per
+    "group-place", the [match_number, side] the qualifier is written into when its group finishes.
+    """
+    rounds = knockout_bracket(qualifier_seeding(group_count, qualifiers_per_group))
+    qualifier_slots = {}
+    for matches in rounds:
+        for match in matches:
+            for side in ("home", "away"):
+                qualifier = match[f"{side}_id"]
+                if qualifier is not None:
+                    qualifier_slots[f"{qualifier[0]}-{qualifier[1]}"] = [knockout_match_number(match, len(rounds)), side]
+                    match[f"{side}_id"] = None
+    return place_knockout_rounds(rounds, scheduler, not_before=not_before), qualifier_slots
+
+
+def group_layout(participant_count: int, group_count: Optional[int], qualifiers_per_group: int) -> int:
+    """Validated number of groups: every group plays at least one match and supplies its qualifiers"""
+    group_count = group_count or max(1, round(participant_count / settings.GROUP_DEFAULT_SIZE))
+    if group_count < 1 or participant_count < 2 * group_count:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{participant_count} participants cannot fill {group_count} groups of at least 2"
+        )
+    smallest_group = participant_count // group_count
+    if qualifiers_per_group < 1 or qualifiers_per_group > smallest_group or group_count * qualifiers_per_group < 2:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"qualifiers_per_group must be between 1 and {smallest_group}, with at least 2 qualifiers in total"
+        )
+    return group_count
+
+
+def plan_swiss_round(results: SwissResults, scheduler: SlotScheduler, round_number: int) -> List[Dict]:
+    """
+    One Swiss round paired from the current results, boards in ranking order (board number in
+    bracket_position). A bye is recorded as a completed match without an away side.
+    """
+    pairs, bye = swiss_pairings(results)
+    fixtures = []
+    for board, (home_id, away_id) in enumerate(pairs, start=1):
+        venue_id, start, end = scheduler.place(home_id, away_id)
+        fixtures.append({
+            "match_number": f"R{round_number}-{board:03d}",
+            "round_number": round_number,
+            "bracket_position": board,
+            "scheduled_time": start,
+            "expected_end_time": end,
+            "venue_id": venue_id,
+            "home_id": home_id,
+            "away_id": away_id,
+        })
+    if bye is not None:
+        start = min((fixture["scheduled_time"] for fixture in fixtures), default=scheduler.start)
+        fixtures.append({
+            "match_number": f"R{round_number}-BYE",
+            "round_number": round_number,
+            "scheduled_time": start,
+            "expected_end_time": start,
+            "venue_id": None,
+            "home_id": bye,
+            "away_id": None,
+            "status": MatchStatus.COMPLETED,
+        })
+    return fixtures
+
+
+def swiss_rounds(participant_count: int, requested: Optional[int] = None) -> int:
+    """Rounds to play: as requested, by default enough to separate a single winner (ceil(log2 n))"""
+    most = participant_count - 1 if participant_count % 2 == 0 else participant_count
+    return max(1, min(requested or math.ceil(math.log2(participant_count)), most))
+
+
+def participant_scheduler(
     db: Session,
-    schedule: Schedule,
-    team_ids: Optional[List[int]] = None,
-    player_ids: Optional[List[int]] = None,
-    matches_per_day: int = 4,
-    start_time: time = time(9, 0),
-    match_duration_minutes: int = 90
-) -> List[Match]:
+    sport: Sport,
+    start: datetime,
+    constraints: SchedulingConstraints,
+    participants: List[int],
+    tournament_id: Optional[int] = None
+) -> SlotScheduler:
     """
-    Generate knockout tournament schedule.
-    Teams/players are paired and winners advance.
+    Scheduler that knows the participants' existing bookings, and within a tournament the
+    matches their players have in other sports
     """
-    matches = []
-    sport = db.query(Sport).filter(Sport.id == schedule.sport_id).first()
+    scheduler = build_scheduler(
+        db, sport, start, constraints,
+        team_ids=participants if sport.sport_type == SportType.TEAM else None
+    )
+    if tournament_id is not None:
+        avoid_player_conflicts(db, scheduler, sport, participants, tournament_id)
+    return scheduler
+
+
+def league_table_entries(participants: List[int]) -> List[Dict]:
+    """Standings entries of a single table, seeded in participant order"""
+    return [{"group_number": None, "participant_id": participant_id, "seed": seed} for seed, participant_id in enumerate(participants)]
+
+
+# ScheduleCreate fields that configure generation rather than the Schedule row
+CONSTRAINT_FIELDS = ("venue_ids", "day_start", "day_end", "rest_minutes", "match_minutes", "matches_per_day")
+
+# Schedule types whose fixtures include a linked knockout tree
+LINKED_TYPES = (ScheduleType.KNOCKOUT, ScheduleType.GROUP_KNOCKOUT)
+
+
+class SchedulePlan:
+    """A schedule and its fixtures planned in memory; nothing is written until write_plan"""
+
+    def __init__(
+        self,
+        schedule_fields: Dict,
+        sport: Sport,
+        fixtures: List[Dict],
+        linked: bool,
+        metrics: Dict,
+        optimization: Optional[Dict] = None,
+        standings: Optional[List[Dict]] = None,
+        constraints: Optional[SchedulingConstraints] = None,
+        participants: Optional[List[int]] = None
+    ):
+        self.schedule_fields = schedule_fields  # Schedule columns
+        self.sport_id = sport.id
+        self.organizer_id = sport.organizer_id
+        self.is_team_sport = sport.sport_type == SportType.TEAM
+        self.fixtures = fixtures
+        self.linked = linked  # Knockout: bracket fixtures point at the match their winner advances to
+        self.metrics = metrics
+        self.optimization = optimization  # Optimizer report, if it ran
+        self.standings = standings or []  # Standings rows to create: group_number, participant_id, seed
+        self.constraints = constraints  # What the plan was scheduled with, to re-check it before writing
+        self.participants = participants or []
+
+
+def plan_schedule(db: Session, schedule_data: Dict) -> SchedulePlan:
+    """Plan a schedule from ScheduleCreate fields: reads participants and bookings, writes nothing"""
+    schedule_fields = dict(schedule_data)
+    team_ids = schedule_fields.pop("team_ids", None)
+    player_ids = schedule_fields.pop("player_ids", None)
+    double_round_robin = schedule_fields.pop("double_round_robin", False)
+    optimize_seconds = schedule_fields.pop("optimize_seconds", None)
+    group_count = schedule_fields.pop("group_count", None)
+    qualifiers_per_group = schedule_fields.pop("qualifiers_per_group", None) or 2
+    constraints = SchedulingConstraints(**{field: schedule_fields.pop(field, None) for field in CONSTRAINT_FIELDS})
+
+    tournament_id = schedule_fields.get("tournament_id")
+    sport = db.query(Sport).filter(Sport.id == schedule_fields["sport_id"]).first()
     if not sport:
-        return matches
-    
-    participants = []
-    
-    if sport.sport_type == SportType.TEAM:
-        if not team_ids:
-            teams = db.query(Team).filter(Team.sport_id == sport.id).all()
-            team_ids = [team.id for team in teams]
-        participants = team_ids
-    else:
-        if not player_ids:
-            players = db.query(Player).join(Team).filter(Team.sport_id == sport.id).all()
-            player_ids = [player.id for player in players]
-        participants = player_ids
-    
-    if len(participants) < 2:
-        return matches
-    
-    # Ensure number of participants is power of 2 (add byes if needed)
-    import math
-    next_power_of_2 = 2 ** math.ceil(math.log2(len(participants)))
-    byes = next_power_of_2 - len(participants)
-    
-    # Round names
-    round_names = ["Final", "Semi-Final", "Quarter-Final"]
-    round_index = 0
-    
-    current_participants = participants.copy()
-    current_date = schedule.start_date.date()
-    matches_today = 0
-    match_number = 1
-    
-    while len(current_participants) > 1:
-        round_name = round_names[round_index] if round_index < len(round_names) else f"Round {round_index + 1}"
-        next_round_participants = []
-        
-        # Pair participants
-        for i in range(0, len(current_participants), 2):
-            if i + 1 < len(current_participants):
-                home_id = current_participants[i]
-                away_id = current_participants[i + 1]
-                
-                # Calculate match time
-                match_time = datetime.combine(current_date, start_time)
-                match_time += timedelta(minutes=matches_today * match_duration_minutes)
-                
-                match_data = {
-                    "match_number": f"{round_name}-{match_number}",
-                    "scheduled_time": match_time,
-                    "status": MatchStatus.SCHEDULED,
-                    "sport_id": sport.id,
-                    "schedule_id": schedule.id,
-                    "created_by": sport.organizer_id
-                }
-                
-                if sport.sport_type == SportType.TEAM:
-                    match_data["home_team_id"] = home_id
-                    match_data["away_team_id"] = away_id
-                
-                db_match = Match(**match_data)
-                db.add(db_match)
-                db.flush()
-                
-                if sport.sport_type != SportType.TEAM:
-                    db.add(MatchParticipation(match_id=db_match.id, player_id=home_id, is_home=True))
-                    db.add(MatchParticipation(match_id=db_match.id, player_id=away_id, is_home=False))
-                
-                matches.append(db_match)
-                match_number += 1
-                matches_today += 1
-                
-                # For now, winner is placeholder (will be updated when match completes)
-                next_round_participants.append(home_id)  # Placeholder
-                
-                if matches_today >= matches_per_day:
-                    matches_today = 0
-                    current_date += timedelta(days=1)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Sport not found"
+        )
+
+    schedule_type = schedule_fields["schedule_type"]
+    fixtures: List[Dict] = []
+    participants: List[int] = []
+    scheduler = None
+    optimization = None
+    standings = []
+    if schedule_type in (ScheduleType.ROUND_ROBIN, ScheduleType.KNOCKOUT):
+        participants = load_participants(db, sport, team_ids, player_ids)
+        if len(participants) >= 2:
+            scheduler = participant_scheduler(db, sport, schedule_fields["start_date"], constraints, participants, tournament_id)
+            if schedule_type == ScheduleType.ROUND_ROBIN:
+                fixtures = plan_round_robin(participants, scheduler, double_round_robin)
+                standings = league_table_entries(participants)
             else:
-                # Bye - participant advances automatically
-                next_round_participants.append(current_participants[i])
-        
-        current_participants = next_round_participants
-        round_index += 1
-    
-    return matches
+                fixtures = plan_knockout(participants, scheduler)
+            if optimize_seconds:
+                optimization = optimize_fixtures(fixtures, scheduler, schedule_type == ScheduleType.KNOCKOUT, optimize_seconds)
+    elif schedule_type == ScheduleType.SWISS:
+        # Only the first round is planned; later rounds are paired from results as each one completes
+        participants = load_participants(db, sport, team_ids, player_ids)
+        if len(participants) >= 2:
+            schedule_fields["rounds"] = swiss_rounds(len(participants), schedule_fields.get("rounds"))
+            schedule_fields["generation_config"] = json.dumps({
+                "participants": participants,
+                "constraints": constraints.to_config()
+            })
+            scheduler = participant_scheduler(db, sport, schedule_fields["start_date"], constraints, participants, tournament_id)
+            fixtures = plan_swiss_round(SwissResults(participants), scheduler, 1)
+            standings = league_table_entries(participants)
+    elif schedule_type == ScheduleType.GROUP_KNOCKOUT:
+        participants = load_participants(db, sport, team_ids, player_ids)
+        if len(participants) >= 2:
+            group_count = group_layout(len(participants), group_count, qualifiers_per_group)
+            groups = seed_groups(participants, group_count)
+            standings = [
+                {"group_number": group_number, "participant_id": participant_id, "seed": participants.index(participant_id)}
+                for group_number, group in enumerate(groups, start=1) for participant_id in group
+            ]
+            scheduler = participant_scheduler(db, sport, schedule_fields["start_date"], constraints, participants, tournament_id)
+            fixtures = plan_group_stage(groups, scheduler)
+            if optimize_seconds:
+                # Group matches may move anywhere inside the group stage; the bracket follows it
+                optimization = optimize_fixtures(fixtures, scheduler, False, optimize_seconds)
+            group_end = max(fixture["expected_end_time"] for fixture in fixtures)
+            bracket, qualifier_slots = plan_group_bracket(group_count, qualifiers_per_group, scheduler, group_end + scheduler.rest)
+            fixtures += bracket
+            schedule_fields["generation_config"] = json.dumps({
+                "qualifiers_per_group": qualifiers_per_group,
+                "qualifier_slots": qualifier_slots
+            })
+
+    if fixtures and schedule_fields.get("end_date") is None and schedule_type != ScheduleType.SWISS:
+        schedule_fields["end_date"] = max(fixture["expected_end_time"] for fixture in fixtures)
+    return SchedulePlan(
+        schedule_fields, sport, fixtures,
+        linked=schedule_type in LINKED_TYPES,
+        metrics=plan_metrics(fixtures, scheduler),
+        optimization=optimization,
+        standings=standings,
+        constraints=constraints,
+        participants=participants
+    )
+
+
+def plan_clash(db: Session, plan: SchedulePlan) -> Optional[Tuple[Dict, int]]:
+    """
+    The first fixture, and the participant, that no longer fits: the participants' bookings are
+    read again as planning read them, and each fixture must still keep its sides clear with rest.
+    None if the plan still fits
+    """
+    if not plan.participants or not plan.fixtures:
+        return None
+    sport = db.query(Sport).filter(Sport.id == plan.sport_id).first()
+    scheduler = participant_scheduler(
+        db, sport, plan.schedule_fields["start_date"], plan.constraints, plan.participants,
+        plan.schedule_fields.get("tournament_id")
+    )
+    for fixture in plan.fixtures:
+        if fixture.get("status") == MatchStatus.COMPLETED:
+            continue  # A bye is not played
+        for participant_id in (fixture["home_id"], fixture["away_id"]):
+            if not scheduler.participant_free(participant_id, fixture["scheduled_time"], fixture["expected_end_time"]):
+                return fixture, participant_id
+    return None
+
+
+def write_plan(db: Session, plan: SchedulePlan, progress: Optional[GenerationProgress] = None) -> Schedule:
+    """
+    Create a planned schedule and its matches with bulk INSERTs. Does not commit (though
+    progress.written may commit chunks along the way).
+    """
+    schedule = Schedule(**plan.schedule_fields)
+    db.add(schedule)
+    db.flush()
+    schedule_id = schedule.id
+    if progress:
+        progress.planned(schedule_id, len(plan.fixtures))
+    if plan.standings:
+        db.execute(insert(Standing), standing_rows(schedule_id, plan.standings, plan.is_team_sport))
+    if not plan.linked:
+        insert_fixtures(db, plan, schedule_id, plan.fixtures, progress)
+        record_byes(db, schedule_id, plan.sport_id, plan.is_team_sport, plan.fixtures)
+        return schedule
+
+    # Group-stage matches are not part of the bracket
+    group_fixtures = [fixture for fixture in plan.fixtures if fixture.get("group_number") is not None]
+    insert_fixtures(db, plan, schedule_id, group_fixtures, progress)
+
+    # Knockout rounds go in from the final backwards so each round's next_match_id is known
+    by_round: Dict[int, List[Dict]] = {}
+    for fixture in plan.fixtures:
+        if fixture.get("group_number") is None:
+            by_round.setdefault(fixture["round_number"], []).append(fixture)
+    next_round_ids: Dict[int, int] = {}  # bracket_position -> match id in the round above
+    for round_number in sorted(by_round, reverse=True):
+        fixtures = [
+            {**fixture, "next_match_id": next_round_ids.get(fixture["next_position"])}
+            for fixture in by_round[round_number]
+        ]
+        ids = insert_fixtures(db, plan, schedule_id, fixtures, progress)
+        next_round_ids = {fixture["bracket_position"]: match_id for fixture, match_id in zip(fixtures, ids)}
+    return schedule
+
+
+def create_generated_schedule(db: Session, schedule_data: Dict, progress: Optional[GenerationProgress] = None) -> Schedule:
+    """Plan and write a schedule from ScheduleCreate fields. Does not commit"""
+    return write_plan(db, plan_schedule(db, schedule_data), progress)
+
+
+def generate_next_swiss_round(db: Session, schedule: Schedule, round_number: int) -> List[int]:
+    """Pair and write a Swiss round from the results so far, on slots from now on. Does not commit"""
+    config = json.loads(schedule.generation_config or "{}")
+    participants = config.get("participants") or []
+    sport = db.query(Sport).filter(Sport.id == schedule.sport_id).first()
+    is_team_sport = sport.sport_type == SportType.TEAM
+    results = load_results(db, schedule.id, participants, is_team_sport)
+    scheduler = participant_scheduler(
+        db, sport, max(datetime.utcnow(), naive_utc(schedule.start_date)),
+        SchedulingConstraints.from_config(config.get("constraints") or {}),
+        participants, schedule.tournament_id
+    )
+    fixtures = plan_swiss_round(results, scheduler, round_number)
+    plan = SchedulePlan({}, sport, fixtures, linked=False, metrics={})
+    match_ids = insert_fixtures(db, plan, schedule.id, fixtures)
+    record_byes(db, schedule.id, sport.id, is_team_sport, fixtures)
+    return match_ids
+
+
+def unfinished_round_match(db: Session, schedule_id: int, round_number: int) -> Optional[int]:
+    """Id of a match in the round that is neither completed nor cancelled, if any"""
+    return db.query(Match.id).filter(
+        Match.schedule_id == schedule_id,
+        Match.round_number == round_number,
+        Match.status.notin_([MatchStatus.COMPLETED, MatchStatus.CANCELLED])
+    ).limit(1).scalar()
+
+
+def advance_swiss_schedule(db: Session, schedule_id: int, round_number: int) -> None:
+    """Pair the next Swiss round once every match of round_number is finished. Does not commit"""
+    schedule = db.get(Schedule, schedule_id)
+    if schedule is None or schedule.schedule_type != ScheduleType.SWISS or not schedule.rounds:
+        return
+    db.flush()  # The match just completed must count as finished below
+    if unfinished_round_match(db, schedule_id, round_number) is not None:
+        return
+    if round_number >= schedule.rounds:
+        if schedule.end_date is None:
+            schedule.end_date = datetime.utcnow()
+        return
+    already_paired = db.query(Match.id).filter(
+        Match.schedule_id == schedule_id, Match.round_number == round_number + 1
+    ).limit(1).scalar()
+    if already_paired is None:
+        generate_next_swiss_round(db, schedule, round_number + 1)
+
+
+def advance_group_stage(db: Session, schedule_id: int, group_number: int) -> None:
+    """
+    Once every match of the group is finished, write its qualifiers into their bracket slots
+    (one bulk UPDATE, or one bulk INSERT of participations for individual sports). Does not commit
+    """
+    schedule = db.get(Schedule, schedule_id)
+    if schedule is None or schedule.schedule_type != ScheduleType.GROUP_KNOCKOUT:
+        return
+    db.flush()  # The match just completed must count as finished below
+    unfinished = db.query(Match.id).filter(
+        Match.schedule_id == schedule_id,
+        Match.group_number == group_number,
+        Match.status.notin_([MatchStatus.COMPLETED, MatchStatus.CANCELLED])
+    ).limit(1).scalar()
+    if unfinished is not None:
+        return
+
+    config = json.loads(schedule.generation_config or "{}")
+    slots = config.get("qualifier_slots") or {}
+    rows = db.query(Standing).filter(Standing.schedule_id == schedule_id, Standing.group_number == group_number).all()
+    rules = StandingsRules.for_sport(db.get(Sport, schedule.sport_id))
+    table = rank_rows(db, [schedule_id], rows, rules)[:config.get("qualifiers_per_group") or 0]
+    placements = []  # (match_number, side, standing)
+    for place, standing in enumerate(table, start=1):
+        slot = slots.get(f"{group_number}-{place}")
+        if slot is not None:
+            placements.append((slot[0], slot[1], standing))
+    if not placements:
+        return
+    match_ids = dict(db.query(Match.match_number, Match.id).filter(
+        Match.schedule_id == schedule_id,
+        Match.match_number.in_([match_number for match_number, _, _ in placements])
+    ).all())
+
+    if placements[0][2].team_id is not None:
+        conflicts_changed(db)
+        db.execute(update(Match), [
+            {"id": match_ids[match_number], f"{side}_team_id": standing.team_id}
+            for match_number, side, standing in placements if match_number in match_ids
+        ])
+        return
+    taken = set(db.query(MatchParticipation.match_id, MatchParticipation.is_home).filter(
+        MatchParticipation.match_id.in_(match_ids.values())
+    ).all())
+    participations = [
+        {"match_id": match_ids[match_number], "player_id": standing.player_id, "is_home": side == "home"}
+        for match_number, side, standing in placements
+        if match_number in match_ids and (match_ids[match_number], side == "home") not in taken
+    ]
+    if participations:
+        conflicts_changed(db)
+        db.execute(insert(MatchParticipation), participations)
@@ -0,0 +1,59 @@
+"""
+Score history helpers.
+Every ScoreUpdate carries a per-match sequence number so clients can fetch only new events.
+"""
+import threading
+from typing import Dict, Any
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+from config import settings
+from models.score import Score, ScoreUpdate
+from services.cache import TTLCache
+
+# Serialized (and lazily compressed) public score payloads, keyed by ("score" | "score_history", match_id, ...)
+score_cache = TTLCache(ttl_seconds=settings.LIVE_SCORE_CACHE_SECONDS)
+_versions: Dict[int, int] = {}  # Per match, so a read begun before a score change is not cached after it
+_versions_lock = threading.Lock()
+
+
+def next_score_seq(db: Session, match_id: int) -> int:
+    """
+    Next sequence number for a match's score history. Allocated by bumping Score.last_seq in
+    one UPDATE ... RETURNING, so concurrent score posts for a match never get the same number
+    (the row lock orders them). Flushes, so a Score row just added to db takes part
+    """
+    db.flush()
+    seq = db.execute(
+        update(Score).where(Score.match_id == match_id).values(last_seq=Score.last_seq + 1).returning(Score.last_seq)
+    ).scalar()
+    if seq is None:
+        # No score row to count on; fall back to the history (served by the (match_id, seq) index)
+        last_seq = db.query(func.max(ScoreUpdate.seq)).filter(ScoreUpdate.match_id == match_id).scalar()
+        seq = (last_seq or 0) + 1
+    return seq
+
+
+def serialize_score_update(update: ScoreUpdate) -> Dict[str, Any]:
+    """Public representation of a score history event"""
+    return {
+        "id": update.id,
+        "seq": update.seq,
+        "home_score": update.home_score,
+        "away_score": update.away_score,
+        "period": update.period,
+        "update_type": update.update_type,
+        "description": update.description,
+        "updated_at": update.updated_at.isoformat() if update.updated_at else None
+    }
+
+
+def score_version(match_id: int) -> int:
+    """Bumped on every invalidation of the match's cached reads"""
+    return _versions.get(match_id, 0)
+
+
+def invalidate_score_cache(match_id: int) -> None:
+    """Drop cached score reads for a match after its score changes"""
+    with _versions_lock:
+        _versions[match_id] = _versions.get(match_id, 0) + 1
+    score_cache.invalidate_where(lambda key: key[1] == match_id)
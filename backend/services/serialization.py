@@ -0,0 +1,113 @@
+"""
+Fast JSON serialization for API responses.
+Uses orjson when it is installed and falls back to the standard library json module.
+Hot list endpoints select plain column tuples and turn them into dicts with a RowSerializer,
+skipping ORM object construction and Pydantic revalidation of data we just read.
+"""
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy.orm import ColumnProperty
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on installed extras
+    orjson = None
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types neither encoder handles natively"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z)
+    return json.dumps(content, default=_default, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class: renders with orjson when available"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def column_names(schema: Type[BaseModel], entity) -> List[str]:
+    """Schema fields that are plain columns on the mapped entity (relationships are skipped)"""
+    names = []
+    for name in schema.model_fields:
+        attr = getattr(entity, name, None)
+        if attr is not None and isinstance(getattr(attr, "property", None), ColumnProperty):
+            names.append(name)
+    return names
+
+
+class RowSerializer:
+    """
+    Precompiled mapping from flat row tuples to (optionally nested) response dicts.
+    The select list is derived from the response schema so both stay in sync, and the
+    row -> dict conversion is compiled once into a single dict-literal function.
+    Nested objects are null when their first column (the id) is null, as for outer joins.
+    """
+
+    def __init__(
+        self,
+        schema: Type[BaseModel],
+        entity,
+        nested: Optional[Dict[str, Tuple[Type[BaseModel], Any]]] = None
+    ):
+        groups = [(name, nested_entity, column_names(nested_schema, nested_entity))
+                  for name, (nested_schema, nested_entity) in (nested or {}).items()]
+        self._build(entity, column_names(schema, entity), groups)
+
+    @classmethod
+    def from_names(
+        cls,
+        entity,
+        names: Sequence[str],
+        groups: Sequence[Tuple[str, Any, Sequence[str]]] = ()
+    ) -> "RowSerializer":
+        """Build from explicit column names; groups are (key, entity, column names) triples"""
+        serializer = cls.__new__(cls)
+        serializer._build(entity, names, groups)
+        return serializer
+
+    def _build(self, entity, top: Sequence[str], groups: Sequence[Tuple[str, Any, Sequence[str]]]):
+        self.columns = [getattr(entity, name) for name in top]
+        for _, nested_entity, names in groups:
+            self.columns.extend(getattr(nested_entity, name) for name in names)
+        self.serialize = self._compile(top, [(name, names) for name, _, names in groups])
+
+    @staticmethod
+    def _compile(top: Sequence[str], groups: Sequence[Tuple[str, Sequence[str]]]):
+        index = 0
+        parts = []
+        for name in top:
+            parts.append(f"{name!r}: r[{index}]")
+            index += 1
+        for group_name, names in groups:
+            first = index
+            inner = []
+            for name in names:
+                inner.append(f"{name!r}: r[{index}]")
+                index += 1
+            parts.append(f"{group_name!r}: None if r[{first}] is None else {{{', '.join(inner)}}}")
+        source = f"lambda r: {{{', '.join(parts)}}}"
+        return eval(source, {"__builtins__": {}})
+
+    def serialize_all(self, rows) -> List[Dict[str, Any]]:
+        serialize = self.serialize
+        return [serialize(row) for row in rows]
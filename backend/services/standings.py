@@ -0,0 +1,408 @@
+"""
+Incrementally maintained standings.
+Rows are created when a schedule is written and each completed match adds its result to the
+two rows it concerns, so reading a table is one range read of its rows, not a pass over the
+match history. Points and tie-breakers come from the sport's match_config "standings" entry
+(falling back to the STANDINGS_* settings); recompute_standings rebuilds a schedule's rows
+from its completed matches with one GROUP BY. A Swiss bye (a completed match with one side and
+no score) counts as a won game worth the bye points.
+Rendered tables are cached per schedule and dropped when a commit changes their rows.
+"""
+import json
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from sqlalchemy import and_, case, event, exists, func, literal, null, select, union_all, update
+from sqlalchemy.orm import Session, aliased
+from config import settings
+from models.auth import User
+from models.match import Match, MatchParticipation, MatchStatus
+from models.player import Player
+from models.schedule import Schedule, ScheduleType
+from models.score import Score
+from models.sport import Sport
+from models.standing import Standing
+from models.team import Team
+from services.cache import TTLCache
+
+standings_cache = TTLCache(ttl_seconds=settings.STANDINGS_CACHE_SECONDS, max_entries=1000)
+_versions: Dict[int, int] = {}  # Bumped per schedule on invalidation, so a table built across a commit is not cached
+
+# session.info key: schedule ids whose standings changed in this transaction
+CHANGED_KEY = "standings_changed"
+
+TIE_BREAKERS = ("goal_difference", "goals_for", "wins", "head_to_head")
+
+
+class StandingsRules:
+    """Points per result and tie-breakers (applied in order after points, then seed)"""
+
+    def __init__(
+        self, win_points: int = None, draw_points: int = None, loss_points: int = None,
+        tie_breakers: List[str] = None, bye_points: int = None
+    ):
+        self.win_points = settings.STANDINGS_WIN_POINTS if win_points is None else win_points
+        self.draw_points = settings.STANDINGS_DRAW_POINTS if draw_points is None else draw_points
+        self.loss_points = settings.STANDINGS_LOSS_POINTS if loss_points is None else loss_points
+        bye_points = settings.STANDINGS_BYE_POINTS if bye_points is None else bye_points
+        self.bye_points = self.win_points if bye_points is None else bye_points
+        tie_breakers = settings.STANDINGS_TIE_BREAKERS if tie_breakers is None else tie_breakers
+        self.tie_breakers = [name for name in tie_breakers if name in TIE_BREAKERS]
+
+    @classmethod
+    def for_sport(cls, sport: Optional[Sport]) -> "StandingsRules":
+        """From match_config {"standings": {"win_points", "draw_points", "loss_points", "tie_breakers", "bye_points"}}"""
+        try:
+            config = json.loads(sport.match_config) if sport is not None and sport.match_config else {}
+        except (TypeError, ValueError):
+            config = {}
+        standings = config.get("standings") if isinstance(config, dict) else None
+        if not isinstance(standings, dict):
+            return cls()
+        return cls(
+            standings.get("win_points"), standings.get("draw_points"), standings.get("loss_points"),
+            standings.get("tie_breakers"), standings.get("bye_points")
+        )
+
+    def points(self, scored: int, conceded: int) -> int:
+        if scored > conceded:
+            return self.win_points
+        return self.draw_points if scored == conceded else self.loss_points
+
+
+def standing_rows(schedule_id: int, entries: List[Dict], is_team_sport: bool) -> List[Dict]:
+    """Zeroed rows for a bulk INSERT from {"group_number", "participant_id", "seed"} entries"""
+    column = "team_id" if is_team_sport else "player_id"
+    return [
+        {"schedule_id": schedule_id, "group_number": entry["group_number"], column: entry["participant_id"], "seed": entry["seed"]}
+        for entry in entries
+    ]
+
+
+def participant_id(row) -> int:
+    return row.team_id if row.team_id is not None else row.player_id
+
+
+def match_sides(db: Session, match: Match) -> Tuple[Optional[int], Optional[int], str]:
+    """(home, away, Standing column): teams for team sports, players from participations otherwise"""
+    if match.home_team_id is not None or match.away_team_id is not None:
+        return match.home_team_id, match.away_team_id, "team_id"
+    sides = dict(db.query(MatchParticipation.is_home, MatchParticipation.player_id).filter(
+        MatchParticipation.match_id == match.id
+    ).all())
+    return sides.get(True), sides.get(False), "player_id"
+
+
+def standings_changed(db: Session, schedule_id: int) -> None:
+    """Drop the schedule's cached table once db commits"""
+    db.info.setdefault(CHANGED_KEY, set()).add(schedule_id)
+
+
+def record_result(db: Session, match: Match, home_score: int, away_score: int, sign: int = 1) -> None:
+    """
+    Add a match's result to its schedule's standings rows, if it has any (sign=-1 takes it back
+    out), with one UPDATE of SQL increments per side, so results of the same participant
+    completing at once don't overwrite each other. Does not commit
+    """
+    if match.schedule_id is None:
+        return
+    home_id, away_id, column = match_sides(db, match)
+    if home_id is None or away_id is None:
+        return
+    rules = StandingsRules.for_sport(db.get(Sport, match.sport_id))
+    group = Standing.group_number == match.group_number if match.group_number is not None else Standing.group_number.is_(None)
+    updated = 0
+    for participant, scored, conceded in ((home_id, home_score, away_score), (away_id, away_score, home_score)):
+        outcome = "won" if scored > conceded else "drawn" if scored == conceded else "lost"
+        updated += db.execute(
+            update(Standing).where(
+                Standing.schedule_id == match.schedule_id, group, getattr(Standing, column) == participant
+            ).values(**{
+                "played": Standing.played + sign,
+                outcome: getattr(Standing, outcome) + sign,
+                "score_for": Standing.score_for + sign * scored,
+                "score_against": Standing.score_against + sign * conceded,
+                "points": Standing.points + sign * rules.points(scored, conceded),
+            })
+        ).rowcount
+    if updated:
+        standings_changed(db, match.schedule_id)
+
+
+def record_byes(db: Session, schedule_id: int, sport_id: int, is_team_sport: bool, fixtures: List[Dict]) -> None:
+    """
+    Credit the byes among freshly written fixtures (completed, one side) to their standings rows
+    with a SQL increment; byes are written completed, so they never pass through complete_match.
+    Does not commit
+    """
+    byes = [
+        fixture["home_id"] for fixture in fixtures
+        if fixture.get("status") == MatchStatus.COMPLETED and fixture.get("away_id") is None and fixture.get("home_id") is not None
+    ]
+    if not byes:
+        return
+    rules = StandingsRules.for_sport(db.get(Sport, sport_id))
+    column = Standing.team_id if is_team_sport else Standing.player_id
+    db.flush()  # Pending row changes must not overwrite the increment later
+    db.execute(
+        update(Standing).where(
+            Standing.schedule_id == schedule_id, Standing.group_number.is_(None), column.in_(byes)
+        ).values(played=Standing.played + 1, won=Standing.won + 1, points=Standing.points + rules.bye_points),
+        execution_options={"synchronize_session": False}
+    )
+    standings_changed(db, schedule_id)
+
+
+def head_to_head_points(
+    db: Session, schedule_ids: Iterable[int], rows: List, rules: StandingsRules, by_group: bool = True
+) -> Dict[Tuple, int]:
+    """
+    Points each participant took from matches against participants level with it on points
+    (in the same group, with by_group), keyed (group_number, participant). One query over the
+    tied participants' matches
+    """
+    tied: Dict[Tuple, Set[int]] = {}
+    for row in rows:
+        tied.setdefault((getattr(row, "group_number", None), row.points), set()).add(participant_id(row))
+    tied = {key: members for key, members in tied.items() if len(members) > 1}
+    if not tied:
+        return {}
+    level_with = {(key[0], member): members for key, members in tied.items() for member in members}
+    candidates = set().union(*tied.values())
+
+    points: Dict[Tuple, int] = {}
+    for group_number, home_id, away_id, home_score, away_score in completed_sides(db, schedule_ids, candidates):
+        group_number = group_number if by_group else None
+        members = level_with.get((group_number, home_id))
+        if members is None or away_id not in members:
+            continue
+        points[(group_number, home_id)] = points.get((group_number, home_id), 0) + rules.points(home_score, away_score)
+        points[(group_number, away_id)] = points.get((group_number, away_id), 0) + rules.points(away_score, home_score)
+    return points
+
+
+def completed_sides(db: Session, schedule_ids: Iterable[int], participants: Set[int]) -> List[Tuple]:
+    """(group_number, home, away, home_score, away_score) of completed, scored matches among participants"""
+    home_entry = select(MatchParticipation.player_id).where(
+        MatchParticipation.match_id == Match.id, MatchParticipation.is_home == True
+    ).scalar_subquery()
+    away_entry = select(MatchParticipation.player_id).where(
+        MatchParticipation.match_id == Match.id, MatchParticipation.is_home == False
+    ).scalar_subquery()
+    home = func.coalesce(Match.home_team_id, home_entry)
+    away = func.coalesce(Match.away_team_id, away_entry)
+    return db.query(Match.group_number, home, away, Score.home_score, Score.away_score).join(
+        Score, Score.match_id == Match.id
+    ).filter(
+        Match.schedule_id.in_(list(schedule_ids)),
+        Match.status == MatchStatus.COMPLETED,
+        home.in_(participants),
+        away.in_(participants)
+    ).all()
+
+
+def ranked(rows: List, rules: Optional[StandingsRules] = None, head_to_head: Optional[Dict[Tuple, int]] = None) -> List:
+    """Table order: points, then the rules' tie-breakers, then seed"""
+    rules = rules or StandingsRules()
+    head_to_head = head_to_head or {}
+
+    def order(row):
+        key = [-row.points]
+        for name in rules.tie_breakers:
+            if name == "goal_difference":
+                key.append(row.score_against - row.score_for)
+            elif name == "goals_for":
+                key.append(-row.score_for)
+            elif name == "wins":
+                key.append(-row.won)
+            else:
+                key.append(-head_to_head.get((getattr(row, "group_number", None), participant_id(row)), 0))
+        key.append(row.seed)
+        return key
+
+    return sorted(rows, key=order)
+
+
+def rank_rows(db: Session, schedule_ids: Iterable[int], rows: List, rules: StandingsRules, by_group: bool = True) -> List:
+    """ranked, with head-to-head points looked up only when the rules use them"""
+    head_to_head = None
+    if "head_to_head" in rules.tie_breakers:
+        head_to_head = head_to_head_points(db, schedule_ids, rows, rules, by_group)
+    return ranked(rows, rules, head_to_head)
+
+
+def recompute_standings(db: Session, schedule: Schedule) -> None:
+    """
+    Rebuild a schedule's rows from its completed, scored matches and byes: one GROUP BY over both
+    sides of every match. Rows keep their seed; participants without a row get one. Does not commit
+    """
+    rules = StandingsRules.for_sport(db.get(Sport, schedule.sport_id))
+    scope = [Match.schedule_id == schedule.id, Match.status == MatchStatus.COMPLETED]
+    if schedule.schedule_type == ScheduleType.GROUP_KNOCKOUT:
+        scope.append(Match.group_number.isnot(None))  # The bracket has no table
+    sides = []
+    for is_home, team_column in ((True, Match.home_team_id), (False, Match.away_team_id)):
+        scored, conceded = (Score.home_score, Score.away_score) if is_home else (Score.away_score, Score.home_score)
+        sides.append(select(
+            Match.group_number.label("group_number"), team_column.label("team_id"), null().label("player_id"),
+            scored.label("scored"), conceded.label("conceded"), literal(0).label("bye")
+        ).join(Score, Score.match_id == Match.id).where(*scope, team_column.isnot(None)))
+        sides.append(select(
+            Match.group_number.label("group_number"), null().label("team_id"), MatchParticipation.player_id.label("player_id"),
+            scored.label("scored"), conceded.label("conceded"), literal(0).label("bye")
+        ).join(Score, Score.match_id == Match.id).join(
+            MatchParticipation, and_(MatchParticipation.match_id == Match.id, MatchParticipation.is_home == is_home)
+        ).where(*scope, Match.home_team_id.is_(None), Match.away_team_id.is_(None)))
+
+    # Byes: one side and no score
+    unscored = ~exists().where(Score.match_id == Match.id)
+    sides.append(select(
+        Match.group_number.label("group_number"), Match.home_team_id.label("team_id"), null().label("player_id"),
+        literal(0).label("scored"), literal(0).label("conceded"), literal(1).label("bye")
+    ).where(*scope, Match.home_team_id.isnot(None), Match.away_team_id.is_(None), unscored))
+    away = aliased(MatchParticipation)
+    away_entry = exists().where(away.match_id == Match.id, away.is_home == False)
+    sides.append(select(
+        Match.group_number.label("group_number"), null().label("team_id"), MatchParticipation.player_id.label("player_id"),
+        literal(0).label("scored"), literal(0).label("conceded"), literal(1).label("bye")
+    ).join(
+        MatchParticipation, and_(MatchParticipation.match_id == Match.id, MatchParticipation.is_home == True)
+    ).where(*scope, Match.home_team_id.is_(None), Match.away_team_id.is_(None), ~away_entry, unscored))
+
+    side = union_all(*sides).subquery()
+    played_game = side.c.bye == 0
+    totals = db.execute(select(
+        side.c.group_number, side.c.team_id, side.c.player_id,
+        func.count(),
+        func.sum(case((side.c.bye == 1, 1), (side.c.scored > side.c.conceded, 1), else_=0)),
+        func.sum(case((and_(played_game, side.c.scored == side.c.conceded), 1), else_=0)),
+        func.sum(case((and_(played_game, side.c.scored < side.c.conceded), 1), else_=0)),
+        func.sum(side.c.scored),
+        func.sum(side.c.conceded),
+        func.sum(side.c.bye),
+    ).group_by(side.c.group_number, side.c.team_id, side.c.player_id)).all()
+
+    rows = {(row.group_number, row.team_id, row.player_id): row for row in db.query(Standing).filter(Standing.schedule_id == schedule.id)}
+    for row in rows.values():
+        row.played = row.won = row.drawn = row.lost = row.points = row.score_for = row.score_against = 0
+    next_seed = max((row.seed for row in rows.values()), default=-1) + 1
+    for group_number, team_id, player_id, played, won, drawn, lost, score_for, score_against, byes in totals:
+        row = rows.get((group_number, team_id, player_id))
+        if row is None:
+            row = Standing(schedule_id=schedule.id, group_number=group_number, team_id=team_id, player_id=player_id, seed=next_seed)
+            next_seed += 1
+            db.add(row)
+        row.played, row.won, row.drawn, row.lost = played, won, drawn, lost
+        row.score_for, row.score_against = score_for, score_against
+        row.points = (won - byes) * rules.win_points + byes * rules.bye_points + drawn * rules.draw_points + lost * rules.loss_points
+    standings_changed(db, schedule.id)
+
+
+def table_row(position: int, row, name: Optional[str]) -> Dict:
+    return {
+        "position": position,
+        "team_id": row.team_id,
+        "player_id": row.player_id,
+        "name": name,
+        "played": row.played,
+        "won": row.won,
+        "drawn": row.drawn,
+        "lost": row.lost,
+        "score_for": row.score_for,
+        "score_against": row.score_against,
+        "score_difference": row.score_for - row.score_against,
+        "points": row.points,
+    }
+
+
+def participant_names():
+    """Outer joins naming a row's team or player"""
+    return (Team, Team.id == Standing.team_id), (Player, Player.id == Standing.player_id), (User, User.id == Player.user_id)
+
+
+def schedule_standings(db: Session, schedule: Schedule) -> Dict:
+    """
+    The schedule's tables, one per group, ranked by its sport's rules: one range read of its
+    rows (plus one query for head-to-head ties). Cached until a result changes them
+    """
+    cached = standings_cache.get(schedule.id)
+    if cached is not None:
+        return cached
+    version = _versions.get(schedule.id, 0)
+    query = db.query(Standing, func.coalesce(Team.name, User.full_name))
+    for target, condition in participant_names():
+        query = query.outerjoin(target, condition)
+    named = query.filter(Standing.schedule_id == schedule.id).all()
+    names = {row.id: name for row, name in named}
+    groups: Dict[Optional[int], List[Standing]] = {}
+    for row, _ in named:
+        groups.setdefault(row.group_number, []).append(row)
+
+    rules = StandingsRules.for_sport(db.get(Sport, schedule.sport_id))
+    head_to_head = None
+    if "head_to_head" in rules.tie_breakers:
+        head_to_head = head_to_head_points(db, [schedule.id], [row for row, _ in named], rules)
+    table = {
+        "schedule_id": schedule.id,
+        "sport_id": schedule.sport_id,
+        "tie_breakers": rules.tie_breakers,
+        "groups": [
+            {
+                "group_number": group_number,
+                "rows": [
+                    table_row(position, row, names[row.id])
+                    for position, row in enumerate(ranked(rows, rules, head_to_head), start=1)
+                ],
+            }
+            for group_number, rows in sorted(groups.items(), key=lambda item: (item[0] is not None, item[0] or 0))
+        ],
+    }
+    if _versions.get(schedule.id, 0) == version and not db.info.get(CHANGED_KEY):
+        standings_cache.set(schedule.id, table)
+    return table
+
+
+def tournament_standings(db: Session, tournament_id: int, sport: Sport) -> Dict:
+    """
+    One table for a sport across the tournament's schedules: the stored rows summed per
+    participant with one GROUP BY, so the read is proportional to the number of rows
+    """
+    scope = select(Schedule.id).where(Schedule.tournament_id == tournament_id, Schedule.sport_id == sport.id)
+    query = db.query(
+        Standing.team_id.label("team_id"),
+        Standing.player_id.label("player_id"),
+        func.max(func.coalesce(Team.name, User.full_name)).label("name"),
+        func.sum(Standing.played).label("played"),
+        func.sum(Standing.won).label("won"),
+        func.sum(Standing.drawn).label("drawn"),
+        func.sum(Standing.lost).label("lost"),
+        func.sum(Standing.points).label("points"),
+        func.sum(Standing.score_for).label("score_for"),
+        func.sum(Standing.score_against).label("score_against"),
+        func.min(Standing.seed).label("seed"),
+    )
+    for target, condition in participant_names():
+        query = query.outerjoin(target, condition)
+    rows = query.filter(Standing.schedule_id.in_(scope)).group_by(Standing.team_id, Standing.player_id).all()
+
+    rules = StandingsRules.for_sport(sport)
+    schedule_ids = [schedule_id for (schedule_id,) in db.execute(scope)] if "head_to_head" in rules.tie_breakers else []
+    return {
+        "tournament_id": tournament_id,
+        "sport_id": sport.id,
+        "tie_breakers": rules.tie_breakers,
+        "rows": [
+            table_row(position, row, row.name)
+            for position, row in enumerate(rank_rows(db, schedule_ids, rows, rules, by_group=False), start=1)
+        ],
+    }
+
+
+@event.listens_for(Session, "after_commit")
+def drop_changed_tables(session):
+    for schedule_id in session.info.pop(CHANGED_KEY, ()):
+        _versions[schedule_id] = _versions.get(schedule_id, 0) + 1
+        standings_cache.invalidate(schedule_id)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_changed_tables(session, previous_transaction):
+    session.info.pop(CHANGED_KEY, None)
@@ -0,0 +1,143 @@
+"""
+Swiss-system pairing.
+Players are ranked by points, then seed. Each score group is paired top half against bottom
+half (the Dutch system), and anyone left over floats down to the next group. Rematches are
+avoided by a depth-first search that tries the preferred opponent first and only backtracks
+when a choice leaves the rest unpairable, so an ordinary round takes one pass over the
+ranking. If no rematch-free pairing is found within SWISS_MAX_BACKTRACKS steps, the fewest
+rematches are accepted instead of searching forever.
+"""
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import and_
+from sqlalchemy.orm import Session, aliased
+from config import settings
+from models.match import Match, MatchParticipation, MatchStatus
+from models.score import Score
+
+HomeEntry = aliased(MatchParticipation)
+AwayEntry = aliased(MatchParticipation)
+
+WIN_POINTS, DRAW_POINTS, BYE_POINTS = 1.0, 0.5, 1.0
+
+
+class SwissResults:
+    """Points, opponents, colour history and byes of a Swiss event so far"""
+
+    def __init__(self, participants: List[int]):
+        self.seeds = {participant_id: seed for seed, participant_id in enumerate(participants)}
+        self.points: Dict[int, float] = {participant_id: 0.0 for participant_id in participants}
+        self.opponents: Dict[int, Set[int]] = {participant_id: set() for participant_id in participants}
+        self.home_games: Dict[int, int] = {participant_id: 0 for participant_id in participants}
+        self.last_home: Dict[int, Optional[bool]] = {participant_id: None for participant_id in participants}
+        self.byes: Set[int] = set()
+
+    def record(self, home_id: Optional[int], away_id: Optional[int], status: MatchStatus,
+               home_score: Optional[int], away_score: Optional[int]) -> None:
+        if status == MatchStatus.CANCELLED or home_id not in self.points:
+            return
+        if away_id is None:  # Bye
+            self.byes.add(home_id)
+            self.points[home_id] += BYE_POINTS
+            return
+        self.opponents[home_id].add(away_id)
+        self.opponents[away_id].add(home_id)
+        self.home_games[home_id] += 1
+        self.last_home[home_id], self.last_home[away_id] = True, False
+        if status != MatchStatus.COMPLETED or home_score is None or away_score is None:
+            return
+        if home_score == away_score:
+            self.points[home_id] += DRAW_POINTS
+            self.points[away_id] += DRAW_POINTS
+        else:
+            self.points[home_id if home_score > away_score else away_id] += WIN_POINTS
+
+    def ranking(self) -> List[int]:
+        return sorted(self.points, key=lambda participant_id: (-self.points[participant_id], self.seeds[participant_id]))
+
+
+def load_results(db: Session, schedule_id: int, participants: List[int], is_team_sport: bool) -> SwissResults:
+    """Results of every match of a Swiss schedule, in one query"""
+    results = SwissResults(participants)
+    rows = db.query(
+        Match.status, Match.home_team_id, Match.away_team_id,
+        HomeEntry.player_id, AwayEntry.player_id, Score.home_score, Score.away_score
+    ).outerjoin(
+        HomeEntry, and_(HomeEntry.match_id == Match.id, HomeEntry.is_home == True)
+    ).outerjoin(
+        AwayEntry, and_(AwayEntry.match_id == Match.id, AwayEntry.is_home == False)
+    ).outerjoin(
+        Score, Score.match_id == Match.id
+    ).filter(Match.schedule_id == schedule_id).order_by(Match.round_number, Match.id)
+    for match_status, home_team, away_team, home_player, away_player, home_score, away_score in rows:
+        if is_team_sport:
+            results.record(home_team, away_team, match_status, home_score, away_score)
+        else:
+            results.record(home_player, away_player, match_status, home_score, away_score)
+    return results
+
+
+def _colours(results: SwissResults, higher: int, lower: int) -> Tuple[int, int]:
+    """(home, away): fewer home games plays home; on a tie, alternate from the last game"""
+    if results.home_games[higher] != results.home_games[lower]:
+        return (higher, lower) if results.home_games[higher] < results.home_games[lower] else (lower, higher)
+    if results.last_home[higher] is True and results.last_home[lower] is not True:
+        return lower, higher
+    return higher, lower
+
+
+def swiss_pairings(results: SwissResults) -> Tuple[List[Tuple[int, int]], Optional[int]]:
+    """Next round as (home, away) pairs in board order, plus the participant with a bye (if odd)"""
+    ranked = results.ranking()
+    bye = None
+    if len(ranked) % 2:
+        # The lowest-ranked participant who has not had a bye yet
+        bye = next((participant_id for participant_id in reversed(ranked) if participant_id not in results.byes), ranked[-1])
+        ranked.remove(bye)
+
+    budget = [settings.SWISS_MAX_BACKTRACKS]
+    pairs = _pair(ranked, results, budget, allow_rematch=False)
+    if pairs is None:
+        pairs = _pair(ranked, results, [len(ranked) ** 2], allow_rematch=True)
+    return [_colours(results, higher, lower) for higher, lower in pairs], bye
+
+
+def _candidates(players: List[int], results: SwissResults, allow_rematch: bool) -> List[int]:
+    """Opponents for players[0] in order of preference: the Dutch partner in its score group first"""
+    first = players[0]
+    group_end = 1
+    while group_end < len(players) and results.points[players[group_end]] == results.points[first]:
+        group_end += 1
+    half = max(group_end // 2, 1)
+    candidates = players[half:group_end] + players[1:half] + players[group_end:]
+    if allow_rematch:  # Fallback: prefer new opponents, but take a rematch over no pairing
+        return sorted(candidates, key=lambda candidate: candidate in results.opponents[first])
+    return [candidate for candidate in candidates if candidate not in results.opponents[first]]
+
+
+def _pair(players: List[int], results: SwissResults, budget: List[int], allow_rematch: bool) -> Optional[List[Tuple[int, int]]]:
+    """
+    Pair players (in rank order) depth-first, preferred opponents first; None if impossible
+    or the budget of tried pairings runs out. Iterative, so large events don't hit the
+    recursion limit.
+    """
+    if not players:
+        return []
+    pairs: List[Tuple[int, int]] = []
+    stack = [(players, _candidates(players, results, allow_rematch), 0)]  # (players, candidates, next try)
+    while stack:
+        players, candidates, index = stack.pop()
+        if index >= len(candidates):
+            if pairs:
+                pairs.pop()  # Undo the choice that led here
+            continue
+        budget[0] -= 1
+        if budget[0] < 0:
+            return None
+        stack.append((players, candidates, index + 1))
+        candidate = candidates[index]
+        pairs.append((players[0], candidate))
+        rest = [player for player in players[1:] if player != candidate]
+        if not rest:
+            return pairs
+        stack.append((rest, _candidates(rest, results, allow_rematch), 0))
+    return None
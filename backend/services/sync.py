@@ -0,0 +1,58 @@
+"""
+Delta-sync tokens.
+A token is an opaque, URL-safe encoding of a database time taken when a sync started. The
+next sync reads rows changed at or after that time minus SYNC_OVERLAP_SECONDS, so writes
+committed while the previous sync was running (or within the same timestamp second) are never
+missed; clients upsert by id, so the overlap is harmless.
+The time comes from the database clock, which stamps created_at/updated_at, not from this
+process. On PostgreSQL rows are stamped with their transaction's start time, so the token is
+moved back to the start of the oldest transaction still open: its rows are not visible yet but
+will carry that earlier timestamp once committed.
+"""
+import base64
+import binascii
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import HTTPException, status
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+from config import settings
+
+# Start of the oldest open transaction on this database, or now
+OLDEST_OPEN_TRANSACTION = text("""
+    SELECT LEAST(clock_timestamp(), COALESCE(MIN(xact_start), clock_timestamp()))
+    FROM pg_stat_activity
+    WHERE datname = current_database() AND xact_start IS NOT NULL
+""")
+
+
+def sync_now(db: Session) -> datetime:
+    """Naive UTC from the database clock, matching how created_at/updated_at are stored"""
+    if db.get_bind().dialect.name == "postgresql":
+        moment = db.execute(OLDEST_OPEN_TRANSACTION).scalar()
+    else:
+        moment = db.execute(select(func.now())).scalar()
+    if isinstance(moment, str):  # SQLite's CURRENT_TIMESTAMP is UTC text
+        moment = datetime.fromisoformat(moment)
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+
+def encode_token(moment: datetime) -> str:
+    return base64.urlsafe_b64encode(moment.isoformat().encode()).decode().rstrip("=")
+
+
+def decode_token(token: Optional[str]) -> Optional[datetime]:
+    """Lower bound for changed rows, or None for a full sync"""
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        moment = datetime.fromisoformat(base64.urlsafe_b64decode(padded.encode()).decode())
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid sync token"
+        )
+    return moment - timedelta(seconds=settings.SYNC_OVERLAP_SECONDS)
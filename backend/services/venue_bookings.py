@@ -0,0 +1,171 @@
+"""
+In-memory venue booking index.
+Each venue's bookings (matches that hold the venue: anything not cancelled or postponed, and
+blackouts, keyed by blackout_key) are loaded once into an IntervalIndex, so availability and conflict checks are O(log n + k)
+bisections instead of scans. ORM writes to matches are applied incrementally after their
+transaction commits; bulk Core inserts mark their venues for reload instead.
+The index reflects this process's commits only; with several workers a conflict check is a
+fast pre-check, not a lock.
+"""
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional, Set, Tuple
+from sqlalchemy import event, func
+from sqlalchemy.orm import Session
+from config import settings
+from database import SessionLocal
+from models.match import Match, MatchStatus
+from models.venue import VenueBlackout
+from services.interval_index import IntervalIndex, build_index
+from services.venue_scheduler import blackout_key, expected_end
+
+# Statuses that give the venue back
+RELEASED_STATUSES = (MatchStatus.CANCELLED, MatchStatus.POSTPONED)
+
+# session.info keys for changes waiting on the transaction to commit
+PENDING_KEY = "venue_bookings_pending"
+RELOAD_KEY = "venue_bookings_reload"
+
+Booking = Tuple[Optional[int], Optional[datetime], Optional[datetime]]  # (venue_id, start, end); venue None = no booking
+
+
+def naive_utc(moment: Optional[datetime]) -> Optional[datetime]:
+    """Bookings are compared as naive UTC, matching how match times are stored"""
+    if moment is None or moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def match_booking(match: Match) -> Booking:
+    """The venue interval a match holds, or (None, None, None) if it holds none"""
+    if match.venue_id is None or match.scheduled_time is None or match.status in RELEASED_STATUSES:
+        return None, None, None
+    start = naive_utc(match.scheduled_time)
+    return match.venue_id, start, expected_end(start, naive_utc(match.expected_end_time or match.actual_end_time))
+
+
+class VenueBookings:
+    """Thread-safe registry of per-venue booking indexes, loaded lazily"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes: Dict[int, IntervalIndex] = {}
+        self._starts: Dict[int, Tuple[int, datetime]] = {}  # match_id -> (venue_id, start) of its indexed booking
+        self._generation: Dict[int, int] = {}  # Bumped on every change, so a load racing a commit is discarded
+
+    def _load(self, venue_id: int) -> IntervalIndex:
+        with self._lock:
+            index = self._indexes.get(venue_id)
+            if index is not None:
+                return index
+            generation = self._generation.get(venue_id, 0)
+
+        # Read committed state with its own session, never a request's uncommitted changes
+        end_column = func.coalesce(Match.expected_end_time, Match.actual_end_time)
+        with SessionLocal() as session:
+            rows = session.query(Match.id, Match.scheduled_time, end_column).filter(
+                Match.venue_id == venue_id,
+                Match.status.notin_(RELEASED_STATUSES)
+            ).all()
+            blackouts = session.query(VenueBlackout.id, VenueBlackout.start_time, VenueBlackout.end_time).filter(
+                VenueBlackout.venue_id == venue_id
+            ).all()
+        intervals = [
+            (naive_utc(start), expected_end(naive_utc(start), naive_utc(end)), match_id)
+            for match_id, start, end in rows
+        ]
+        index = build_index(intervals + [
+            (naive_utc(start), naive_utc(end), blackout_key(blackout_id)) for blackout_id, start, end in blackouts
+        ])
+
+        with self._lock:
+            if self._generation.get(venue_id, 0) != generation:
+                return index  # Changed while loading: answer from it, but don't keep it
+            self._indexes.setdefault(venue_id, index)
+            for start, _, match_id in intervals:
+                self._starts[match_id] = (venue_id, start)
+            return self._indexes[venue_id]
+
+    def bookings(self, venue_id: int, start: datetime, end: datetime):
+        """Bookings sharing time with [start, end), as (start, end, match_id or blackout_key) in start order"""
+        index = self._load(venue_id)
+        with self._lock:
+            return index.overlapping(naive_utc(start), naive_utc(end))
+
+    def conflicts(self, venue_id: int, start: datetime, end: datetime, ignore: Optional[int] = None):
+        """Bookings a match at [start, end) would clash with, changeover included"""
+        changeover = timedelta(minutes=settings.SCHEDULE_CHANGEOVER_MINUTES)
+        return [
+            booking for booking in self.bookings(venue_id, naive_utc(start) - changeover, naive_utc(end) + changeover)
+            if booking[2] != ignore
+        ]
+
+    def apply(self, changes: Dict[int, Booking]) -> None:
+        """Move committed matches to their new bookings (a venue of None drops the booking)"""
+        with self._lock:
+            for match_id, (venue_id, start, end) in changes.items():
+                previous = self._starts.pop(match_id, None)
+                if previous is not None:
+                    old_venue_id, old_start = previous
+                    self._indexes[old_venue_id].remove(old_start, match_id)
+                    self._generation[old_venue_id] = self._generation.get(old_venue_id, 0) + 1
+                if venue_id is None:
+                    continue
+                self._generation[venue_id] = self._generation.get(venue_id, 0) + 1
+                index = self._indexes.get(venue_id)
+                if index is not None:
+                    index.add(start, end, match_id)
+                    self._starts[match_id] = (venue_id, start)
+
+    def invalidate(self, venue_ids) -> None:
+        """Forget these venues' indexes; they are reloaded on next use"""
+        venue_ids = set(venue_ids)
+        with self._lock:
+            for venue_id in venue_ids:
+                self._indexes.pop(venue_id, None)
+                self._generation[venue_id] = self._generation.get(venue_id, 0) + 1
+            for match_id in [match_id for match_id, (venue_id, _) in self._starts.items() if venue_id in venue_ids]:
+                del self._starts[match_id]
+
+
+venue_bookings = VenueBookings()
+
+
+def booking_ref(key) -> Dict[str, Optional[int]]:
+    """A booking's key as response fields: the match it is, or the blackout"""
+    if isinstance(key, tuple):
+        return {"match_id": None, "blackout_id": key[1]}
+    return {"match_id": key, "blackout_id": None}
+
+
+def reload_after_commit(db: Session, venue_ids) -> None:
+    """Mark venues whose bookings changed outside the Match hooks (bulk inserts, blackouts) for reload once db commits"""
+    db.info.setdefault(RELOAD_KEY, set()).update(venue_id for venue_id in venue_ids if venue_id is not None)
+
+
+@event.listens_for(Session, "after_flush")
+def collect_booking_changes(session, flush_context):
+    """Remember the bookings of flushed matches until the transaction commits"""
+    pending: Dict[int, Booking] = session.info.setdefault(PENDING_KEY, {})
+    for obj in session.new | session.dirty:
+        if isinstance(obj, Match) and obj.id is not None:
+            pending[obj.id] = match_booking(obj)
+    for obj in session.deleted:
+        if isinstance(obj, Match) and obj.id is not None:
+            pending[obj.id] = (None, None, None)
+
+
+@event.listens_for(Session, "after_commit")
+def apply_booking_changes(session):
+    pending = session.info.pop(PENDING_KEY, None)
+    reload: Optional[Set[int]] = session.info.pop(RELOAD_KEY, None)
+    if pending:
+        venue_bookings.apply(pending)
+    if reload:
+        venue_bookings.invalidate(reload)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def discard_booking_changes(session, previous_transaction):
+    session.info.pop(PENDING_KEY, None)
+    session.info.pop(RELOAD_KEY, None)
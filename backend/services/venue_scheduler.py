@@ -0,0 +1,263 @@
+"""
+Venue- and time-aware slot assignment for generated fixtures.
+Fixtures are placed greedily, in order, into the earliest (venue, start) pair where the venue
+is free (plus changeover), every known participant has had its minimum rest since its
+previous match and has rest before its next one, and the match fits in the daily window.
+Existing bookings (matches already on those venues / involving those teams) are loaded once
+into interval indexes, so each placement is a few bisections rather than queries.
+"""
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+from config import settings
+from models.match import Match, MatchStatus
+from models.sport import Sport
+from models.venue import Venue, VenueBlackout
+from services.interval_index import IntervalIndex, build_index
+
+# match_config period types whose period_length is in minutes
+TIMED_PERIOD_TYPES = {"half", "quarter", "period"}
+
+
+def match_duration_minutes(sport: Sport) -> int:
+    """Expected match length: match_config duration_minutes, timed periods plus breaks, or the default"""
+    try:
+        config = json.loads(sport.match_config) if sport.match_config else {}
+    except (TypeError, ValueError):
+        config = {}
+    if config.get("duration_minutes"):
+        return int(config["duration_minutes"])
+    periods = config.get("periods") or 0
+    period_length = config.get("period_length") or 0
+    if config.get("period_type") in TIMED_PERIOD_TYPES and periods and period_length:
+        return periods * period_length + (periods - 1) * settings.SCHEDULE_PERIOD_BREAK_MINUTES
+    return settings.SCHEDULE_DEFAULT_MATCH_MINUTES
+
+
+def expected_end(match_start: datetime, match_end: Optional[datetime]) -> datetime:
+    """Booked end of an existing match; unknown ends get the default length"""
+    return match_end or match_start + timedelta(minutes=settings.SCHEDULE_DEFAULT_MATCH_MINUTES)
+
+
+def blackout_key(blackout_id: int) -> Tuple[str, int]:
+    """Interval key of a venue blackout in booking indexes (match bookings are keyed by match id)"""
+    return ("blackout", blackout_id)
+
+
+class SchedulingConstraints:
+    """Where and when generated fixtures may be played; None means the configured default"""
+
+    def __init__(
+        self,
+        venue_ids: Optional[List[int]] = None,
+        day_start: Optional[time] = None,
+        day_end: Optional[time] = None,
+        rest_minutes: Optional[int] = None,
+        match_minutes: Optional[int] = None,
+        matches_per_day: Optional[int] = None
+    ):
+        self.venue_ids = venue_ids
+        self.day_start = day_start or settings.SCHEDULE_DAY_START
+        self.day_end = day_end or settings.SCHEDULE_DAY_END
+        self.rest_minutes = settings.SCHEDULE_MIN_REST_MINUTES if rest_minutes is None else rest_minutes
+        self.match_minutes = match_minutes
+        self.matches_per_day = matches_per_day
+
+    def to_config(self) -> Dict:
+        """JSON-safe form, kept on schedules that generate further rounds later"""
+        return {
+            "venue_ids": self.venue_ids,
+            "day_start": self.day_start.isoformat(),
+            "day_end": self.day_end.isoformat(),
+            "rest_minutes": self.rest_minutes,
+            "match_minutes": self.match_minutes,
+            "matches_per_day": self.matches_per_day,
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict) -> "SchedulingConstraints":
+        return cls(
+            venue_ids=config.get("venue_ids"),
+            day_start=time.fromisoformat(config["day_start"]) if config.get("day_start") else None,
+            day_end=time.fromisoformat(config["day_end"]) if config.get("day_end") else None,
+            rest_minutes=config.get("rest_minutes"),
+            match_minutes=config.get("match_minutes"),
+            matches_per_day=config.get("matches_per_day")
+        )
+
+
+class SlotScheduler:
+    """
+    Places fixtures on (venue, start) pairs. A venue_id of None stands for "no venue": used
+    when the institution has none, it still keeps generated matches from overlapping.
+    """
+
+    def __init__(
+        self,
+        venue_ids: List[Optional[int]],
+        start: datetime,
+        day_start: time,
+        day_end: time,
+        duration: timedelta,
+        rest: timedelta,
+        changeover: timedelta,
+        matches_per_day: Optional[int] = None
+    ):
+        self.venue_ids = venue_ids or [None]
+        self.start = start
+        self.day_start = day_start
+        self.day_end = day_end
+        self.duration = duration
+        self.rest = rest
+        self.changeover = changeover
+        self.matches_per_day = matches_per_day
+        self.venues: Dict[Optional[int], IntervalIndex] = {venue_id: IntervalIndex() for venue_id in self.venue_ids}
+        self.participants: Dict[int, IntervalIndex] = {}
+        self._slot_load: Dict[datetime, int] = {}
+        self._day_load: Dict[date, int] = {}
+
+        step = duration + changeover
+        slots_per_day = []
+        slot = datetime.combine(date.min, day_start)
+        while slot + duration <= datetime.combine(date.min, day_end):
+            slots_per_day.append(slot.time())
+            slot += step
+        if not slots_per_day:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Daily window is shorter than one match"
+            )
+        self.slots_per_day = slots_per_day
+        self._floor = next(self._candidates(start))  # No grid slot before this has a free venue
+
+    def load_bookings(self, db: Session, team_ids: List[int]) -> None:
+        """Index matches already booked on the venues or involving the teams"""
+        active = Match.status.notin_([MatchStatus.CANCELLED, MatchStatus.COMPLETED])
+        holds_venue = Match.status.notin_([MatchStatus.CANCELLED, MatchStatus.POSTPONED])  # As in the venue booking index
+        since = self.start - timedelta(days=1)
+        end_column = func.coalesce(Match.expected_end_time, Match.actual_end_time)
+
+        venue_ids = [venue_id for venue_id in self.venue_ids if venue_id is not None]
+        if venue_ids:
+            bookings: Dict[int, list] = {venue_id: [] for venue_id in venue_ids}
+            rows = db.query(Match.id, Match.venue_id, Match.scheduled_time, end_column).filter(
+                Match.venue_id.in_(venue_ids), Match.scheduled_time >= since, holds_venue
+            )
+            for match_id, venue_id, match_start, match_end in rows:
+                bookings[venue_id].append((match_start, expected_end(match_start, match_end) + self.changeover, match_id))
+            # Closed venues: like a match, a blackout leaves a changeover before anything follows it
+            blackouts = db.query(VenueBlackout.id, VenueBlackout.venue_id, VenueBlackout.start_time, VenueBlackout.end_time).filter(
+                VenueBlackout.venue_id.in_(venue_ids), VenueBlackout.end_time >= since
+            )
+            for blackout_id, venue_id, blackout_start, blackout_end in blackouts:
+                bookings[venue_id].append((blackout_start, blackout_end + self.changeover, blackout_key(blackout_id)))
+            self.venues.update({venue_id: build_index(intervals) for venue_id, intervals in bookings.items()})
+
+        if team_ids:
+            bookings = {team_id: [] for team_id in team_ids}
+            rows = db.query(Match.id, Match.home_team_id, Match.away_team_id, Match.scheduled_time, end_column).filter(
+                or_(Match.home_team_id.in_(team_ids), Match.away_team_id.in_(team_ids)),
+                Match.scheduled_time >= since, active
+            )
+            for match_id, home_id, away_id, match_start, match_end in rows:
+                interval = (match_start, expected_end(match_start, match_end), match_id)
+                for team_id in (home_id, away_id):
+                    if team_id in bookings:
+                        bookings[team_id].append(interval)
+            self.participants.update({team_id: build_index(intervals) for team_id, intervals in bookings.items()})
+
+    def add_participant_bookings(self, participant_id: int, intervals) -> None:
+        """Also keep a participant clear (with rest) of these (start, end, key) bookings"""
+        index = self.participants.get(participant_id)
+        self.participants[participant_id] = build_index((index.intervals() if index else []) + list(intervals))
+
+    def _candidates(self, earliest: datetime) -> Iterator[datetime]:
+        day = earliest.date()
+        last_day = day + timedelta(days=settings.SCHEDULE_MAX_DAYS)
+        while day <= last_day:
+            if self.matches_per_day and self._day_load.get(day, 0) >= self.matches_per_day:
+                day += timedelta(days=1)
+                continue
+            for slot in self.slots_per_day:
+                candidate = datetime.combine(day, slot)
+                if candidate >= earliest:
+                    yield candidate
+            day += timedelta(days=1)
+
+    def participant_free(self, participant_id: Optional[int], start: datetime, end: datetime) -> bool:
+        """Whether a participant has no booking within rest of [start, end)"""
+        if participant_id is None:
+            return True
+        index = self.participants.get(participant_id)
+        return index is None or index.is_free(start - self.rest, end + self.rest)
+
+    def place(self, home_id: Optional[int], away_id: Optional[int], not_before: Optional[datetime] = None):
+        """Book the earliest valid slot; returns (venue_id, start, end)"""
+        earliest = max(self._floor, not_before or self.start)
+        for candidate in self._candidates(earliest):
+            end = candidate + self.duration
+            if not (self.participant_free(home_id, candidate, end) and self.participant_free(away_id, candidate, end)):
+                continue
+            for venue_id in self.venue_ids:
+                if self.venues[venue_id].is_free(candidate, end + self.changeover):
+                    self._book(venue_id, home_id, away_id, candidate, end)
+                    return venue_id, candidate, end
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"No free venue slot within {settings.SCHEDULE_MAX_DAYS} days of {earliest.isoformat()}"
+        )
+
+    def _book(self, venue_id, home_id, away_id, start: datetime, end: datetime) -> None:
+        self.venues[venue_id].add(start, end + self.changeover)
+        for participant_id in (home_id, away_id):
+            if participant_id is not None:
+                self.participants.setdefault(participant_id, IntervalIndex()).add(start, end)
+
+        # Move the floor past grid slots that are now full on every venue
+        self._slot_load[start] = self._slot_load.get(start, 0) + 1
+        self._day_load[start.date()] = self._day_load.get(start.date(), 0) + 1
+        while self._slot_load.get(self._floor, 0) >= len(self.venue_ids) or (
+            self.matches_per_day and self._day_load.get(self._floor.date(), 0) >= self.matches_per_day
+        ):
+            following = next(self._candidates(self._floor + timedelta(seconds=1)), None)
+            if following is None:
+                break
+            self._floor = following
+
+
+def resolve_venue_ids(db: Session, sport: Sport, venue_ids: Optional[List[int]]) -> List[int]:
+    """The requested venues, or by default the sport institution's active venues"""
+    if venue_ids is not None:
+        return list(venue_ids)
+    return [venue_id for (venue_id,) in db.query(Venue.id).filter(
+        Venue.institution_id == sport.institution_id, Venue.is_active == True
+    ).order_by(Venue.id)]
+
+
+def build_scheduler(
+    db: Session,
+    sport: Sport,
+    start: datetime,
+    constraints: Optional[SchedulingConstraints],
+    team_ids: Optional[List[int]] = None
+) -> SlotScheduler:
+    """Scheduler over the requested venues (default: the sport institution's active venues)"""
+    constraints = constraints or SchedulingConstraints()
+    venue_ids = resolve_venue_ids(db, sport, constraints.venue_ids)
+    minutes = constraints.match_minutes or match_duration_minutes(sport)
+
+    scheduler = SlotScheduler(
+        venue_ids=venue_ids,
+        start=start.replace(tzinfo=None) if start.tzinfo else start,
+        day_start=constraints.day_start,
+        day_end=constraints.day_end,
+        duration=timedelta(minutes=minutes),
+        rest=timedelta(minutes=constraints.rest_minutes),
+        changeover=timedelta(minutes=settings.SCHEDULE_CHANGEOVER_MINUTES),
+        matches_per_day=constraints.matches_per_day
+    )
+    scheduler.load_bookings(db, team_ids or [])
+    return scheduler
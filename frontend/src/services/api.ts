@@ -1,5 +1,5 @@
 import axios, { AxiosInstance, AxiosError } from 'axios'
-import type { User, Institution, Player, Match, Score, Tournament, Venue, Notification, Schedule } from '@/types'
+import type { User, Institution, Player, Match, MatchFull, Score, Tournament, TournamentConflicts, Venue, VenueAvailability, VenueBlackout, MatchMove, Notification, Schedule, DashboardSummary, SyncResponse, Job, SchedulePreview, BatchItem, BatchItemResponse, Bracket, ScheduleStandings, TournamentStandings } from '@/types'
 
 // Use absolute path in development (via Vite proxy) or absolute URL from env
 const API_BASE_URL = import.meta.env.VITE_API_URL || '/api/v1'
@@ -68,6 +68,21 @@ class ApiService {
     return response.data
   }
 
+  async getDashboard(role: 'admin' | 'organizer' | 'coach' | 'player'): Promise<DashboardSummary> {
+    const response = await this.api.get<DashboardSummary>(`/dashboard/${role}`)
+    return response.data
+  }
+
+  async batch(requests: BatchItem[]): Promise<BatchItemResponse[]> {
+    const response = await this.api.post<{ responses: BatchItemResponse[] }>('/batch', { requests })
+    return response.data.responses
+  }
+
+  async sync(since?: string): Promise<SyncResponse> {
+    const response = await this.api.get<SyncResponse>('/sync', { params: since ? { since } : {} })
+    return response.data
+  }
+
   // Admin endpoints
   async createInstitution(data: Partial<Institution> | FormData): Promise<Institution> {
     // If data is FormData, let the browser set the Content-Type
@@ -114,6 +129,25 @@ class ApiService {
     return response.data
   }
 
+  async getVenueAvailability(venueId: number, from?: string, to?: string): Promise<VenueAvailability> {
+    const response = await this.api.get<VenueAvailability>(`/venues/${venueId}/availability`, { params: { from, to } })
+    return response.data
+  }
+
+  async getVenueBlackouts(venueId: number): Promise<VenueBlackout[]> {
+    const response = await this.api.get<VenueBlackout[]>(`/venues/${venueId}/blackouts`)
+    return response.data
+  }
+
+  async createVenueBlackout(venueId: number, data: { start_time: string; end_time: string; reason?: string }): Promise<{ blackout: VenueBlackout; moves: MatchMove[] }> {
+    const response = await this.api.post<{ blackout: VenueBlackout; moves: MatchMove[] }>(`/venues/${venueId}/blackouts`, data)
+    return response.data
+  }
+
+  async deleteVenueBlackout(venueId: number, blackoutId: number): Promise<void> {
+    await this.api.delete(`/venues/${venueId}/blackouts/${blackoutId}`)
+  }
+
   // Organizer endpoints
   async getMyInstitution(): Promise<Institution> {
     const response = await this.api.get<Institution>('/organizer/institution')
@@ -175,18 +209,73 @@ class ApiService {
     return response.data
   }
 
+  async getTournamentConflicts(tournamentId: number): Promise<TournamentConflicts> {
+    const response = await this.api.get<TournamentConflicts>(`/tournaments/${tournamentId}/conflicts`)
+    return response.data
+  }
+
+  async getTournamentStandings(tournamentId: number, sportId: number): Promise<TournamentStandings> {
+    const response = await this.api.get<TournamentStandings>(`/tournaments/${tournamentId}/sports/${sportId}/standings`)
+    return response.data
+  }
+
   // Match endpoints
   async createSchedule(data: Partial<Schedule>): Promise<Schedule> {
     const response = await this.api.post<Schedule>('/matches/schedules', data)
     return response.data
   }
 
+  async previewSchedule(data: Partial<Schedule>): Promise<SchedulePreview> {
+    const response = await this.api.post<SchedulePreview>('/matches/schedules/preview', data)
+    return response.data
+  }
+
+  async commitSchedulePreview(previewId: string): Promise<Schedule> {
+    const response = await this.api.post<Schedule>(`/matches/schedules/previews/${previewId}/commit`)
+    return response.data
+  }
+
+  async pairNextRound(scheduleId: number): Promise<Match[]> {
+    const response = await this.api.post<Match[]>(`/matches/schedules/${scheduleId}/next-round`)
+    return response.data
+  }
+
+  async createScheduleJob(schedules: Partial<Schedule>[], tournamentId?: number): Promise<Job> {
+    const response = await this.api.post<Job>('/jobs/schedules', { schedules, tournament_id: tournamentId })
+    return response.data
+  }
+
+  async createStatisticsReconciliationJob(repair = false): Promise<Job> {
+    const response = await this.api.post<Job>('/jobs/statistics-reconciliation', null, { params: { repair } })
+    return response.data
+  }
+
+  async getJob(jobId: string): Promise<Job> {
+    const response = await this.api.get<Job>(`/jobs/${jobId}`)
+    return response.data
+  }
+
   async getSchedules(sportId?: number): Promise<Schedule[]> {
     const params = sportId ? { sport_id: sportId } : {}
     const response = await this.api.get<Schedule[]>('/matches/schedules', { params })
     return response.data
   }
 
+  async getBracket(scheduleId: number): Promise<Bracket> {
+    const response = await this.api.get<Bracket>(`/matches/schedules/${scheduleId}/bracket`)
+    return response.data
+  }
+
+  async getScheduleStandings(scheduleId: number): Promise<ScheduleStandings> {
+    const response = await this.api.get<ScheduleStandings>(`/matches/schedules/${scheduleId}/standings`)
+    return response.data
+  }
+
+  async recomputeScheduleStandings(scheduleId: number): Promise<ScheduleStandings> {
+    const response = await this.api.post<ScheduleStandings>(`/matches/schedules/${scheduleId}/standings/recompute`)
+    return response.data
+  }
+
   async getMatches(sportId?: number, scheduleId?: number, status?: string): Promise<Match[]> {
     const params: any = {}
     if (sportId) params.sport_id = sportId
@@ -201,11 +290,22 @@ class ApiService {
     return response.data
   }
 
+  async getMatchFull(matchId: number, historyLimit?: number): Promise<MatchFull> {
+    const params = historyLimit !== undefined ? { history_limit: historyLimit } : {}
+    const response = await this.api.get<MatchFull>(`/matches/${matchId}/full`, { params })
+    return response.data
+  }
+
   async updateMatch(matchId: number, data: Partial<Match>): Promise<Match> {
     const response = await this.api.patch<Match>(`/matches/${matchId}`, data)
     return response.data
   }
 
+  async rescheduleMatch(matchId: number, data: { not_before?: string; venue_ids?: number[] } = {}): Promise<{ moves: MatchMove[] }> {
+    const response = await this.api.post<{ moves: MatchMove[] }>(`/matches/${matchId}/reschedule`, data)
+    return response.data
+  }
+
   async updateScore(matchId: number, data: {
     home_score?: number
     away_score?: number
@@ -222,8 +322,12 @@ class ApiService {
     return response.data
   }
 
-  async getScoreHistory(matchId: number): Promise<any[]> {
-    const response = await this.api.get<any[]>(`/matches/${matchId}/score/history`)
+  async getScoreHistory(matchId: number, params?: {
+    since_seq?: number
+    limit?: number
+    order?: 'asc' | 'desc'
+  }): Promise<any[]> {
+    const response = await this.api.get<any[]>(`/matches/${matchId}/score/history`, { params })
     return response.data
   }
 
@@ -79,6 +79,7 @@ export interface Match {
   scheduled_time: string
   actual_start_time: string | null
   actual_end_time: string | null
+  expected_end_time: string | null
   status: 'scheduled' | 'live' | 'completed' | 'cancelled' | 'postponed'
   venue_name: string | null
   venue_id: number | null
@@ -87,6 +88,11 @@ export interface Match {
   home_team_id: number | null
   away_team_id: number | null
   schedule_id: number | null
+  round_number: number | null
+  group_number: number | null
+  bracket_position: number | null
+  next_match_id: number | null
+  next_match_slot: 'home' | 'away' | null
   created_by: number
   created_at: string
   // Optional relationships (may be included by backend)
@@ -106,6 +112,113 @@ export interface Score {
   updated_at: string | null
 }
 
+export interface LineupDetail {
+  id: number
+  match_id: number
+  team_id: number
+  is_starting: boolean
+  notes: string | null
+  players: {
+    player_id: number
+    player_name: string | null
+    jersey_number: number | null
+    position: string | null
+    is_starting: boolean
+    role: string | null
+  }[]
+}
+
+export interface MatchFull {
+  match: Match
+  venue: Venue | null
+  score: Score
+  history: any[]
+  lineups: LineupDetail[]
+}
+
+export interface DashboardSummary {
+  role: string
+  counts: Record<string, number>
+  matches_by_status: Record<string, number>
+  upcoming_matches: Match[]
+  live_matches: Match[]
+  unread_notifications: number
+  teams: Team[]
+  generated_at: string
+}
+
+export interface BracketSide {
+  team_id: number | null
+  team_name: string | null
+  player_id: number | null
+  score: number | null
+}
+
+export interface BracketMatch {
+  id: number
+  match_number: string | null
+  bracket_position: number | null
+  status: Match['status']
+  scheduled_time: string
+  home: BracketSide
+  away: BracketSide
+  next_match_id: number | null
+  next_match_slot: 'home' | 'away' | null
+}
+
+export interface Bracket {
+  schedule_id: number
+  rounds: { round_number: number; name: string; matches: BracketMatch[] }[]
+}
+
+export interface StandingRow {
+  position: number
+  team_id: number | null
+  player_id: number | null
+  name: string | null
+  played: number
+  won: number
+  drawn: number
+  lost: number
+  score_for: number
+  score_against: number
+  score_difference: number
+  points: number
+}
+
+export interface ScheduleStandings {
+  schedule_id: number
+  sport_id: number
+  tie_breakers: string[]
+  groups: { group_number: number | null; rows: StandingRow[] }[]
+}
+
+export interface TournamentStandings {
+  tournament_id: number
+  sport_id: number
+  tie_breakers: string[]
+  rows: StandingRow[]
+}
+
+export interface BatchItem {
+  path: string
+  method?: 'GET'
+  id?: string
+}
+
+export interface BatchItemResponse<T = unknown> {
+  id: string | null
+  status: number
+  body: T
+}
+
+export interface SyncResponse {
+  token: string
+  full: boolean
+  changes: Record<string, Record<string, unknown>[]>
+  deleted: Record<string, number[]>
+}
+
 export interface Tournament {
   id: number
   name: string
@@ -119,6 +232,27 @@ export interface Tournament {
   created_at: string
 }
 
+export interface ConflictMatch {
+  match_id: number
+  sport_id: number
+  start: string
+  end: string
+}
+
+export interface PlayerConflict {
+  player_id: number
+  player_name: string | null
+  first: ConflictMatch
+  second: ConflictMatch
+}
+
+export interface TournamentConflicts {
+  tournament_id: number
+  match_count: number
+  player_count: number
+  conflicts: PlayerConflict[]
+}
+
 export interface Venue {
   id: number
   name: string
@@ -130,6 +264,33 @@ export interface Venue {
   created_at: string
 }
 
+export interface VenueAvailability {
+  venue_id: number
+  start: string
+  end: string
+  bookings: { match_id: number | null; blackout_id: number | null; start: string; end: string }[]
+  free: { start: string; end: string }[]
+}
+
+export interface VenueBlackout {
+  id: number
+  venue_id: number
+  start_time: string
+  end_time: string
+  reason: string | null
+  created_by: number
+  created_at: string
+}
+
+export interface MatchMove {
+  match_id: number
+  from_venue_id: number | null
+  from_time: string
+  venue_id: number | null
+  scheduled_time: string
+  expected_end_time: string
+}
+
 export interface Notification {
   id: number
   user_id: number
@@ -142,10 +303,73 @@ export interface Notification {
   created_at: string
 }
 
+export interface ScheduleFixture {
+  match_number: string
+  round_number: number | null
+  group_number: number | null
+  bracket_position: number | null
+  scheduled_time: string
+  expected_end_time: string
+  venue_id: number | null
+  home_id: number | null
+  away_id: number | null
+}
+
+export interface ScheduleMetrics {
+  match_count: number
+  start: string | null
+  end: string | null
+  span_days: number
+  min_rest_days: number | null
+  avg_rest_days: number | null
+  rest: { participant_id: number; matches: number; min_rest_days: number | null; avg_rest_days: number | null }[]
+  venues: { venue_id: number | null; matches: number; booked_minutes: number; utilization: number | null }[]
+}
+
+export interface OptimizationReport {
+  initial_objective: number
+  objective: number
+  iterations: number
+  accepted: number
+  trajectory: { elapsed_ms: number; iteration: number; objective: number }[]
+}
+
+export interface SchedulePreview {
+  preview_id: string
+  expires_in: number
+  fixtures: ScheduleFixture[]
+  metrics: ScheduleMetrics
+  optimization: OptimizationReport | null
+}
+
+export type JobStatus = 'queued' | 'running' | 'succeeded' | 'failed'
+
+export interface Job {
+  id: string
+  kind: string
+  status: JobStatus
+  done: number
+  total: number
+  schedules: {
+    name: string
+    sport_id: number
+    status: JobStatus
+    schedule_id: number | null
+    match_count: number
+    error: string | null
+  }[]
+  result: Record<string, any> | null
+  error: string | null
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+}
+
 export interface Schedule {
   id: number
   name: string
-  schedule_type: 'round_robin' | 'knockout' | 'league' | 'custom'
+  schedule_type: 'round_robin' | 'knockout' | 'league' | 'swiss' | 'group_knockout' | 'custom'
+  rounds: number | null
   start_date: string
   end_date: string | null
   description: string | null